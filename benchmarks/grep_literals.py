@@ -0,0 +1,112 @@
+"""
+Сравнение поиска множества фиксированных строк (grep -f)
+альтернативой в байтовом regex и автоматом Ахо-Корасик.
+
+Запуск: python -m benchmarks.grep_literals [размер текста в МБ]
+
+Для каждого количества строк с учётом и без учёта регистра
+замеряется полный проход по тексту без совпадений. По этим замерам
+выбраны пороги LITERAL_AUTOMATON_THRESHOLD и
+LITERAL_AUTOMATON_THRESHOLD_IGNORE_CASE, начиная с которых
+SearchEngine переходит на автомат: время альтернативы растёт
+с количеством строк, а время автомата почти не зависит от него
+"""
+
+import random
+import re
+import string
+import sys
+import time
+
+from src.grep.engine import (
+    LITERAL_AUTOMATON_THRESHOLD,
+    LITERAL_AUTOMATON_THRESHOLD_IGNORE_CASE,
+)
+from src.grep.matchers import AhoCorasickMatcher, RegexMatcher
+
+DEFAULT_MEGABYTES = 4
+PATTERN_COUNTS = (2, 4, 8, 12, 16, 24, 32, 48, 64, 128)
+PATTERN_LENGTH = 12
+
+
+def make_text(size: int) -> bytes:
+    """
+    Создаёт текст из строк случайных слов
+    :param size: Размер текста в байтах
+    :return: Текст в байтах
+    """
+    generator = random.Random(0)
+    words = [
+        "".join(generator.choices(string.ascii_lowercase, k=length))
+        for length in range(3, 10)
+        for _ in range(200)
+    ]
+    lines = []
+    total = 0
+    while total < size:
+        line = " ".join(generator.choices(words, k=10))
+        lines.append(line)
+        total += len(line) + 1
+
+    return "\n".join(lines).encode()
+
+
+def make_literals(count: int) -> list[bytes]:
+    """
+    Создаёт строки, которых нет в тексте
+    :param count: Количество строк
+    :return: Строки в байтах
+    """
+    generator = random.Random(count)
+    return [
+        "".join(
+            generator.choices(string.ascii_lowercase, k=PATTERN_LENGTH)
+        ).encode()
+        for _ in range(count)
+    ]
+
+
+def timed(matcher: RegexMatcher | AhoCorasickMatcher, text: bytes) -> float:
+    """
+    Замеряет полный проход поиска по тексту
+    :param matcher: Способ поиска
+    :param text: Текст
+    :return: Время в секундах
+    """
+    start = time.perf_counter()
+    matcher.search(text, 0, len(text))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """
+    Печатает время обоих способов для разного количества строк
+    """
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_MEGABYTES
+    text = make_text(int(megabytes * 1_000_000))
+
+    print(
+        f"Порог автомата: {LITERAL_AUTOMATON_THRESHOLD} строк, "
+        f"без учёта регистра — {LITERAL_AUTOMATON_THRESHOLD_IGNORE_CASE}"
+    )
+    for ignore_case in (False, True):
+        flags = re.IGNORECASE if ignore_case else 0
+        for count in PATTERN_COUNTS:
+            literals = make_literals(count)
+            alternation = RegexMatcher(
+                re.compile(
+                    b"|".join(re.escape(literal) for literal in literals),
+                    flags,
+                )
+            )
+            automaton = AhoCorasickMatcher(literals, ignore_case)
+
+            print(
+                f"{'-i ' if ignore_case else ''}строк {count}: "
+                f"regex {timed(alternation, text):.3f} с, "
+                f"автомат {timed(automaton, text):.3f} с"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Сравнение времени простого и подробного вывода ls.
+
+Запуск: python -m benchmarks.ls_format [количество файлов]
+
+Отдельно замеряется форматирование полей stat: прежнее
+(stat.filemode и datetime.strftime на каждую запись)
+и через StatFormatter с кэшем по минутам и значениям st_mode
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import stat
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime
+
+from benchmarks.ls_stat_calls import make_tree
+from src.filesystem.ls import Ls
+from src.utils.stat_format import StatFormatter
+
+DEFAULT_FILES = 100000
+
+
+def legacy_format(stats: list[os.stat_result]) -> None:
+    """
+    Прежнее форматирование прав и времени для каждой записи
+    :param stats: Результаты stat записей
+    """
+    for item in stats:
+        stat.filemode(item.st_mode)
+        datetime.fromtimestamp(item.st_mtime).strftime("%Y-%m-%d %H:%M")
+
+
+def cached_format(stats: list[os.stat_result]) -> None:
+    """
+    Форматирование прав и времени через StatFormatter
+    :param stats: Результаты stat записей
+    """
+    formatter = StatFormatter()
+    for item in stats:
+        formatter.format_mode(item.st_mode)
+        formatter.format_time(item.st_mtime_ns)
+
+
+def run_ls(abs_path: str, detailed: bool) -> None:
+    """
+    Выполняет ls для директории
+    :param abs_path: Путь к директории
+    :param detailed: Подробный вывод
+    """
+    tokens = argparse.Namespace(
+        paths=[abs_path], l=detailed, al=False, all=False
+    )
+    Ls().execute(tokens)
+
+
+def timed(function: Callable[[], None]) -> float:
+    """
+    Замеряет время вызова с подавленным выводом
+    :param function: Замеряемая функция
+    :return: Время в секундах
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        function()
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    """
+    Создаёт тестовую директорию и печатает результаты замера
+    """
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_FILES
+    with tempfile.TemporaryDirectory() as root:
+        make_tree(root, files)
+        with os.scandir(root) as iterator:
+            stats = [entry.stat() for entry in iterator]
+
+        results = {
+            "legacy_format": timed(lambda: legacy_format(stats)),
+            "cached_format": timed(lambda: cached_format(stats)),
+            "ls": timed(lambda: run_ls(root, False)),
+            "ls -l": timed(lambda: run_ls(root, True)),
+        }
+
+    for name, elapsed in results.items():
+        print(f"{name}: записей {files}, время {elapsed:.3f} с")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""
+Сравнение количества stat-вызовов старого и нового ls -l.
+
+Запуск: python -m benchmarks.ls_stat_calls [количество файлов]
+
+Если в системе есть strace, считаются настоящие системные вызовы
+семейства stat, иначе — вызовы stat на уровне Python:
+os.stat в старой реализации и первые DirEntry.stat в новой
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import stat
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Any
+
+from src.filesystem.ls import Ls
+
+DEFAULT_FILES = 20000
+
+
+def make_tree(root: str, files: int) -> None:
+    """
+    Создаёт директорию с файлами и поддиректориями для замера
+    :param root: Путь к директории
+    :param files: Количество записей
+    """
+    for index in range(files):
+        if index % 10 == 0:
+            os.mkdir(os.path.join(root, f"dir_{index:07}"))
+        else:
+            with open(os.path.join(root, f"file_{index:07}.txt"), "w"):
+                pass
+
+
+def legacy_ls(abs_path: str) -> None:
+    """
+    Прежняя реализация ls -l: os.listdir, затем os.stat
+    и os.path.isdir для каждой записи
+    :param abs_path: Путь к директории
+    """
+    for item in sorted(os.listdir(abs_path)):
+        item_path = os.path.join(abs_path, item)
+        stats = os.stat(item_path)
+        mode = stat.filemode(stats.st_mode)
+        mtime = datetime.fromtimestamp(stats.st_mtime)
+        mtime_str = mtime.strftime("%Y-%m-%d %H:%M")
+        if item[0] != ".":
+            kind = "d" if os.path.isdir(item_path) else "-"
+            print(f"{mode} {stats.st_size:>10} {mtime_str} {kind} {item}")
+
+
+def current_ls(abs_path: str) -> None:
+    """
+    Текущая реализация ls -l
+    :param abs_path: Путь к директории
+    """
+    tokens = argparse.Namespace(paths=[abs_path], l=True, al=False, all=False)
+    Ls().execute(tokens)
+
+
+class CountingEntry:
+    """
+    Обёртка над DirEntry, считающая stat, которые доходят до системы
+    """
+
+    calls = 0
+
+    def __init__(self, entry: os.DirEntry) -> None:
+        """
+        :param entry: Исходная запись директории
+        """
+        self._entry = entry
+        self._stat: os.stat_result | None = None
+        self.name = entry.name
+        self.path = entry.path
+
+    def stat(self, follow_symlinks: bool = True) -> os.stat_result:
+        """
+        :return: Результат stat записи
+        """
+        if self._stat is None:
+            CountingEntry.calls += 1
+            self._stat = self._entry.stat(follow_symlinks=follow_symlinks)
+        return self._stat
+
+    def is_dir(self, follow_symlinks: bool = True) -> bool:
+        """
+        :return: True, если запись — директория
+        """
+        return self._entry.is_dir(follow_symlinks=follow_symlinks)
+
+
+@contextlib.contextmanager
+def count_python_stats() -> Iterator[list[int]]:
+    """
+    Подменяет os.stat и os.scandir счётчиками вызовов
+    :return: Список из одного счётчика, заполняемый при выходе
+    """
+    counter = [0]
+    original_stat = os.stat
+    original_scandir = os.scandir
+
+    def counting_stat(path: str, *args: Any, **kwargs: Any) -> os.stat_result:
+        counter[0] += 1
+        return original_stat(path, *args, **kwargs)
+
+    @contextlib.contextmanager
+    def counting_scandir(path: str) -> Iterator[Iterator[CountingEntry]]:
+        with original_scandir(path) as iterator:
+            yield (CountingEntry(entry) for entry in iterator)
+
+    CountingEntry.calls = 0
+    os.stat = counting_stat  # type: ignore[assignment]
+    os.scandir = counting_scandir  # type: ignore[assignment]
+    try:
+        yield counter
+    finally:
+        os.stat = original_stat
+        os.scandir = original_scandir
+        counter[0] += CountingEntry.calls
+
+
+def strace_stats(function: str, abs_path: str) -> int | None:
+    """
+    Считает системные вызовы семейства stat через strace
+    :param function: Имя функции этого модуля
+    :param abs_path: Путь к директории
+    :return: Количество вызовов или None, если strace недоступен
+    """
+    if shutil.which("strace") is None:
+        return None
+
+    code = (
+        "import io, sys;"
+        f"from benchmarks.ls_stat_calls import {function};"
+        "sys.stdout = io.StringIO();"
+        f"{function}({abs_path!r})"
+    )
+    result = subprocess.run(
+        [
+            "strace",
+            "-f",
+            "-c",
+            "-e",
+            "trace=%stat",
+            sys.executable,
+            "-c",
+            code,
+        ],
+        capture_output=True,
+        text=True,
+    )
+    total = [
+        line.split() for line in result.stderr.splitlines() if "total" in line
+    ]
+    return int(total[-1][2]) if total else None
+
+
+def measure(function_name: str, abs_path: str) -> tuple[int, float, str]:
+    """
+    Замеряет время и количество stat одной реализации
+    :param function_name: Имя функции этого модуля
+    :param abs_path: Путь к директории
+    :return: Количество вызовов, время в секундах и способ подсчёта
+    """
+    function = globals()[function_name]
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        function(abs_path)
+        elapsed = time.perf_counter() - start
+
+        with count_python_stats() as counter:
+            function(abs_path)
+
+    syscalls = strace_stats(function_name, abs_path)
+    if syscalls is not None:
+        return syscalls, elapsed, "strace"
+
+    return counter[0], elapsed, "python"
+
+
+def main() -> None:
+    """
+    Создаёт тестовую директорию и печатает результаты замера
+    """
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_FILES
+    with tempfile.TemporaryDirectory() as root:
+        make_tree(root, files)
+        for name in ("legacy_ls", "current_ls"):
+            calls, elapsed, method = measure(name, root)
+            print(
+                f"{name}: записей {files}, stat-вызовов {calls} ({method}), "
+                f"время {elapsed:.3f} с"
+            )
+
+
+if __name__ == "__main__":
+    main()
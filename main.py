@@ -3,8 +3,9 @@ import shlex
 import sys
 
 from src.archive import tar, untar, unzip, zip
-from src.filesystem import cat, cd, cp, ls, mkdir, mv, rm, touch
-from src.grep import grep
+from src.filesystem import cache, cat, cd, cp, du, ls, mkdir, mv, rm, touch
+from src.find import find, locate, updatedb
+from src.grep import grep, index
 from src.history import history, undo
 from src.utils.errors import ShellError
 from src.utils.logger import Logger
@@ -29,6 +30,7 @@ class Terminal:
             "cd": cd.Cd().execute,
             "cp": cp.Cp().execute,
             "ls": ls.Ls().execute,
+            "du": du.Du().execute,
             "rm": rm.Rm().execute,
             "mv": mv.Mv().execute,
             "history": history.History().execute,
@@ -38,6 +40,11 @@ class Terminal:
             "tar": tar.Tar().execute,
             "untar": untar.Untar().execute,
             "grep": grep.Grep().execute,
+            "find": find.Find().execute,
+            "updatedb": updatedb.Updatedb().execute,
+            "locate": locate.Locate().execute,
+            "index": index.Index().execute,
+            "cache": cache.Cache().execute,
             "mkdir": mkdir.Mkdir().execute,
             "touch": touch.Touch().execute,
         }
@@ -5,6 +5,7 @@ import tarfile
 from src.filesystem.base_command import (
     BaseClass,
 )
+from src.utils.progress import Progress
 
 
 class Tar(BaseClass):
@@ -43,10 +44,19 @@ class Tar(BaseClass):
         self, folder_tar: str, archive_path: str, archive_name: str
     ) -> None:
         """
-        Создаёт tar.gz архив
+        Создаёт tar.gz архив. Объём и скорость архивации
+        записываются в лог
         :param folder_tar: Абсолютный путь к директории для архивации
         :param archive_path: Абсолютный путь к создаваемому архиву
         :param archive_name: Имя архива внутри tar
         """
-        with tarfile.open(archive_path, "w:gz") as tar:
-            tar.add(folder_tar, arcname=archive_name)
+        with Progress("tar") as progress:
+            progress.estimate_tree(folder_tar)
+
+            def count(member: tarfile.TarInfo) -> tarfile.TarInfo:
+                if member.isfile():
+                    progress.advance(member.size, 1)
+                return member
+
+            with tarfile.open(archive_path, "w:gz") as tar:
+                tar.add(folder_tar, arcname=archive_name, filter=count)
@@ -3,6 +3,7 @@ import os
 import zipfile
 
 from src.filesystem.base_command import BaseClass
+from src.utils.progress import Progress
 
 
 class Zip(BaseClass):
@@ -36,15 +37,19 @@ class Zip(BaseClass):
 
     def _zip(self, folder_zip: str, archive_path: str) -> None:
         """
-        Создаёт zip архив
+        Создаёт zip архив. Объём и скорость архивации
+        записываются в лог
         :param folder_zip: Абсолютный путь к директории для архивации
         :param archive_path: Абсолютный путь к создаваемому архиву
         """
-        with zipfile.ZipFile(
-            archive_path, "w", zipfile.ZIP_DEFLATED
-        ) as zip_file:
-            for root, _, files in os.walk(folder_zip):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    arcname = os.path.relpath(file_path, folder_zip)
-                    zip_file.write(file_path, arcname)
+        with Progress("zip") as progress:
+            progress.estimate_tree(folder_zip)
+            with zipfile.ZipFile(
+                archive_path, "w", zipfile.ZIP_DEFLATED
+            ) as zip_file:
+                for root, _, files in os.walk(folder_zip):
+                    for file in files:
+                        file_path = os.path.join(root, file)
+                        arcname = os.path.relpath(file_path, folder_zip)
+                        zip_file.write(file_path, arcname)
+                        progress.advance(zip_file.infolist()[-1].file_size, 1)
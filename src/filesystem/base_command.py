@@ -2,13 +2,16 @@ import argparse
 import logging
 import os
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
 
+from src.utils.dir_cache import DirectoryEntry, directory_cache
 from src.utils.errors import (
     InvalidPathError,
     NotADirectoryError,
     NotAFileError,
     PathNotFoundError,
 )
+from src.utils.path_filter import PathFilter
 
 
 class BaseClass(ABC):
@@ -60,7 +63,9 @@ class BaseClass(ABC):
         :raises PathNotFoundError: Если путь не существует
         """
         self._correct_path(path)
-        if not os.path.exists(path):
+        known, entry = directory_cache.lookup(path)
+        exists = os.path.exists(path) if not known else entry is not None
+        if not exists:
             raise PathNotFoundError(
                 f"Файл или директория не найдены: {path}"
             ) from None
@@ -71,7 +76,12 @@ class BaseClass(ABC):
         :param path: Путь для проверки
         :raises NotAFileError: Если путь не является файлом
         """
-        if not os.path.isfile(path):
+        known, entry = directory_cache.lookup(path)
+        if not known:
+            is_file = os.path.isfile(path)
+        else:
+            is_file = entry is not None and entry.is_file()
+        if not is_file:
             raise NotAFileError(f"Не является файлом: {path}") from None
 
     def _is_directory(self, path: str) -> None:
@@ -80,7 +90,12 @@ class BaseClass(ABC):
         :param path: Путь для проверки
         :raises NotADirectoryError: Если путь не является директорией
         """
-        if not os.path.isdir(path):
+        known, entry = directory_cache.lookup(path)
+        if not known:
+            is_directory = os.path.isdir(path)
+        else:
+            is_directory = entry is not None and entry.is_dir()
+        if not is_directory:
             raise NotADirectoryError(
                 f"Не является директорией: {path}"
             ) from None
@@ -95,3 +110,54 @@ class BaseClass(ABC):
             message = "Отсутствует путь файла"
             logging.error(message)
             raise PathNotFoundError(message) from None
+
+    def _walk_tree(
+        self,
+        root: str,
+        on_error: Callable[[OSError], None] | None = None,
+        path_filter: PathFilter | None = None,
+    ) -> Iterator[DirectoryEntry]:
+        """
+        Обходит дерево директорий в глубину через общий кэш директорий.
+        Содержимое каждой директории сортируется по имени,
+        символические ссылки на директории не раскрываются.
+        Директории, отброшенные фильтром, не читаются
+        :param root: Корневая директория обхода
+        :param on_error: Обработчик ошибок чтения директорий.
+            Если задан, недоступные директории пропускаются
+        :param path_filter: Фильтр файлов и директорий
+        :return: Итератор записей о файлах дерева
+        :raises OSError: Если директорию невозможно прочитать
+            и обработчик не задан
+        """
+        stack = [(root, "")]
+        while stack:
+            directory, prefix = stack.pop()
+            try:
+                entries = sorted(
+                    directory_cache.scandir(directory),
+                    key=lambda entry: entry.name,
+                )
+            except OSError as error:
+                if on_error is None:
+                    raise
+                on_error(error)
+                continue
+
+            subdirectories = []
+            for entry in entries:
+                relative_path = f"{prefix}{entry.name}"
+                if entry.is_dir(follow_symlinks=False):
+                    if path_filter is None or path_filter.accepts_directory(
+                        entry.name, relative_path
+                    ):
+                        subdirectories.append(
+                            (entry.path, f"{relative_path}/")
+                        )
+                elif entry.is_file():
+                    if path_filter is None or path_filter.accepts_file(
+                        entry.name, relative_path
+                    ):
+                        yield entry
+
+            stack.extend(reversed(subdirectories))
@@ -0,0 +1,27 @@
+import argparse
+
+from src.filesystem.base_command import BaseClass
+from src.utils.dir_cache import directory_cache
+
+
+class Cache(BaseClass):
+    """
+    Класс для управления общим кэшем директорий
+    """
+
+    def execute(self, tokens: argparse.Namespace) -> None:
+        """
+        Очищает кэш директорий или выводит его состояние
+        :param tokens: Аргументы команды (действие clear или stats)
+        """
+        if tokens.action == "clear":
+            directory_cache.clear()
+            print("Кэш директорий очищен")
+            return
+
+        stats = directory_cache.stats()
+        print(
+            f"Директорий: {stats['directories']}, "
+            f"записей: {stats['entries']} из {stats['max_entries']}, "
+            f"попаданий: {stats['hits']}, промахов: {stats['misses']}"
+        )
@@ -0,0 +1,424 @@
+import errno
+import fcntl
+import io
+import os
+import shutil
+import stat
+from collections.abc import Callable
+
+FICLONE = 0x40049409
+COPY_RANGE_CHUNK_SIZE = 1 << 30
+COPY_BUFFER_SIZE = 1 << 20
+MIN_COPY_BUFFER_SIZE = 64 * 1024
+DELTA_BLOCK_SIZE = 128 * 1024
+UNSUPPORTED_ERRORS = frozenset(
+    (
+        errno.ENOSYS,
+        errno.EXDEV,
+        errno.EINVAL,
+        errno.EOPNOTSUPP,
+        errno.ENOTTY,
+        errno.EBADF,
+    )
+)
+
+METHOD_REFLINK = "reflink"
+METHOD_COPY_FILE_RANGE = "copy_file_range"
+METHOD_SENDFILE = "sendfile"
+METHOD_READINTO = "readinto"
+
+
+class CopyEngine:
+    """
+    Копирование содержимого файлов без лишних проходов через
+    пользовательскую память. Способы пробуются по порядку:
+    reflink (FICLONE) на файловых системах с копированием при записи,
+    copy_file_range, sendfile и цикл readinto с большим буфером.
+    Если способ не поддерживается для пары устройств, это запоминается,
+    и для следующих файлов он не пробуется
+    """
+
+    def __init__(self) -> None:
+        """
+        Инициализация пустого набора неподдерживаемых способов
+        """
+        self._unsupported: set[tuple[str, int, int]] = set()
+
+    def copy(self, source: str, destination: str) -> str:
+        """
+        Копирует содержимое и права доступа файла, как shutil.copy
+        :param source: Путь к исходному файлу
+        :param destination: Путь к файлу или директории назначения
+        :return: Путь к созданному файлу
+        :raises OSError: При ошибке копирования
+        """
+        if os.path.isdir(destination):
+            destination = os.path.join(destination, os.path.basename(source))
+
+        self.copy_file(source, destination)
+        return destination
+
+    def copy2(self, source: str, destination: str) -> str:
+        """
+        Копирует файл вместе со временем изменения и остальными
+        метаданными, как shutil.copy2. Подходит для copy_function
+        в shutil.copytree
+        :param source: Путь к исходному файлу
+        :param destination: Путь к файлу или директории назначения
+        :return: Путь к созданному файлу
+        :raises OSError: При ошибке копирования
+        """
+        destination = self.copy(source, destination)
+        shutil.copystat(source, destination)
+        return destination
+
+    def copy_file(self, source: str, destination: str) -> str:
+        """
+        Копирует содержимое файла и его права доступа
+        :param source: Путь к исходному файлу
+        :param destination: Путь к файлу назначения
+        :return: Способ, которым скопированы первые байты
+        :raises shutil.SameFileError: Если источник и назначение
+            совпадают
+        :raises OSError: При ошибке копирования
+        """
+        with open(source, "rb", buffering=0) as source_file:
+            source_stats = os.fstat(source_file.fileno())
+            self.check_same_file(source, source_stats, destination)
+
+            with open(destination, "wb", buffering=0) as destination_file:
+                method = self._copy_data(
+                    source_file,
+                    destination_file,
+                    source_stats,
+                )
+                os.fchmod(
+                    destination_file.fileno(),
+                    stat.S_IMODE(source_stats.st_mode),
+                )
+
+        return method
+
+    def same_content(self, source: str, destination: str) -> bool:
+        """
+        Сравнивает содержимое двух файлов блоками до первого отличия
+        :param source: Путь к исходному файлу
+        :param destination: Путь к файлу назначения
+        :return: True, если содержимое совпадает
+        :raises OSError: При ошибке чтения
+        """
+        with open(source, "rb") as source_file:
+            with open(destination, "rb") as destination_file:
+                while True:
+                    block = source_file.read(DELTA_BLOCK_SIZE)
+                    if block != destination_file.read(DELTA_BLOCK_SIZE):
+                        return False
+                    if not block:
+                        return True
+
+    def copy_delta(
+        self,
+        source: str,
+        destination: str,
+        progress: Callable[[int], None] | None = None,
+    ) -> int:
+        """
+        Обновляет существующий файл на месте: блоки назначения
+        сравниваются с блоками источника, и перезаписываются только
+        отличающиеся, после чего файл обрезается до размера источника.
+        Чтение обоих файлов обычно дешевле записи, а неизменённые
+        блоки на файловых системах с копированием при записи
+        и в снимках остаются общими
+        :param source: Путь к исходному файлу
+        :param destination: Путь к существующему файлу назначения
+        :param progress: Вызывается после каждого блока с количеством
+            проверенных байт
+        :return: Количество перезаписанных байт
+        :raises shutil.SameFileError: Если источник и назначение
+            совпадают
+        :raises OSError: При ошибке чтения или записи
+        """
+        with open(source, "rb") as source_file:
+            source_stats = os.fstat(source_file.fileno())
+            self.check_same_file(source, source_stats, destination)
+
+            rewritten = 0
+            offset = 0
+            with open(destination, "r+b") as destination_file:
+                while block := source_file.read(DELTA_BLOCK_SIZE):
+                    if destination_file.read(len(block)) != block:
+                        destination_file.seek(offset)
+                        destination_file.write(block)
+                        rewritten += len(block)
+                    offset += len(block)
+                    destination_file.seek(offset)
+                    if progress is not None:
+                        progress(len(block))
+
+                destination_file.truncate(offset)
+                os.fchmod(
+                    destination_file.fileno(),
+                    stat.S_IMODE(source_stats.st_mode),
+                )
+
+        return rewritten
+
+    def check_same_file(
+        self, source: str, source_stats: os.stat_result, destination: str
+    ) -> None:
+        """
+        Проверяет, что назначение не является самим источником,
+        иначе открытие на запись обнулило бы исходный файл
+        :param source: Путь к исходному файлу
+        :param source_stats: Результат stat источника
+        :param destination: Путь к файлу назначения
+        :raises shutil.SameFileError: Если это один и тот же файл
+        """
+        try:
+            destination_stats = os.stat(destination)
+        except OSError:
+            return
+
+        if (destination_stats.st_dev, destination_stats.st_ino) == (
+            source_stats.st_dev,
+            source_stats.st_ino,
+        ):
+            raise shutil.SameFileError(
+                f"{source} и {destination} — один и тот же файл"
+            )
+
+    def _copy_data(
+        self,
+        source_file: io.FileIO,
+        destination_file: io.FileIO,
+        source_stats: os.stat_result,
+    ) -> str:
+        """
+        Копирует данные между открытыми файлами, переходя к следующему
+        способу с той позиции, на которой остановился предыдущий
+        :param source_file: Исходный файл, открытый без буферизации
+        :param destination_file: Файл назначения, открытый
+            без буферизации
+        :param source_stats: Результат stat источника
+        :return: Способ, которым скопированы первые байты
+        :raises OSError: При ошибке чтения или записи
+        """
+        source_fd = source_file.fileno()
+        destination_fd = destination_file.fileno()
+        size = source_stats.st_size
+        devices = (
+            source_stats.st_dev,
+            os.fstat(destination_fd).st_dev,
+        )
+
+        if size > 0 and self._try_reflink(source_fd, destination_fd, devices):
+            return METHOD_REFLINK
+
+        copied, method = self._copy_range(
+            source_fd, destination_fd, devices, 0, size
+        )
+        if copied < size or size == 0:
+            self._read_loop(source_file, destination_file, copied, size)
+
+        return method
+
+    def clone(
+        self, source_file: io.FileIO, destination_file: io.FileIO
+    ) -> bool:
+        """
+        Пытается склонировать весь файл через reflink
+        :param source_file: Исходный файл, открытый без буферизации
+        :param destination_file: Файл назначения, открытый
+            без буферизации
+        :return: True, если файл склонирован
+        :raises OSError: При ошибке, не связанной с поддержкой reflink
+        """
+        devices = (
+            os.fstat(source_file.fileno()).st_dev,
+            os.fstat(destination_file.fileno()).st_dev,
+        )
+        return self._try_reflink(
+            source_file.fileno(), destination_file.fileno(), devices
+        )
+
+    def copy_part(
+        self,
+        source_file: io.FileIO,
+        destination_file: io.FileIO,
+        offset: int,
+        end: int,
+    ) -> None:
+        """
+        Копирует диапазон байт на те же позиции в файле назначения
+        :param source_file: Исходный файл, открытый без буферизации
+        :param destination_file: Файл назначения, открытый
+            без буферизации
+        :param offset: Начало диапазона
+        :param end: Конец диапазона (не включительно)
+        :raises OSError: При ошибке чтения или записи
+        """
+        devices = (
+            os.fstat(source_file.fileno()).st_dev,
+            os.fstat(destination_file.fileno()).st_dev,
+        )
+        copied, _ = self._copy_range(
+            source_file.fileno(),
+            destination_file.fileno(),
+            devices,
+            offset,
+            end,
+        )
+        if copied < end:
+            self._read_loop(source_file, destination_file, copied, end, end)
+
+    def _copy_range(
+        self,
+        source_fd: int,
+        destination_fd: int,
+        devices: tuple[int, int],
+        offset: int,
+        end: int,
+    ) -> tuple[int, str]:
+        """
+        Копирует диапазон внутри ядра через copy_file_range или sendfile
+        :param source_fd: Дескриптор исходного файла
+        :param destination_fd: Дескриптор файла назначения
+        :param devices: Устройства источника и назначения
+        :param offset: Начало диапазона
+        :param end: Конец диапазона (не включительно)
+        :return: Позиция, на которой копирование остановилось,
+            и способ, которым скопированы первые байты
+        :raises OSError: При ошибке, не связанной с поддержкой способа
+        """
+        copied = offset
+        method = METHOD_READINTO
+        for name, copy_range in (
+            (METHOD_COPY_FILE_RANGE, self._copy_file_range),
+            (METHOD_SENDFILE, self._sendfile),
+        ):
+            if copied >= end or (name, *devices) in self._unsupported:
+                continue
+
+            try:
+                done = copy_range(source_fd, destination_fd, copied, end)
+            except OSError as error:
+                if error.errno not in UNSUPPORTED_ERRORS:
+                    raise
+                self._unsupported.add((name, *devices))
+                continue
+
+            if copied == offset and done > offset:
+                method = name
+            copied = done
+
+        return copied, method
+
+    def _try_reflink(
+        self,
+        source_fd: int,
+        destination_fd: int,
+        devices: tuple[int, int],
+    ) -> bool:
+        """
+        Пытается разделить блоки файла без копирования данных
+        :param source_fd: Дескриптор исходного файла
+        :param destination_fd: Дескриптор файла назначения
+        :param devices: Устройства источника и назначения
+        :return: True, если файл склонирован
+        :raises OSError: При ошибке, не связанной с поддержкой reflink
+        """
+        key = (METHOD_REFLINK, *devices)
+        if key in self._unsupported:
+            return False
+
+        try:
+            fcntl.ioctl(destination_fd, FICLONE, source_fd)
+        except OSError as error:
+            if error.errno not in UNSUPPORTED_ERRORS:
+                raise
+            self._unsupported.add(key)
+            return False
+
+        return True
+
+    def _copy_file_range(
+        self, source_fd: int, destination_fd: int, offset: int, size: int
+    ) -> int:
+        """
+        Копирует данные внутри ядра через copy_file_range
+        :param source_fd: Дескриптор исходного файла
+        :param destination_fd: Дескриптор файла назначения
+        :param offset: Позиция, с которой начинается копирование
+        :param size: Размер исходного файла
+        :return: Позиция, на которой копирование остановилось
+        :raises OSError: При ошибке копирования
+        """
+        while offset < size:
+            count = min(size - offset, COPY_RANGE_CHUNK_SIZE)
+            copied = os.copy_file_range(
+                source_fd, destination_fd, count, offset, offset
+            )
+            if copied == 0:
+                break
+            offset += copied
+
+        return offset
+
+    def _sendfile(
+        self, source_fd: int, destination_fd: int, offset: int, size: int
+    ) -> int:
+        """
+        Копирует данные внутри ядра через sendfile
+        :param source_fd: Дескриптор исходного файла
+        :param destination_fd: Дескриптор файла назначения
+        :param offset: Позиция, с которой начинается копирование
+        :param size: Размер исходного файла
+        :return: Позиция, на которой копирование остановилось
+        :raises OSError: При ошибке копирования
+        """
+        os.lseek(destination_fd, offset, os.SEEK_SET)
+        while offset < size:
+            count = min(size - offset, COPY_RANGE_CHUNK_SIZE)
+            sent = os.sendfile(destination_fd, source_fd, offset, count)
+            if sent == 0:
+                break
+            offset += sent
+
+        return offset
+
+    def _read_loop(
+        self,
+        source_file: io.FileIO,
+        destination_file: io.FileIO,
+        offset: int,
+        size: int,
+        end: int | None = None,
+    ) -> None:
+        """
+        Копирует остаток файла через readinto в один буфер.
+        Без end файл читается до конца, даже если он вырос после stat
+        :param source_file: Исходный файл, открытый без буферизации
+        :param destination_file: Файл назначения, открытый
+            без буферизации
+        :param offset: Позиция, с которой начинается копирование
+        :param size: Размер исходного файла
+        :param end: Позиция, на которой копирование заканчивается
+        :raises OSError: При ошибке чтения или записи
+        """
+        source_file.seek(offset)
+        destination_file.seek(offset)
+        buffer = bytearray(
+            min(COPY_BUFFER_SIZE, max(size - offset, MIN_COPY_BUFFER_SIZE))
+        )
+        view = memoryview(buffer)
+
+        while end is None or offset < end:
+            count = len(view) if end is None else min(len(view), end - offset)
+            read = source_file.readinto(view[:count])
+            if not read:
+                break
+            offset += read
+            chunk = view[:read]
+            while chunk:
+                written = destination_file.write(chunk)
+                chunk = chunk[written:]
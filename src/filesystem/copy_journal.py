@@ -0,0 +1,76 @@
+import json
+import os
+
+CopyCheckpoint = tuple[str, int, int, int]
+
+
+class CopyJournal:
+    """
+    Журнал незавершённых копирований для cp --resume.
+    Для файла назначения хранятся путь к источнику, его размер
+    и время изменения на момент начала копирования и позиция,
+    до которой данные временного файла уже сброшены на диск
+    """
+
+    def __init__(self, journal_path: str) -> None:
+        """
+        Инициализация пустого журнала
+        :param journal_path: Путь к файлу журнала на диске
+        """
+        self.journal_path = journal_path
+        self._entries: dict[str, CopyCheckpoint] = {}
+
+    def load(self) -> None:
+        """
+        Загружает журнал с диска. Повреждённый журнал не считается
+        ошибкой: копирование просто начнётся заново
+        """
+        entries: dict[str, CopyCheckpoint] = {}
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            for destination, source, size, mtime_ns, offset in data["entries"]:
+                entries[destination] = (source, size, mtime_ns, offset)
+        except (OSError, ValueError, TypeError, KeyError):
+            return
+
+        self._entries = entries
+
+    def save(self) -> None:
+        """
+        Атомарно сохраняет журнал на диск
+        """
+        entries = [
+            [destination, *checkpoint]
+            for destination, checkpoint in self._entries.items()
+        ]
+
+        temp_path = f"{self.journal_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump({"entries": entries}, file, ensure_ascii=False)
+        os.replace(temp_path, self.journal_path)
+
+    def get(self, destination: str) -> CopyCheckpoint | None:
+        """
+        :param destination: Абсолютный путь к файлу назначения
+        :return: Сохранённый прогресс или None
+        """
+        return self._entries.get(destination)
+
+    def put(self, destination: str, checkpoint: CopyCheckpoint) -> None:
+        """
+        Записывает прогресс копирования и сохраняет журнал
+        :param destination: Абсолютный путь к файлу назначения
+        :param checkpoint: Источник, его размер, время изменения
+            и проверенная позиция
+        """
+        self._entries[destination] = checkpoint
+        self.save()
+
+    def remove(self, destination: str) -> None:
+        """
+        Удаляет завершённое копирование и сохраняет журнал
+        :param destination: Абсолютный путь к файлу назначения
+        """
+        if self._entries.pop(destination, None) is not None:
+            self.save()
@@ -1,10 +1,24 @@
 import argparse
 import logging
 import os
+import queue
 import shutil
+import stat
+import threading
 
 from src.filesystem.base_command import BaseClass
-from src.utils.errors import PathNotFoundError
+from src.filesystem.copy_engine import CopyEngine
+from src.filesystem.copy_journal import CopyJournal
+from src.utils.errors import CopyingError, PathNotFoundError
+from src.utils.progress import Progress
+
+DEFAULT_CP_JOBS = 1
+COPY_QUEUE_FACTOR = 4
+DELTA_MIN_SIZE = 1 << 20
+CHECKPOINT_INTERVAL = 64 << 20
+PARTIAL_SUFFIX = ".cp-partial"
+
+CopyTask = tuple[str, str]
 
 
 class Cp(BaseClass):
@@ -20,11 +34,38 @@ class Cp(BaseClass):
         self.undo_history_path = os.path.join(
             os.getcwd(), "src/history/.undo_history"
         )
+        self.journal_path = os.path.join(
+            os.getcwd(), "src/history/.cp_journal"
+        )
+        self._engine = CopyEngine()
+        self._errors: list[str] = []
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._update = False
+        self._checksum = False
+        self._delta = False
+        self._copied = 0
+        self._skipped = 0
+        self._written = 0
+        self._written_files: list[CopyTask] = []
+        self._progress = Progress(self._command)
 
     def execute(self, tokens: argparse.Namespace) -> None:
         """
-        Копирует файлы или директории
+        Копирует файлы или директории. Содержимое файлов копируется
+        через reflink, copy_file_range или sendfile, где это возможно.
+        С --update файлы, совпадающие с назначением по размеру
+        и времени изменения (с --checksum — по содержимому),
+        пропускаются, с --delta в существующих больших файлах
+        перезаписываются только изменённые блоки.
+        С --resume файл копируется во временный файл рядом
+        с назначением с сохранением прогресса в журнале, и прерванное
+        копирование продолжается с последней сохранённой позиции.
+        Пока копирование идёт, выводится строка состояния, итог
+        со скоростью записывается в лог
         :param tokens: Аргументы команды (пути к файлам и директория, флаги)
+        :raises CopyingError: Если часть файлов директории не скопирована
+            или директория копируется в саму себя
         :raises ShellError: При ошибке копирования
         :raises PathNotFoundError: Если пути отсутствуют
         """
@@ -38,25 +79,413 @@ class Cp(BaseClass):
 
         self._path_exists(abs_from_path)
 
+        self._checksum = getattr(tokens, "checksum", False)
+        self._update = getattr(tokens, "update", False) or self._checksum
+        self._delta = getattr(tokens, "delta", False)
+        self._copied = 0
+        self._skipped = 0
+        self._written = 0
+        self._written_files = []
+        incremental = self._update or self._delta
+
         if directory:
             self._is_directory(abs_from_path)
+            self._is_outside(abs_from_path, abs_to_path)
 
-            shutil.copytree(
-                abs_from_path,
-                abs_to_path,
-                dirs_exist_ok=True,
-            )
-
-            self._save_undo_info(abs_to_path)
+            jobs = getattr(tokens, "jobs", DEFAULT_CP_JOBS)
+            self._progress = Progress(self._command)
+            try:
+                with self._progress:
+                    self._copy_tree(abs_from_path, abs_to_path, jobs)
+            finally:
+                self._save_undo_info(abs_to_path)
         else:
             directory_path = os.path.dirname(abs_to_path)
             self._path_exists(directory_path)
             self._is_file(abs_from_path)
 
-            shutil.copy(abs_from_path, abs_to_path)
+            if os.path.isdir(abs_to_path):
+                abs_to_path = os.path.join(
+                    abs_to_path, os.path.basename(abs_from_path)
+                )
+
+            resume = getattr(tokens, "resume", False)
+            size = os.path.getsize(abs_from_path)
+            self._progress = Progress(self._command, total_bytes=size)
+            with self._progress:
+                if incremental:
+                    self._transfer(abs_from_path, abs_to_path)
+                    for task in self._written_files:
+                        shutil.copystat(*task)
+                elif resume:
+                    self._copy_resumable(abs_from_path, abs_to_path, resume)
+                else:
+                    self._engine.copy(abs_from_path, abs_to_path)
+                    self._progress.advance(size, 1)
 
             self._save_undo_info(abs_to_path)
 
+        if incremental:
+            print(
+                f"Скопировано: {self._copied}, "
+                f"без изменений: {self._skipped}, "
+                f"записано байт: {self._written}"
+            )
+
+    def _copy_resumable(
+        self, source: str, destination: str, resume: bool
+    ) -> None:
+        """
+        Копирует файл во временный файл рядом с назначением частями.
+        После каждой части данные сбрасываются на диск и позиция
+        записывается в журнал, поэтому при --resume копирование
+        продолжается с неё, если источник не изменился.
+        Готовый файл атомарно переименовывается в назначение
+        :param source: Абсолютный путь к исходному файлу
+        :param destination: Абсолютный путь к файлу назначения
+        :param resume: Продолжить прерванное копирование
+        :raises shutil.SameFileError: Если источник и назначение
+            совпадают
+        :raises OSError: При ошибке копирования
+        """
+        partial_path = os.path.join(
+            os.path.dirname(destination),
+            f".{os.path.basename(destination)}{PARTIAL_SUFFIX}",
+        )
+        journal = CopyJournal(self.journal_path)
+        journal.load()
+
+        with open(source, "rb", buffering=0) as source_file:
+            source_stats = os.fstat(source_file.fileno())
+            self._engine.check_same_file(source, source_stats, destination)
+            size = source_stats.st_size
+            offset = 0
+            if resume:
+                offset = self._resume_offset(
+                    journal, source, destination, partial_path, source_stats
+                )
+
+            descriptor = os.open(partial_path, os.O_RDWR | os.O_CREAT, 0o666)
+            with open(descriptor, "r+b", buffering=0) as partial_file:
+                partial_file.truncate(offset)
+                if offset == 0 and size > 0:
+                    if self._engine.clone(source_file, partial_file):
+                        self._progress.advance(size)
+                        offset = size
+
+                while offset < size:
+                    end = min(offset + CHECKPOINT_INTERVAL, size)
+                    self._engine.copy_part(
+                        source_file, partial_file, offset, end
+                    )
+                    os.fdatasync(partial_file.fileno())
+                    self._progress.advance(end - offset)
+                    offset = end
+                    journal.put(
+                        destination,
+                        (source, size, source_stats.st_mtime_ns, offset),
+                    )
+
+                os.fchmod(
+                    partial_file.fileno(), stat.S_IMODE(source_stats.st_mode)
+                )
+                os.fsync(partial_file.fileno())
+
+        os.replace(partial_path, destination)
+        journal.remove(destination)
+        self._progress.advance(files=1)
+
+    def _resume_offset(
+        self,
+        journal: CopyJournal,
+        source: str,
+        destination: str,
+        partial_path: str,
+        source_stats: os.stat_result,
+    ) -> int:
+        """
+        Находит позицию, с которой можно продолжить копирование
+        :param journal: Журнал незавершённых копирований
+        :param source: Абсолютный путь к исходному файлу
+        :param destination: Абсолютный путь к файлу назначения
+        :param partial_path: Путь к временному файлу
+        :param source_stats: Результат stat источника
+        :return: Сохранённая позиция или 0, если продолжить нельзя
+        """
+        checkpoint = journal.get(destination)
+        expected = (source, source_stats.st_size, source_stats.st_mtime_ns)
+        try:
+            partial_size = os.path.getsize(partial_path)
+        except OSError:
+            partial_size = -1
+
+        if (
+            checkpoint is None
+            or checkpoint[:3] != expected
+            or partial_size < checkpoint[3]
+        ):
+            print("Сохранённый прогресс не найден, копирование с начала")
+            return 0
+
+        print(f"Продолжение копирования с байта {checkpoint[3]}")
+        return checkpoint[3]
+
+    def _copy_tree(self, source: str, destination: str, jobs: int) -> None:
+        """
+        Копирует директорию в три прохода: сначала создаются все
+        директории, затем содержимое файлов копируется в пуле потоков,
+        и только после всех данных время изменения и права выставляются
+        записанным файлам, а затем директориям, от вложенных к внешним,
+        чтобы запись данных и создание файлов его уже не меняли
+        :param source: Абсолютный путь к исходной директории
+        :param destination: Абсолютный путь к директории назначения
+        :param jobs: Количество потоков для копирования файлов
+        :raises CopyingError: Если часть файлов не скопирована
+        """
+        self._errors = []
+        self._stop.clear()
+
+        directories, files = self._make_skeleton(source, destination)
+        self._progress.total_files = len(files)
+        self._copy_files(files, jobs)
+
+        for source_path, destination_path in [
+            *self._written_files,
+            *reversed(directories),
+        ]:
+            try:
+                shutil.copystat(source_path, destination_path)
+            except OSError as error:
+                self._errors.append(f"{destination_path}: {error}")
+
+        if self._errors:
+            for message in self._errors:
+                logging.error(message)
+            raise CopyingError(
+                f"Не скопировано: {len(self._errors)}, "
+                f"первая ошибка: {self._errors[0]}"
+            )
+
+    def _make_skeleton(
+        self, source: str, destination: str
+    ) -> tuple[list[CopyTask], list[CopyTask]]:
+        """
+        Создаёт дерево директорий назначения и собирает файлы
+        для копирования. Как и shutil.copytree, символические ссылки
+        раскрываются; директория, уже встреченная при обходе,
+        повторно не копируется. Директория назначения, в которую
+        источник попадает через ссылку, тоже пропускается, иначе копия
+        копировалась бы в саму себя
+        :param source: Абсолютный путь к исходной директории
+        :param destination: Абсолютный путь к директории назначения
+        :return: Пары путей директорий в порядке обхода и пары путей
+            файлов
+        :raises OSError: Если невозможно создать директорию назначения
+        """
+        os.makedirs(destination, exist_ok=True)
+        destination_stats = os.stat(destination)
+
+        directories: list[CopyTask] = []
+        files: list[CopyTask] = []
+        visited = {(destination_stats.st_dev, destination_stats.st_ino)}
+        stack = [(source, destination)]
+
+        while stack:
+            source_directory, destination_directory = stack.pop()
+            try:
+                stats = os.stat(source_directory)
+                if (stats.st_dev, stats.st_ino) in visited:
+                    continue
+                visited.add((stats.st_dev, stats.st_ino))
+
+                if source_directory != source:
+                    os.makedirs(destination_directory, exist_ok=True)
+                with os.scandir(source_directory) as iterator:
+                    entries = sorted(iterator, key=lambda entry: entry.name)
+            except OSError as error:
+                self._errors.append(f"{source_directory}: {error}")
+                continue
+
+            directories.append((source_directory, destination_directory))
+            for entry in entries:
+                target = os.path.join(destination_directory, entry.name)
+                try:
+                    is_directory = entry.is_dir()
+                except OSError:
+                    is_directory = False
+
+                if is_directory:
+                    stack.append((entry.path, target))
+                else:
+                    files.append((entry.path, target))
+
+        return directories, files
+
+    def _copy_files(self, files: list[CopyTask], jobs: int) -> None:
+        """
+        Копирует файлы. При нескольких потоках задания передаются
+        через ограниченную очередь, поэтому в памяти одновременно
+        находится лишь несколько заданий на поток
+        :param files: Пары путей источника и назначения
+        :param jobs: Количество потоков
+        """
+        if jobs == 1:
+            for task in files:
+                self._copy_one(task)
+            return
+
+        tasks: queue.Queue[CopyTask | None] = queue.Queue(
+            maxsize=jobs * COPY_QUEUE_FACTOR
+        )
+        workers = [
+            threading.Thread(target=self._worker, args=(tasks,))
+            for _ in range(jobs)
+        ]
+        for worker in workers:
+            worker.start()
+
+        try:
+            for task in files:
+                tasks.put(task)
+        except BaseException:
+            self._stop.set()
+            raise
+        finally:
+            for _ in workers:
+                tasks.put(None)
+            for worker in workers:
+                worker.join()
+
+    def _worker(self, tasks: queue.Queue[CopyTask | None]) -> None:
+        """
+        Копирует файлы из очереди до получения None
+        :param tasks: Очередь пар путей источника и назначения
+        """
+        while (task := tasks.get()) is not None:
+            if not self._stop.is_set():
+                self._copy_one(task)
+
+    def _copy_one(self, task: CopyTask) -> None:
+        """
+        Копирует содержимое одного файла.
+        Ошибка запоминается, чтобы скопировать остальные файлы
+        :param task: Пара путей источника и назначения
+        """
+        source, destination = task
+        try:
+            self._transfer(source, destination)
+        except OSError as error:
+            self._errors.append(f"{source}: {error}")
+
+    def _transfer(self, source: str, destination: str) -> None:
+        """
+        Копирует содержимое файла с правами доступа, пропуская
+        неизменённый файл при --update и обновляя существующий
+        большой файл по блокам при --delta. При --delta прогресс
+        пополняется после каждого проверенного блока.
+        Записанный файл запоминается, чтобы время изменения выставить
+        ему после копирования всех данных.
+        Как и shutil, специальные файлы не открываются: чтение
+        или запись именованного канала заблокировали бы копирование
+        :param source: Путь к исходному файлу
+        :param destination: Путь к файлу назначения
+        :raises shutil.SpecialFileError: Если источник или назначение
+            не обычный файл
+        :raises OSError: При ошибке копирования
+        """
+        source_stats = os.stat(source)
+        self._is_regular(source, source_stats)
+        try:
+            destination_stats: os.stat_result | None = os.stat(destination)
+        except FileNotFoundError:
+            destination_stats = None
+        if destination_stats is not None:
+            self._is_regular(destination, destination_stats)
+
+        if (
+            self._update
+            and destination_stats is not None
+            and self._is_unchanged(
+                source, destination, source_stats, destination_stats
+            )
+        ):
+            with self._lock:
+                self._skipped += 1
+            self._progress.advance(files=1)
+            return
+
+        if (
+            self._delta
+            and destination_stats is not None
+            and destination_stats.st_size >= DELTA_MIN_SIZE
+        ):
+            written = self._engine.copy_delta(
+                source, destination, self._progress.advance
+            )
+            unreported = 0
+        else:
+            self._engine.copy_file(source, destination)
+            written = unreported = source_stats.st_size
+
+        with self._lock:
+            self._copied += 1
+            self._written += written
+            self._written_files.append((source, destination))
+        self._progress.advance(unreported, 1)
+
+    def _is_regular(self, path: str, stats: os.stat_result) -> None:
+        """
+        Проверяет, что путь указывает на обычный файл
+        :param path: Путь к файлу
+        :param stats: Результат stat файла
+        :raises shutil.SpecialFileError: Если это именованный канал,
+            устройство или сокет
+        """
+        if not stat.S_ISREG(stats.st_mode):
+            raise shutil.SpecialFileError(f"{path} — не обычный файл")
+
+    def _is_unchanged(
+        self,
+        source: str,
+        destination: str,
+        source_stats: os.stat_result,
+        destination_stats: os.stat_result,
+    ) -> bool:
+        """
+        Проверяет, что файл назначения уже совпадает с источником
+        :param source: Путь к исходному файлу
+        :param destination: Путь к файлу назначения
+        :param source_stats: Результат stat источника
+        :param destination_stats: Результат stat назначения
+        :return: True, если размеры совпадают и совпадает время
+            изменения или, с --checksum, содержимое
+        :raises OSError: При ошибке чтения
+        """
+        if source_stats.st_size != destination_stats.st_size:
+            return False
+        if self._checksum:
+            return self._engine.same_content(source, destination)
+
+        return source_stats.st_mtime_ns == destination_stats.st_mtime_ns
+
+    def _is_outside(self, source: str, destination: str) -> None:
+        """
+        Проверяет, что директория назначения не совпадает с источником
+        и не находится внутри него
+        :param source: Абсолютный путь к исходной директории
+        :param destination: Абсолютный путь к директории назначения
+        :raises CopyingError: Если директория копируется в саму себя
+        """
+        real_source = os.path.realpath(source)
+        real_destination = os.path.realpath(destination)
+        if os.path.commonpath([real_source, real_destination]) == real_source:
+            message = (
+                f"Невозможно скопировать директорию {source} "
+                f"в саму себя: {destination}"
+            )
+            logging.error(message)
+            raise CopyingError(message)
+
     def _save_undo_info(self, copied_path: str) -> None:
         """
         Сохраняет информацию о скопированном файле для отмены
@@ -0,0 +1,247 @@
+import argparse
+import logging
+import os
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+
+from src.filesystem.base_command import BaseClass
+from src.filesystem.size_cache import DirectoryUsage, SizeCache
+from src.utils.logger import Logger
+
+DEFAULT_DU_JOBS = 4
+BLOCK_SIZE = 512
+
+
+class Du(BaseClass):
+    """
+    Класс для подсчёта места, занимаемого файлами и директориями
+    """
+
+    def __init__(self) -> None:
+        """
+        Инициализация команды с путём к файлу кэша размеров
+        """
+        self._cache_path = os.path.join(os.getcwd(), "src/history/.du_cache")
+        self._cache: SizeCache | None = None
+        self._seen_links: set[tuple[int, int]] = set()
+        self._apparent = False
+
+    def execute(self, tokens: argparse.Namespace) -> None:
+        """
+        Выводит размер каждой директории дерева и итог по каждому пути.
+        По умолчанию выводится занятое место на диске в КиБ (st_blocks),
+        с --apparent-size — сумма размеров файлов в байтах (st_size).
+        Файл с несколькими жёсткими ссылками учитывается один раз
+        :param tokens: Аргументы команды (пути, -s, --apparent-size,
+            -j, --cache)
+        :raises ShellError: При ошибке доступа к пути
+        """
+        paths = tokens.paths or [os.getcwd()]
+        summarize = getattr(tokens, "summarize", False)
+        jobs = getattr(tokens, "jobs", DEFAULT_DU_JOBS)
+        self._apparent = getattr(tokens, "apparent_size", False)
+        self._seen_links = set()
+
+        self._cache = None
+        if getattr(tokens, "cache", False):
+            self._cache = SizeCache(self._cache_path)
+            self._cache.load()
+
+        try:
+            for path in paths:
+                abs_path = self._abs_path(path)
+                self._path_exists(abs_path)
+                self._measure_path(path, abs_path, summarize, jobs)
+        finally:
+            if self._cache is not None:
+                self._cache.save()
+
+        if self._cache is not None:
+            Logger.cache_summary("du", self._cache.hits, self._cache.misses)
+
+    def _measure_path(
+        self, path: str, abs_path: str, summarize: bool, jobs: int
+    ) -> None:
+        """
+        Считает и выводит размеры одного пути
+        :param path: Путь, как он указан в команде
+        :param abs_path: Абсолютный путь
+        :param summarize: Выводить только итог
+        :param jobs: Количество потоков для чтения директорий
+        """
+        stats = os.stat(abs_path, follow_symlinks=False)
+        if not os.path.isdir(abs_path) or os.path.islink(abs_path):
+            blocks, size = self._count_once(stats)
+            print(f"{self._format_size(blocks, size)}\t{path}")
+            return
+
+        usages = self._scan_tree(abs_path, jobs)
+        lines = []
+        totals: dict[str, tuple[int, int]] = {}
+
+        stack: list[tuple[str, bool]] = [(abs_path, False)]
+        while stack:
+            directory, children_done = stack.pop()
+            usage = usages.get(directory)
+            if usage is None:
+                label = self._label(path, abs_path, directory)
+                lines.append(f"{label}: невозможно прочитать директорию\n")
+                totals[directory] = (0, 0)
+                continue
+
+            own_blocks, own_size, links, subdirectories = usage
+            children = [
+                os.path.join(directory, name)
+                for name in sorted(subdirectories)
+            ]
+            if not children_done:
+                stack.append((directory, True))
+                stack.extend((child, False) for child in reversed(children))
+                continue
+
+            blocks, size = own_blocks, own_size
+            for dev, ino, link_blocks, link_size in links:
+                if (dev, ino) not in self._seen_links:
+                    self._seen_links.add((dev, ino))
+                    blocks += link_blocks
+                    size += link_size
+            for child in children:
+                child_blocks, child_size = totals.pop(child)
+                blocks += child_blocks
+                size += child_size
+
+            totals[directory] = (blocks, size)
+            if not summarize or directory == abs_path:
+                label = self._label(path, abs_path, directory)
+                lines.append(f"{self._format_size(blocks, size)}\t{label}\n")
+
+        print("".join(lines), end="")
+
+    def _scan_tree(self, root: str, jobs: int) -> dict[str, DirectoryUsage]:
+        """
+        Читает все директории дерева в пуле потоков.
+        Поддиректория отправляется в пул, как только прочитан её родитель.
+        Символические ссылки на директории не раскрываются
+        :param root: Абсолютный путь к корню
+        :param jobs: Количество потоков
+        :return: Размеры каждой прочитанной директории
+        """
+        usages: dict[str, DirectoryUsage] = {}
+
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            pending: dict[Future, str] = {
+                executor.submit(self._scan_directory, root): root
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    directory = pending.pop(future)
+                    try:
+                        usage = future.result()
+                    except OSError as error:
+                        logging.warning(
+                            f"Пропущена директория {directory}: {error}"
+                        )
+                        continue
+
+                    usages[directory] = usage
+                    for name in usage[3]:
+                        child = os.path.join(directory, name)
+                        pending[
+                            executor.submit(self._scan_directory, child)
+                        ] = child
+
+        return usages
+
+    def _scan_directory(self, directory: str) -> DirectoryUsage:
+        """
+        Считает размеры файлов одной директории без поддиректорий.
+        Файлы с несколькими жёсткими ссылками возвращаются отдельно,
+        чтобы учесть каждый из них один раз во всём выводе
+        :param directory: Абсолютный путь к директории
+        :return: Суммы st_blocks и st_size, жёсткие ссылки
+            (устройство, inode, блоки, размер) и имена поддиректорий
+        :raises OSError: Если директорию невозможно прочитать
+        """
+        stats = os.stat(directory, follow_symlinks=False)
+        if self._cache is not None:
+            cached = self._cache.get(directory, stats.st_mtime_ns)
+            if cached is not None:
+                return cached
+
+        blocks = stats.st_blocks
+        size = stats.st_size
+        links = []
+        subdirectories = []
+
+        with os.scandir(directory) as iterator:
+            for entry in iterator:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirectories.append(entry.name)
+                        continue
+                    entry_stats = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+
+                if entry_stats.st_nlink > 1:
+                    links.append(
+                        (
+                            entry_stats.st_dev,
+                            entry_stats.st_ino,
+                            entry_stats.st_blocks,
+                            entry_stats.st_size,
+                        )
+                    )
+                else:
+                    blocks += entry_stats.st_blocks
+                    size += entry_stats.st_size
+
+        usage = (blocks, size, links, subdirectories)
+        if self._cache is not None:
+            self._cache.put(directory, stats.st_mtime_ns, usage)
+
+        return usage
+
+    def _count_once(self, stats: os.stat_result) -> tuple[int, int]:
+        """
+        Учитывает отдельный файл, пропуская уже учтённые жёсткие ссылки
+        :param stats: Результат stat файла
+        :return: Блоки и размер файла или нули, если он уже учтён
+        """
+        identity = (stats.st_dev, stats.st_ino)
+        if stats.st_nlink > 1:
+            if identity in self._seen_links:
+                return 0, 0
+            self._seen_links.add(identity)
+
+        return stats.st_blocks, stats.st_size
+
+    def _format_size(self, blocks: int, size: int) -> str:
+        """
+        Форматирует размер для вывода
+        :param blocks: Количество 512-байтовых блоков
+        :param size: Сумма размеров файлов в байтах
+        :return: Размер в КиБ на диске или в байтах с --apparent-size
+        """
+        if self._apparent:
+            return str(size)
+
+        return str(-(-blocks * BLOCK_SIZE // 1024))
+
+    def _label(self, path: str, abs_path: str, directory: str) -> str:
+        """
+        Строит путь директории для вывода относительно указанного пути
+        :param path: Путь, как он указан в команде
+        :param abs_path: Абсолютный путь
+        :param directory: Абсолютный путь к директории дерева
+        :return: Путь для вывода
+        """
+        if directory == abs_path:
+            return path
+
+        return os.path.join(path, os.path.relpath(directory, abs_path))
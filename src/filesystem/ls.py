@@ -1,9 +1,41 @@
 import argparse
+import heapq
+import json
+import logging
 import os
-import stat
-from datetime import datetime
+import shutil
+import sys
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Any
 
 from src.filesystem.base_command import BaseClass
+from src.utils.dir_cache import DirectoryEntry, directory_cache
+from src.utils.stat_format import StatFormatter
+
+DEFAULT_SCAN_JOBS = 4
+READ_AHEAD_PER_JOB = 2
+
+ORDER_NAME = "name"
+ORDER_NONE = "none"
+ORDER_SIZE = "size"
+ORDER_TIME = "time"
+
+COLOR_AUTO = "auto"
+COLOR_ALWAYS = "always"
+COLOR_NEVER = "never"
+
+DIRECTORY_COLOR = "\033[34;42m"
+FILE_COLOR = "\033[32m"
+RESET_COLOR = "\033[0m"
+
+OUTPUT_TEXT = "text"
+OUTPUT_JSON = "json"
+OUTPUT_NDJSON = "ndjson"
+
+OUTPUT_CHUNK_SIZE = 4096
+COLUMN_GAP = 2
 
 
 class Ls(BaseClass):
@@ -11,6 +43,18 @@ class Ls(BaseClass):
     Класс для отображения содержимого директорий
     """
 
+    def __init__(self) -> None:
+        """
+        Инициализация команды с порядком вывода по умолчанию
+        """
+        self._order = ORDER_NAME
+        self._head: int | None = None
+        self._color = False
+        self._width: int | None = None
+        self._formatter = StatFormatter()
+        self._output = OUTPUT_TEXT
+        self._records = 0
+
     def execute(self, tokens: argparse.Namespace) -> None:
         """
         Выводит список файлов и директорий
@@ -24,66 +68,519 @@ class Ls(BaseClass):
 
         detailed = tokens.l or tokens.al
         all_files = tokens.all or tokens.al
+        recursive = getattr(tokens, "recursive", False)
+        jobs = getattr(tokens, "jobs", DEFAULT_SCAN_JOBS)
+        self._order = self._sort_order(tokens)
+        self._head = getattr(tokens, "head", None)
+        self._setup_terminal(getattr(tokens, "color", COLOR_AUTO))
+        self._output = self._output_format(tokens)
+        self._records = 0
+
+        if self._output == OUTPUT_JSON:
+            sys.stdout.write("[")
+        try:
+            self._list_paths(paths, detailed, all_files, recursive, jobs)
+        finally:
+            if self._output == OUTPUT_JSON:
+                sys.stdout.write("\n]\n" if self._records else "]\n")
 
+    def _list_paths(
+        self,
+        paths: list[str],
+        detailed: bool,
+        all_files: bool,
+        recursive: bool,
+        jobs: int,
+    ) -> None:
+        """
+        Выводит содержимое каждого пути
+        :param paths: Пути к директориям
+        :param detailed: Подробный вывод
+        :param all_files: Показать скрытые файлы
+        :param recursive: Рекурсивный вывод
+        :param jobs: Количество потоков для чтения директорий при -R
+        :raises ShellError: При ошибке чтения директории
+        """
         for path in paths:
             abs_path = self._abs_path(path)
 
             self._path_exists(abs_path)
             self._is_directory(abs_path)
 
-            items = os.listdir(abs_path)
-
-            print(f"{path}:")
-            if detailed:
-                self._print_detailed(items, abs_path, all_files)
+            if recursive:
+                self._list_recursive(path, abs_path, detailed, all_files, jobs)
+            elif self._order == ORDER_NONE:
+                with os.scandir(abs_path) as iterator:
+                    entries = self._order_entries(iterator, all_files)
+                    self._print_section(path, entries, detailed)
             else:
-                self._print_not_detailed(items, abs_path, all_files)
+                entries = self._scan(abs_path, all_files)
+                self._print_section(path, entries, detailed)
+
+    def _sort_order(self, tokens: argparse.Namespace) -> str:
+        """
+        Определяет порядок вывода по флагам -U, -S и -t
+        :param tokens: Аргументы команды
+        :return: Порядок вывода
+        """
+        if getattr(tokens, "unsorted", False):
+            return ORDER_NONE
+        if getattr(tokens, "sort_size", False):
+            return ORDER_SIZE
+        if getattr(tokens, "sort_time", False):
+            return ORDER_TIME
+        return ORDER_NAME
+
+    def _output_format(self, tokens: argparse.Namespace) -> str:
+        """
+        Определяет формат вывода по флагам --json и --ndjson
+        :param tokens: Аргументы команды
+        :return: Формат вывода
+        """
+        if getattr(tokens, "json", False):
+            return OUTPUT_JSON
+        if getattr(tokens, "ndjson", False):
+            return OUTPUT_NDJSON
+        return OUTPUT_TEXT
+
+    def _setup_terminal(self, color: str) -> None:
+        """
+        Определяет цвета и ширину вывода.
+        Если stdout не терминал, цвета по умолчанию отключаются,
+        а простой вывод идёт по одному имени в строке
+        :param color: Режим цвета auto, always или never
+        """
+        is_terminal = sys.stdout.isatty()
+        if color == COLOR_AUTO:
+            self._color = is_terminal
+        else:
+            self._color = color == COLOR_ALWAYS
 
-            print()
+        if is_terminal:
+            self._width = shutil.get_terminal_size().columns
+        else:
+            self._width = None
 
-    def _print_detailed(
-        self, items: list, abs_path: str, all_files: bool
+    def _print_section(
+        self, path: str, entries: Iterable[DirectoryEntry], detailed: bool
     ) -> None:
         """
-        Выводит подробную информацию о файлах
-        :param items: Список элементов директории
-        :param abs_path: Абсолютный путь к директории
-        :param all_files: Показать скрытые файлы
+        Выводит содержимое одной директории с заголовком.
+        Вывод собирается в блоки и записывается одним вызовом write
+        на блок. Записи из списка выравниваются целиком,
+        потоковые записи (-U) — по блокам из OUTPUT_CHUNK_SIZE записей
+        :param path: Путь к директории для заголовка
+        :param entries: Записи директории
+        :param detailed: Подробный вывод
+        """
+        if self._output != OUTPUT_TEXT:
+            for chunk in self._chunks(entries):
+                sys.stdout.write("".join(self._format_records(path, chunk)))
+            return
+
+        format_chunk = (
+            self._format_detailed if detailed else self._format_columns
+        )
+        header = f"{path}:\n"
+
+        for chunk in self._chunks(entries):
+            sys.stdout.write(header + "".join(format_chunk(chunk)))
+            header = ""
+
+        sys.stdout.write(header + "\n")
+
+    def _chunks(
+        self, entries: Iterable[DirectoryEntry]
+    ) -> Iterable[list[DirectoryEntry]]:
+        """
+        Делит записи на блоки для вывода.
+        Список остаётся одним блоком, потоковые записи делятся
+        на блоки из OUTPUT_CHUNK_SIZE записей
+        :param entries: Записи директории
+        :return: Блоки записей
+        """
+        if isinstance(entries, list):
+            return [entries]
+
+        iterator = iter(entries)
+        return iter(lambda: list(islice(iterator, OUTPUT_CHUNK_SIZE)), [])
+
+    def _format_records(
+        self, path: str, entries: list[DirectoryEntry]
+    ) -> list[str]:
+        """
+        Форматирует записи как объекты JSON.
+        Данные берутся из записи scandir и lstat самой записи,
+        поэтому символическая ссылка описывается как ссылка.
+        Записи, удалённые во время вывода, пропускаются
+        :param path: Путь к директории, как он указан в команде
+        :param entries: Записи директории
+        :return: Строки вывода
         """
-        for item in sorted(items):
-            item_path = os.path.join(abs_path, item)
+        separator = ",\n" if self._output == OUTPUT_JSON else ""
+        end = "" if self._output == OUTPUT_JSON else "\n"
 
-            stats = os.stat(item_path)
+        lines = []
+        for entry in entries:
+            try:
+                stats = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
 
-            mode = stat.filemode(stats.st_mode)
-            item_size = stats.st_size
+            record = {
+                "directory": path,
+                "name": entry.name,
+                "type": self._entry_type(entry),
+                "size": stats.st_size,
+                "mode": stats.st_mode,
+                "mtime_ns": stats.st_mtime_ns,
+                "inode": entry.inode(),
+            }
+            prefix = separator if self._records else separator.lstrip(",")
+            lines.append(f"{prefix}{json.dumps(record)}{end}")
+            self._records += 1
 
-            mtime = datetime.fromtimestamp(stats.st_mtime)
-            mtime_str = mtime.strftime("%Y-%m-%d %H:%M")
+        return lines
 
-            if item[0] != "." or all_files:
-                if os.path.isdir(item_path):
-                    colored_name = f"\033[34;42m{item}\033[0m"
-                    log = f"{mode} {item_size:>10} {mtime_str} {colored_name}"
-                else:
-                    colored_name = f"\033[32m{item}\033[0m"
-                    log = f"{mode} {item_size:>10} {mtime_str} {colored_name}"
+    def _entry_type(self, entry: DirectoryEntry) -> str:
+        """
+        Определяет тип записи без раскрытия символических ссылок
+        :param entry: Запись директории
+        :return: symlink, directory, file или other
+        """
+        if entry.is_symlink():
+            return "symlink"
+        if entry.is_dir(follow_symlinks=False):
+            return "directory"
+        if entry.is_file(follow_symlinks=False):
+            return "file"
+        return "other"
+
+    def _list_recursive(
+        self,
+        path: str,
+        abs_path: str,
+        detailed: bool,
+        all_files: bool,
+        jobs: int,
+    ) -> None:
+        """
+        Выводит дерево директорий в глубину.
+        Поддиректории читаются заранее в пуле потоков, пока выводятся
+        предыдущие разделы, но разделы печатаются строго в порядке обхода.
+        Заранее читается не больше jobs * READ_AHEAD_PER_JOB директорий,
+        ближайших к выводу, чтобы прочитанные, но ещё не выведенные
+        записи широкого дерева не копились в памяти.
+        Директории, уже выведенные под другим путём (например, через
+        символическую ссылку), определяются по (st_dev, st_ino)
+        и не обходятся повторно, поэтому циклы ссылок не зацикливают обход
+        :param path: Путь к корню для заголовков
+        :param abs_path: Абсолютный путь к корню
+        :param detailed: Подробный вывод
+        :param all_files: Показать скрытые файлы и обходить скрытые
+            директории
+        :param jobs: Количество потоков для чтения директорий
+        """
+        root_stats = os.stat(abs_path)
+        visited = {(root_stats.st_dev, root_stats.st_ino)}
+
+        read_ahead = jobs * READ_AHEAD_PER_JOB
+        stack: list[tuple[str, str]] = [(path, abs_path)]
+        scans: dict[str, Future] = {}
 
-                print(log)
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            while stack:
+                self._schedule_scans(
+                    executor, stack, scans, read_ahead, all_files
+                )
 
-    def _print_not_detailed(
-        self, items: list, abs_path: str, all_files: bool
+                label, scan_path = stack.pop()
+                future = scans.pop(scan_path, None)
+                if future is None:
+                    future = executor.submit(
+                        self._scan_level, scan_path, all_files
+                    )
+                try:
+                    entries, subdirectories = future.result()
+                except OSError as error:
+                    logging.warning(f"Пропущена директория {label}: {error}")
+                    if self._output == OUTPUT_TEXT:
+                        sys.stdout.write(
+                            f"{label}: невозможно прочитать директорию\n\n"
+                        )
+                    continue
+
+                self._print_section(label, entries, detailed)
+
+                children = []
+                for entry, identity in subdirectories:
+                    child_label = os.path.join(label, entry.name)
+                    if identity in visited:
+                        logging.warning(
+                            f"Пропущена директория {child_label}: "
+                            "уже выведена, возможен цикл ссылок"
+                        )
+                        continue
+
+                    visited.add(identity)
+                    children.append((child_label, entry.path))
+
+                stack.extend(reversed(children))
+
+    def _schedule_scans(
+        self,
+        executor: ThreadPoolExecutor,
+        stack: list[tuple[str, str]],
+        scans: dict[str, Future],
+        read_ahead: int,
+        all_files: bool,
     ) -> None:
         """
-        Выводит список файлов
-        :param items: Список элементов директории
+        Отправляет в пул чтение директорий, которые будут выведены
+        следующими. Ещё не начатые чтения директорий, отодвинутых
+        в глубь стека новыми поддиректориями, отменяются, чтобы
+        освободить место для более близких
+        :param executor: Пул потоков для чтения директорий
+        :param stack: Стек обхода из заголовков и абсолютных путей
+        :param scans: Отправленные в пул чтения по абсолютному пути
+        :param read_ahead: Наибольшее количество чтений в пуле
+            и прочитанных, но не выведенных директорий
+        :param all_files: Показать скрытые файлы
+        """
+        window = stack[-read_ahead:]
+        window_paths = {scan_path for _, scan_path in window}
+        for scan_path in list(scans):
+            if scan_path not in window_paths and scans[scan_path].cancel():
+                del scans[scan_path]
+
+        for _, scan_path in reversed(window):
+            if len(scans) >= read_ahead:
+                break
+            if scan_path not in scans:
+                scans[scan_path] = executor.submit(
+                    self._scan_level, scan_path, all_files
+                )
+
+    def _scan_level(
+        self, abs_path: str, all_files: bool
+    ) -> tuple[
+        list[DirectoryEntry], list[tuple[DirectoryEntry, tuple[int, int]]]
+    ]:
+        """
+        Читает одну директорию дерева в потоке пула.
+        Для поддиректорий сразу выполняется stat, чтобы получить
+        их идентичность; результат кэшируется в записи и переиспользуется
+        подробным выводом
         :param abs_path: Абсолютный путь к директории
         :param all_files: Показать скрытые файлы
+        :return: Записи директории и поддиректории с (st_dev, st_ino)
+        """
+        entries = self._scan(abs_path, all_files)
+
+        subdirectories = []
+        for entry in entries:
+            try:
+                if not entry.is_dir():
+                    continue
+                stats = entry.stat()
+            except OSError:
+                continue
+            subdirectories.append((entry, (stats.st_dev, stats.st_ino)))
+
+        return entries, subdirectories
+
+    def _scan(self, abs_path: str, all_files: bool) -> list[DirectoryEntry]:
+        """
+        Читает директорию целиком через общий кэш директорий
+        :param abs_path: Абсолютный путь к директории
+        :param all_files: Показать скрытые файлы
+        :return: Записи директории в порядке вывода
+        """
+        entries = directory_cache.scandir(abs_path)
+        return list(self._order_entries(entries, all_files))
+
+    def _order_entries(
+        self, iterator: Iterable[DirectoryEntry], all_files: bool
+    ) -> Iterable[DirectoryEntry]:
+        """
+        Упорядочивает записи директории.
+        Тип записи берётся из самой записи каталога без вызова stat,
+        скрытые файлы отбрасываются до любых обращений к их метаданным.
+        Без сортировки записи отдаются по мере чтения директории,
+        а с --head N в памяти держится только куча из N лучших записей
+        :param iterator: Записи директории
+        :param all_files: Показать скрытые файлы
+        :return: Записи директории в порядке вывода
+        """
+        entries = (
+            entry
+            for entry in iterator
+            if all_files or not entry.name.startswith(".")
+        )
+
+        if self._order == ORDER_NONE:
+            return islice(entries, self._head)
+
+        key = self._sort_key()
+        if self._head is not None:
+            return heapq.nsmallest(self._head, entries, key=key)
+
+        return sorted(entries, key=key)
+
+    def _sort_key(self) -> Callable[[DirectoryEntry], Any]:
+        """
+        Возвращает ключ сортировки для выбранного порядка.
+        Размер и время изменения сортируются по убыванию,
+        равные значения — по имени
+        :return: Функция ключа сортировки
+        """
+        if self._order == ORDER_SIZE:
+            return lambda entry: (-self._entry_stat(entry).st_size, entry.name)
+        if self._order == ORDER_TIME:
+            return lambda entry: (
+                -self._entry_stat(entry).st_mtime_ns,
+                entry.name,
+            )
+        return lambda entry: entry.name
+
+    def _entry_stat(self, entry: DirectoryEntry) -> os.stat_result:
+        """
+        Возвращает кэшированный stat записи.
+        Для битой символической ссылки используется stat самой ссылки
+        :param entry: Запись директории
+        :return: Результат stat
+        """
+        try:
+            return entry.stat()
+        except OSError:
+            return entry.stat(follow_symlinks=False)
+
+    def _format_detailed(self, entries: list[DirectoryEntry]) -> list[str]:
         """
-        for item in sorted(items):
-            if item[0] != "." or all_files:
-                item_path = os.path.join(abs_path, item)
-                if os.path.isdir(item_path):
-                    print(f"\033[34;42m{item}\033[0m", end=" ")
-                else:
-                    print(f"\033[32m{item}\033[0m", end=" ")
+        Форматирует подробную информацию о файлах.
+        Ширина столбца размера вычисляется один раз на блок.
+        Для каждой записи выполняется не больше одного stat,
+        результат которого кэшируется в самой записи.
+        Битая символическая ссылка выводится по stat самой ссылки
+        :param entries: Записи директории
+        :return: Строки вывода с переводом строки
+        """
+        rows = []
+        for entry in entries:
+            stats = self._entry_stat(entry)
+
+            mode = self._formatter.format_mode(stats.st_mode)
+            mtime_str = self._formatter.format_time(stats.st_mtime_ns)
+            rows.append((mode, str(stats.st_size), mtime_str, entry))
+
+        size_width = max((len(row[1]) for row in rows), default=0)
+
+        return [
+            f"{mode} {size:>{size_width}} {mtime_str} "
+            f"{self._colored(entry, entry.name)}\n"
+            for mode, size, mtime_str, entry in rows
+        ]
+
+    def _format_columns(self, entries: list[DirectoryEntry]) -> list[str]:
+        """
+        Форматирует имена файлов столбцами сверху вниз, как GNU ls.
+        Выбирается наибольшее число столбцов, при котором строки
+        помещаются в ширину терминала. Тип записи определяется без stat
+        :param entries: Записи директории
+        :return: Строки вывода с переводом строки
+        """
+        if not entries:
+            return []
+
+        names = [entry.name for entry in entries]
+        if self._width is None:
+            return [
+                f"{self._colored(entry, name)}\n"
+                for entry, name in zip(entries, names, strict=True)
+            ]
+
+        lengths = [len(name) for name in names]
+        rows_count, widths = self._column_layout(lengths)
+
+        lines = []
+        for row in range(rows_count):
+            parts = []
+            for column, width in enumerate(widths):
+                index = column * rows_count + row
+                if index >= len(entries):
+                    break
+                name = self._colored(entries[index], names[index])
+                parts.append(name + " " * (width - lengths[index]))
+            lines.append("".join(parts).rstrip() + "\n")
+
+        return lines
+
+    def _column_layout(self, lengths: list[int]) -> tuple[int, list[int]]:
+        """
+        Подбирает количество строк и ширины столбцов.
+        Ширины зависят только от количества строк, поэтому каждое
+        количество строк проверяется один раз. Количество столбцов,
+        которое не помещается даже при самых коротких именах рядом
+        с самым длинным, отбрасывается без просмотра имён
+        :param lengths: Длины имён в порядке вывода
+        :return: Количество строк и ширины столбцов с промежутком
+        """
+        width = self._width or 0
+        count = len(lengths)
+        shortest = min(lengths) + COLUMN_GAP
+        longest = max(lengths)
+        max_columns = max(1, min(count, width // (1 + COLUMN_GAP)))
+
+        checked_rows = 0
+        for columns in range(max_columns, 0, -1):
+            rows_count = -(-count // columns)
+            if rows_count == checked_rows:
+                continue
+            checked_rows = rows_count
+
+            used_columns = -(-count // rows_count)
+            if longest + (used_columns - 1) * shortest > width:
+                continue
+
+            widths = self._fitting_widths(lengths, rows_count, width)
+            if widths is not None:
+                return rows_count, widths
+
+        return count, [longest + COLUMN_GAP]
+
+    def _fitting_widths(
+        self, lengths: list[int], rows_count: int, width: int
+    ) -> list[int] | None:
+        """
+        Считает ширины столбцов, пока строка помещается в терминал
+        :param lengths: Длины имён в порядке вывода
+        :param rows_count: Количество строк
+        :param width: Ширина терминала
+        :return: Ширины столбцов с промежутком или None, если строка
+            не помещается
+        """
+        widths: list[int] = []
+        total = -COLUMN_GAP
+        for start in range(0, len(lengths), rows_count):
+            column_width = (
+                max(lengths[start : start + rows_count]) + COLUMN_GAP
+            )
+            total += column_width
+            if total > width:
+                return None
+            widths.append(column_width)
+
+        return widths
+
+    def _colored(self, entry: DirectoryEntry, name: str) -> str:
+        """
+        Выделяет имя цветом по типу записи, если цвета включены
+        :param entry: Запись директории
+        :param name: Имя для вывода
+        :return: Имя с управляющими кодами цвета или без них
+        """
+        if not self._color:
+            return name
+
+        color = DIRECTORY_COLOR if entry.is_dir() else FILE_COLOR
+        return f"{color}{name}{RESET_COLOR}"
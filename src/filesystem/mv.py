@@ -5,7 +5,9 @@ import re
 import shutil
 
 from src.filesystem.base_command import BaseClass
+from src.filesystem.copy_engine import CopyEngine
 from src.utils.errors import MovingError, PathNotFoundError
+from src.utils.progress import Progress
 
 
 class Mv(BaseClass):
@@ -22,10 +24,14 @@ class Mv(BaseClass):
         self._undo_history_path = os.path.join(
             os.getcwd(), "src/history/.undo_history"
         )
+        self._engine = CopyEngine()
+        self._progress = Progress("mv")
 
     def execute(self, tokens: argparse.Namespace) -> None:
         """
-        Перемещает или переименовывает файлы и директории
+        Перемещает или переименовывает файлы и директории.
+        Между файловыми системами файлы копируются через CopyEngine,
+        объём и скорость перемещения записываются в лог
         :param tokens: Аргументы команды (пути к файлам и директориям)
         :raises ShellError: При ошибке перемещения
         :raises MovingError: При отсутствии прав доступа
@@ -37,30 +43,53 @@ class Mv(BaseClass):
 
         abs_to_path = self._abs_path(paths[len(paths) - 1])
 
-        for path in paths:
-            abs_from_path = self._abs_path(path)
-
-            self._path_exists(abs_from_path)
-            self._is_system_path(abs_from_path)
-
-            if not os.access(abs_from_path, os.R_OK):
-                message = (
-                    f"Невозможно получить доступ '{paths[0]}': "
-                    f"Нет прав доступа"
-                )
-                raise MovingError(message)
-
-            target_dir = os.path.dirname(abs_to_path) or "."
-            if not os.access(target_dir, os.W_OK):
-                message = (
-                    f"Невозможно переместить '{paths[1]}': Нет прав доступа"
+        self._progress = Progress("mv")
+        with self._progress:
+            for path in paths:
+                abs_from_path = self._abs_path(path)
+
+                self._path_exists(abs_from_path)
+                self._is_system_path(abs_from_path)
+
+                if not os.access(abs_from_path, os.R_OK):
+                    message = (
+                        f"Невозможно получить доступ '{paths[0]}': "
+                        f"Нет прав доступа"
+                    )
+                    raise MovingError(message)
+
+                target_dir = os.path.dirname(abs_to_path) or "."
+                if not os.access(target_dir, os.W_OK):
+                    message = (
+                        f"Невозможно переместить '{paths[1]}': "
+                        "Нет прав доступа"
+                    )
+                    raise MovingError(message)
+
+                files = self._progress.files
+                shutil.move(
+                    abs_from_path,
+                    abs_to_path,
+                    copy_function=self._copy_counted,
                 )
-                raise MovingError(message)
-
-            shutil.move(abs_from_path, abs_to_path)
+                moved = abs_from_path != abs_to_path
+                if moved and self._progress.files == files:
+                    self._progress.advance(files=1)
 
         self._optimize_paths_for_undo(tokens)
 
+    def _copy_counted(self, source: str, destination: str) -> str:
+        """
+        Копирует файл при перемещении между файловыми системами
+        и учитывает его размер
+        :param source: Путь к исходному файлу
+        :param destination: Путь к файлу или директории назначения
+        :return: Путь к созданному файлу
+        """
+        destination = self._engine.copy2(source, destination)
+        self._progress.advance(os.path.getsize(destination), 1)
+        return destination
+
     def _optimize_paths_for_undo(self, tokens: argparse.Namespace) -> None:
         """
         Сохраняет информацию о перемещённых файлах для отмены операции
@@ -0,0 +1,112 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_MAX_DIRECTORIES = 100_000
+RACY_INTERVAL_NS = 2_000_000_000
+
+DirectoryUsage = tuple[int, int, list[tuple[int, int, int, int]], list[str]]
+
+
+class SizeCache:
+    """
+    Постоянный кэш размеров для du по отдельным директориям.
+    Для директории хранятся суммы st_blocks и st_size её файлов
+    (вместе с самой директорией), файлы с несколькими жёсткими ссылками
+    и имена поддиректорий. Запись действительна, пока не изменилось
+    время изменения директории, поэтому неизменённая директория
+    не читается и её файлы не проверяются через stat.
+    Файл, изменённый на месте, не меняет время изменения директории,
+    поэтому его новый размер виден только без --cache
+    """
+
+    def __init__(
+        self, cache_path: str, max_directories: int = DEFAULT_MAX_DIRECTORIES
+    ) -> None:
+        """
+        Инициализация пустого кэша
+        :param cache_path: Путь к файлу кэша на диске
+        :param max_directories: Максимальное количество директорий в кэше
+        """
+        self.cache_path = cache_path
+        self.max_directories = max_directories
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[int, DirectoryUsage]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        """
+        Загружает кэш с диска. Повреждённый файл кэша не считается
+        ошибкой, кэш просто начинается заново
+        """
+        entries: OrderedDict[str, tuple[int, DirectoryUsage]] = OrderedDict()
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            for path, mtime_ns, blocks, size, links, names in data["entries"]:
+                links = [
+                    (dev, ino, nblocks, nsize)
+                    for dev, ino, nblocks, nsize in links
+                ]
+                entries[path] = (mtime_ns, (blocks, size, links, names))
+        except (OSError, ValueError, TypeError, KeyError):
+            return
+
+        self._entries = entries
+
+    def save(self) -> None:
+        """
+        Вытесняет давно не использованные директории сверх лимита
+        и атомарно сохраняет кэш на диск
+        """
+        with self._lock:
+            while len(self._entries) > self.max_directories:
+                self._entries.popitem(last=False)
+            entries = [
+                [path, mtime_ns, *usage]
+                for path, (mtime_ns, usage) in self._entries.items()
+            ]
+
+        temp_path = f"{self.cache_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump({"entries": entries}, file, ensure_ascii=False)
+        os.replace(temp_path, self.cache_path)
+
+    def get(self, path: str, mtime_ns: int) -> DirectoryUsage | None:
+        """
+        Возвращает сохранённые размеры неизменённой директории
+        :param path: Абсолютный путь к директории
+        :param mtime_ns: Текущее время изменения директории
+        :return: Размеры директории или None при промахе
+        """
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or entry[0] != mtime_ns:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(path)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, path: str, mtime_ns: int, usage: DirectoryUsage) -> None:
+        """
+        Сохраняет размеры директории.
+        Недавно изменённая директория не сохраняется, чтобы изменение
+        в пределах точности времени файловой системы не осталось
+        незамеченным
+        :param path: Абсолютный путь к директории
+        :param mtime_ns: Время изменения директории
+        :param usage: Размеры директории
+        """
+        if time.time_ns() - mtime_ns < RACY_INTERVAL_NS:
+            return
+
+        with self._lock:
+            self._entries[path] = (mtime_ns, usage)
+            self._entries.move_to_end(path)
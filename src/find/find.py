@@ -0,0 +1,142 @@
+import argparse
+import logging
+import os
+import sys
+from collections.abc import Iterator
+
+from src.filesystem.base_command import BaseClass
+from src.find.predicates import FindEntry, FindExpression, PathEntry
+from src.utils.dir_cache import DirectoryEntry, directory_cache
+
+EXPRESSION_START = ("(", "!")
+OUTPUT_CHUNK_SIZE = 4096
+
+
+class Find(BaseClass):
+    """
+    Класс для поиска файлов по имени, типу, размеру и времени изменения
+    """
+
+    def __init__(self) -> None:
+        """
+        Инициализация буфера вывода
+        """
+        self._output: list[str] = []
+
+    def execute(self, tokens: argparse.Namespace) -> None:
+        """
+        Выводит пути, для которых выполняется выражение.
+        Выражение компилируется один раз, дерево обходится одним
+        проходом через scandir, символические ссылки не раскрываются
+        :param tokens: Аргументы команды (пути и выражение)
+        :raises ExpressionSyntaxError: Если выражение некорректно
+        :raises ShellError: При ошибке доступа к стартовому пути
+        """
+        paths, expression_tokens = self._split_arguments(tokens.arguments)
+        expression = FindExpression(expression_tokens)
+        self._output = []
+
+        try:
+            for path in paths:
+                abs_path = self._abs_path(path)
+                self._path_exists(abs_path)
+                self._find(path, abs_path, expression)
+        finally:
+            self._flush()
+
+    def _split_arguments(
+        self, arguments: list[str]
+    ) -> tuple[list[str], list[str]]:
+        """
+        Отделяет стартовые пути от выражения
+        :param arguments: Аргументы после имени команды
+        :return: Пути (по умолчанию текущая директория) и части выражения
+        """
+        index = 0
+        while index < len(arguments):
+            argument = arguments[index]
+            if argument.startswith("-") or argument in EXPRESSION_START:
+                break
+            index += 1
+
+        return arguments[:index] or ["."], arguments[index:]
+
+    def _find(
+        self, path: str, abs_path: str, expression: FindExpression
+    ) -> None:
+        """
+        Обходит дерево в глубину с выводом директории перед её содержимым.
+        Содержимое директорий сортируется по имени
+        :param path: Стартовый путь, как он указан в команде
+        :param abs_path: Абсолютный стартовый путь
+        :param expression: Скомпилированное выражение
+        """
+        name = os.path.basename(path.rstrip(os.sep)) or path
+        root = PathEntry(abs_path, name)
+        if not self._visit(path, root, expression):
+            return
+
+        stack: list[tuple[str, Iterator[DirectoryEntry]]] = []
+        self._push(stack, path, abs_path)
+
+        while stack:
+            label, iterator = stack[-1]
+            entry = next(iterator, None)
+            if entry is None:
+                stack.pop()
+                continue
+
+            entry_label = os.path.join(label, entry.name)
+            if self._visit(entry_label, entry, expression):
+                self._push(stack, entry_label, entry.path)
+
+    def _visit(
+        self,
+        label: str,
+        entry: FindEntry,
+        expression: FindExpression,
+    ) -> bool:
+        """
+        Проверяет запись и выводит её путь при совпадении
+        :param label: Путь для вывода
+        :param entry: Запись директории
+        :param expression: Скомпилированное выражение
+        :return: True, если в запись нужно спуститься
+        """
+        expression.pruned = False
+        if expression.match(entry):
+            self._output.append(f"{label}\n")
+            if len(self._output) >= OUTPUT_CHUNK_SIZE:
+                self._flush()
+
+        return not expression.pruned and entry.is_dir(follow_symlinks=False)
+
+    def _push(
+        self,
+        stack: list[tuple[str, Iterator[DirectoryEntry]]],
+        label: str,
+        directory: str,
+    ) -> None:
+        """
+        Читает директорию через общий кэш и добавляет её в стек обхода
+        :param stack: Стек обхода
+        :param label: Путь директории для вывода
+        :param directory: Абсолютный путь к директории
+        """
+        try:
+            entries = directory_cache.scandir(directory)
+        except OSError as error:
+            logging.warning(f"Пропущена директория {label}: {error}")
+            self._output.append(f"{label}: невозможно прочитать директорию\n")
+            return
+
+        entries.sort(key=lambda entry: entry.name)
+        stack.append((label, iter(entries)))
+
+    def _flush(self) -> None:
+        """
+        Записывает накопленный вывод одним вызовом write
+        """
+        if self._output:
+            sys.stdout.write("".join(self._output))
+            self._output = []
@@ -0,0 +1,53 @@
+import argparse
+import os
+import sys
+from itertools import islice
+
+from src.filesystem.base_command import BaseClass
+from src.find.locate_index import LocateIndex
+from src.utils.errors import SearchIndexError
+
+OUTPUT_CHUNK_SIZE = 4096
+
+
+class Locate(BaseClass):
+    """
+    Класс для поиска путей по индексу имён файлов без обхода диска
+    """
+
+    def __init__(self) -> None:
+        """
+        Инициализация команды с путём к файлу индекса
+        """
+        self._index_path = os.path.join(os.getcwd(), "src/history/.locate_db")
+
+    def execute(self, tokens: argparse.Namespace) -> None:
+        """
+        Выводит пути из индекса, содержащие подстроку
+        или совпадающие с шаблоном целиком
+        :param tokens: Аргументы команды (шаблон, -i, -l, -c)
+        :raises SearchIndexError: Если индекс не построен или повреждён
+        """
+        index = LocateIndex(self._index_path)
+        if not index.exists():
+            raise SearchIndexError("Индекс не построен, выполните updatedb")
+        try:
+            index.load()
+        except (OSError, ValueError):
+            raise SearchIndexError(
+                "Индекс повреждён, выполните updatedb"
+            ) from None
+
+        paths = index.search(
+            tokens.pattern, getattr(tokens, "ignore_case", False)
+        )
+        limit = getattr(tokens, "limit", None)
+        if limit is not None:
+            paths = islice(paths, limit)
+
+        if getattr(tokens, "count", False):
+            print(sum(1 for _ in paths))
+            return
+
+        while chunk := list(islice(paths, OUTPUT_CHUNK_SIZE)):
+            sys.stdout.write("".join(f"{path}\n" for path in chunk))
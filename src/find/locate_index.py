@@ -0,0 +1,276 @@
+import fnmatch
+import json
+import os
+import re
+import struct
+import time
+from collections.abc import Iterator
+
+INDEX_MAGIC = b"TERMINAL-LOCATE 1\n"
+RECORD_HEADER = struct.Struct("<HHqII")
+RACY_INTERVAL_NS = 2_000_000_000
+GLOB_CHARS = frozenset("*?[")
+GLOB_SET_REGEX = re.compile(r"\[[^\]]*\]?")
+GLOB_LITERAL_REGEX = re.compile(r"[^*?]+")
+
+DirectoryRecord = tuple[int, int, bytes]
+
+
+class LocateIndex:
+    """
+    Постоянный индекс имён файлов для locate.
+    Для каждой директории хранятся время изменения и имена записей,
+    поддиректории идут первыми. Пути директорий записаны в порядке
+    сортировки с общим префиксом предыдущего пути (front coding),
+    поэтому путь к файлу целиком на диске не повторяется.
+    Имена одной директории лежат подряд одним блоком, и запрос
+    без совпадения в блоке отбрасывает директорию целиком
+    """
+
+    def __init__(self, index_path: str) -> None:
+        """
+        Инициализация пустого индекса
+        :param index_path: Путь к файлу индекса на диске
+        """
+        self.index_path = index_path
+        self.roots: list[str] = []
+        self.directories: dict[bytes, DirectoryRecord] = {}
+
+    def exists(self) -> bool:
+        """
+        Проверяет, построен ли индекс на диске
+        :return: True, если файл индекса существует
+        """
+        return os.path.isfile(self.index_path)
+
+    def load(self) -> None:
+        """
+        Загружает индекс с диска
+        :raises ValueError: Если файл индекса повреждён
+        """
+        with open(self.index_path, "rb") as file:
+            data = file.read()
+
+        if not data.startswith(INDEX_MAGIC):
+            raise ValueError("Неизвестный формат индекса")
+
+        offset = len(INDEX_MAGIC)
+        roots_end = data.index(b"\n", offset)
+        self.roots = json.loads(data[offset:roots_end])
+        offset = roots_end + 1
+
+        directories: dict[bytes, DirectoryRecord] = {}
+        previous = b""
+        while offset < len(data):
+            shared, suffix_length, mtime_ns, subdirectories, block_length = (
+                RECORD_HEADER.unpack_from(data, offset)
+            )
+            offset += RECORD_HEADER.size
+            path = previous[:shared] + data[offset : offset + suffix_length]
+            offset += suffix_length
+            block = data[offset : offset + block_length]
+            offset += block_length
+
+            directories[path] = (mtime_ns, subdirectories, block)
+            previous = path
+
+        self.directories = directories
+
+    def save(self) -> None:
+        """
+        Атомарно сохраняет индекс на диск
+        """
+        parts = [INDEX_MAGIC, json.dumps(self.roots).encode("utf-8"), b"\n"]
+        previous = b""
+        for path in sorted(self.directories):
+            mtime_ns, subdirectories, block = self.directories[path]
+            shared = self._shared_prefix(previous, path)
+            suffix = path[shared:]
+            parts.append(
+                RECORD_HEADER.pack(
+                    shared, len(suffix), mtime_ns, subdirectories, len(block)
+                )
+            )
+            parts.append(suffix)
+            parts.append(block)
+            previous = path
+
+        temp_path = f"{self.index_path}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(b"".join(parts))
+        os.replace(temp_path, self.index_path)
+
+    def update(self, root: str) -> tuple[int, int, int]:
+        """
+        Обновляет индекс для дерева директорий.
+        Директория перечитывается, только если изменилось время
+        её изменения, иначе её имена берутся из индекса.
+        Директории, которых больше нет, удаляются из индекса.
+        Символические ссылки на директории не раскрываются
+        :param root: Абсолютный путь к корню дерева
+        :return: Количество директорий, перечитанных директорий
+            и записей в дереве
+        """
+        if root not in self.roots:
+            self.roots.append(root)
+
+        root_key = os.fsencode(root)
+        prefix = os.path.join(root_key, b"")
+        previous = {
+            path: record
+            for path, record in self.directories.items()
+            if path == root_key or path.startswith(prefix)
+        }
+        for path in previous:
+            del self.directories[path]
+
+        directories = 0
+        rescanned = 0
+        entries = 0
+        stack = [root_key]
+        while stack:
+            directory = stack.pop()
+            try:
+                mtime_ns = os.stat(
+                    directory, follow_symlinks=False
+                ).st_mtime_ns
+                known = previous.get(directory)
+                if known is not None and known[0] == mtime_ns:
+                    record = known
+                else:
+                    record = self._scan(directory, mtime_ns)
+                    rescanned += 1
+            except OSError:
+                continue
+
+            self.directories[directory] = record
+            names = self._names(record[2])
+            directories += 1
+            entries += len(names)
+            stack.extend(
+                os.path.join(directory, name) for name in names[: record[1]]
+            )
+
+        return directories, rescanned, entries
+
+    def search(self, pattern: str, ignore_case: bool = False) -> Iterator[str]:
+        """
+        Ищет пути по подстроке или по шаблону.
+        Шаблон с *, ? или [ должен совпасть со всем путём, причём *
+        пересекает косую черту; иначе ищется подстрока пути.
+        Самая длинная постоянная часть запроса, которой нет в пути
+        директории, должна оканчиваться в имени записи, поэтому
+        директории без неё в блоке имён пропускаются без разбора
+        :param pattern: Подстрока или шаблон
+        :param ignore_case: Поиск без учёта регистра
+        :return: Итератор найденных путей в порядке индекса
+        """
+        flags = re.IGNORECASE if ignore_case else 0
+        is_glob = any(char in GLOB_CHARS for char in pattern)
+
+        if is_glob:
+            regex = re.compile(os.fsencode(fnmatch.translate(pattern)), flags)
+            plain = GLOB_SET_REGEX.sub("*", pattern)
+            literal = max(
+                GLOB_LITERAL_REGEX.findall(plain), key=len, default=""
+            )
+        else:
+            regex = re.compile(re.escape(os.fsencode(pattern)), flags)
+            literal = pattern
+
+        key = os.fsencode(literal)
+        tail = key.rsplit(b"/", 1)[-1]
+        key_regex = re.compile(re.escape(key), flags) if key else None
+        tail_regex = re.compile(re.escape(tail), flags) if tail else None
+        names_only = not is_glob and b"/" not in key
+
+        for root in self.roots:
+            if self._matches(regex, os.fsencode(root), is_glob):
+                yield root
+
+        for directory, (_, _, block) in self.directories.items():
+            if not block:
+                continue
+
+            in_directory = (
+                key_regex is None or key_regex.search(directory) is not None
+            )
+            if (
+                not in_directory
+                and tail_regex is not None
+                and tail_regex.search(block) is None
+            ):
+                continue
+
+            names = self._names(block)
+            if in_directory and not is_glob:
+                matched = names
+            elif names_only:
+                matched = [name for name in names if regex.search(name)]
+            else:
+                matched = [
+                    name
+                    for name in names
+                    if self._matches(
+                        regex, os.path.join(directory, name), is_glob
+                    )
+                ]
+
+            for name in sorted(matched):
+                yield os.fsdecode(os.path.join(directory, name))
+
+    def _matches(self, regex: re.Pattern, path: bytes, is_glob: bool) -> bool:
+        """
+        :param regex: Скомпилированный шаблон или подстрока
+        :param path: Полный путь
+        :param is_glob: Шаблон должен совпасть со всем путём
+        :return: True, если путь подходит
+        """
+        if is_glob:
+            return regex.match(path) is not None
+        return regex.search(path) is not None
+
+    def _scan(self, directory: bytes, mtime_ns: int) -> DirectoryRecord:
+        """
+        Читает директорию. Если она изменена только что, время
+        изменения не сохраняется, чтобы при следующем обновлении
+        директория была перечитана
+        :param directory: Путь к директории
+        :param mtime_ns: Время изменения директории
+        :return: Время изменения, количество поддиректорий и имена
+        :raises OSError: Если директорию невозможно прочитать
+        """
+        subdirectories: list[bytes] = []
+        files: list[bytes] = []
+        with os.scandir(directory) as iterator:
+            for entry in iterator:
+                try:
+                    is_directory = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    is_directory = False
+                (subdirectories if is_directory else files).append(entry.name)
+
+        if time.time_ns() - mtime_ns < RACY_INTERVAL_NS:
+            mtime_ns = 0
+
+        names = sorted(subdirectories) + sorted(files)
+        return mtime_ns, len(subdirectories), b"\0".join(names)
+
+    def _names(self, block: bytes) -> list[bytes]:
+        """
+        :param block: Имена директории через нулевой байт
+        :return: Список имён
+        """
+        return block.split(b"\0") if block else []
+
+    def _shared_prefix(self, previous: bytes, path: bytes) -> int:
+        """
+        :param previous: Предыдущий путь
+        :param path: Текущий путь
+        :return: Длина общего префикса
+        """
+        limit = min(len(previous), len(path))
+        index = 0
+        while index < limit and previous[index] == path[index]:
+            index += 1
+        return index
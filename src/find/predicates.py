@@ -0,0 +1,343 @@
+import fnmatch
+import os
+import re
+import stat
+import time
+from collections.abc import Callable
+
+from src.utils.dir_cache import DirectoryEntry
+from src.utils.errors import ExpressionSyntaxError
+
+COST_ENTRY = 0
+COST_STAT = 1
+
+OR_TOKENS = ("-o", "-or")
+AND_TOKENS = ("-a", "-and")
+NOT_TOKENS = ("!", "-not")
+
+SIZE_UNITS = {"c": 1, "w": 2, "b": 512, "k": 1024, "M": 1 << 20, "G": 1 << 30}
+SIZE_REGEX = re.compile(r"([+-]?)(\d+)([cwbkMG]?)")
+NUMBER_REGEX = re.compile(r"([+-]?)(\d+)")
+SECONDS_PER_DAY = 86400
+
+
+class PathEntry:
+    """
+    Стартовый путь find с тем же интерфейсом, что и os.DirEntry.
+    lstat выполняется один раз при создании
+    """
+
+    def __init__(self, path: str, name: str) -> None:
+        """
+        :param path: Абсолютный путь
+        :param name: Имя для проверки -name
+        :raises OSError: Если путь недоступен
+        """
+        self.name = name
+        self.path = path
+        self._lstat = os.lstat(path)
+
+    def is_dir(self, follow_symlinks: bool = True) -> bool:
+        """
+        :param follow_symlinks: Раскрывать символические ссылки
+        :return: True, если путь — директория
+        """
+        return stat.S_ISDIR(self.stat(follow_symlinks).st_mode)
+
+    def is_file(self, follow_symlinks: bool = True) -> bool:
+        """
+        :param follow_symlinks: Раскрывать символические ссылки
+        :return: True, если путь — обычный файл
+        """
+        return stat.S_ISREG(self.stat(follow_symlinks).st_mode)
+
+    def is_symlink(self) -> bool:
+        """
+        :return: True, если путь — символическая ссылка
+        """
+        return stat.S_ISLNK(self._lstat.st_mode)
+
+    def inode(self) -> int:
+        """
+        :return: Номер inode
+        """
+        return self._lstat.st_ino
+
+    def stat(self, follow_symlinks: bool = True) -> os.stat_result:
+        """
+        :param follow_symlinks: Раскрывать символические ссылки
+        :return: Результат stat
+        """
+        if follow_symlinks and self.is_symlink():
+            return os.stat(self.path)
+        return self._lstat
+
+
+FindEntry = DirectoryEntry | PathEntry
+Predicate = Callable[[FindEntry], bool]
+Node = tuple[Predicate, int, bool]
+
+
+class FindExpression:
+    """
+    Выражение find, скомпилированное в одну функцию проверки записи.
+    Поддерживаются -name, -iname, -type, -size, -mtime, -prune,
+    скобки, -not (!), -and (-a или подряд) и -or (-o).
+    Имя и тип берутся из записи scandir, stat выполняется только
+    для -size и -mtime. В цепочке -and без -prune дешёвые проверки
+    переставляются вперёд, поэтому stat выполняется только для записей,
+    прошедших проверки имени и типа
+    """
+
+    def __init__(self, tokens: list[str], now: float | None = None) -> None:
+        """
+        Разбирает и компилирует выражение
+        :param tokens: Части выражения
+        :param now: Время отсчёта для -mtime в секундах,
+            по умолчанию текущее
+        :raises ExpressionSyntaxError: Если выражение некорректно
+        """
+        self._tokens = tokens
+        self._position = 0
+        self._now = time.time() if now is None else now
+        self.pruned = False
+
+        if not tokens:
+            self.match: Predicate = lambda entry: True
+            return
+
+        predicate, _, _ = self._parse_or()
+        if self._position < len(tokens):
+            raise ExpressionSyntaxError(
+                f"Неожиданная часть выражения: {tokens[self._position]}"
+            )
+
+        self.match = predicate
+
+    def _peek(self) -> str | None:
+        """
+        :return: Текущая часть выражения или None в конце
+        """
+        if self._position < len(self._tokens):
+            return self._tokens[self._position]
+        return None
+
+    def _next(self, expected: str) -> str:
+        """
+        Забирает текущую часть выражения
+        :param expected: Описание ожидаемого значения для ошибки
+        :return: Часть выражения
+        :raises ExpressionSyntaxError: Если выражение закончилось
+        """
+        token = self._peek()
+        if token is None:
+            raise ExpressionSyntaxError(f"Ожидалось {expected}")
+
+        self._position += 1
+        return token
+
+    def _parse_or(self) -> Node:
+        """
+        Разбирает цепочку -or
+        :return: Функция проверки, стоимость и наличие -prune
+        """
+        left, cost, prunes = self._parse_and()
+        while self._peek() in OR_TOKENS:
+            self._position += 1
+            right, right_cost, right_prunes = self._parse_and()
+            left = self._either(left, right)
+            cost = max(cost, right_cost)
+            prunes = prunes or right_prunes
+
+        return left, cost, prunes
+
+    def _parse_and(self) -> Node:
+        """
+        Разбирает цепочку -and, в том числе неявную.
+        Если в цепочке нет -prune, проверки упорядочиваются
+        по стоимости: результат от порядка не зависит
+        :return: Функция проверки, стоимость и наличие -prune
+        """
+        operands = [self._parse_not()]
+        while True:
+            token = self._peek()
+            if token is None or token in OR_TOKENS or token == ")":
+                break
+            if token in AND_TOKENS:
+                self._position += 1
+            operands.append(self._parse_not())
+
+        prunes = any(operand[2] for operand in operands)
+        if not prunes:
+            operands.sort(key=lambda operand: operand[1])
+
+        predicate = operands[-1][0]
+        for operand in reversed(operands[:-1]):
+            predicate = self._both(operand[0], predicate)
+
+        cost = max(operand[1] for operand in operands)
+        return predicate, cost, prunes
+
+    def _parse_not(self) -> Node:
+        """
+        Разбирает отрицание
+        :return: Функция проверки, стоимость и наличие -prune
+        """
+        if self._peek() in NOT_TOKENS:
+            self._position += 1
+            predicate, cost, prunes = self._parse_not()
+            return (lambda entry: not predicate(entry)), cost, prunes
+
+        return self._parse_primary()
+
+    def _parse_primary(self) -> Node:
+        """
+        Разбирает скобки или отдельную проверку
+        :return: Функция проверки, стоимость и наличие -prune
+        :raises ExpressionSyntaxError: Если проверка неизвестна
+        """
+        token = self._next("выражение")
+        if token == "(":
+            node = self._parse_or()
+            if self._next("')'") != ")":
+                raise ExpressionSyntaxError("Ожидалось ')'")
+            return node
+
+        if token == "-prune":
+            return self._prune, COST_ENTRY, True
+        if token in ("-name", "-iname"):
+            return self._name(self._next(f"шаблон для {token}"), token)
+        if token == "-type":
+            return self._type(self._next("тип для -type"))
+        if token == "-size":
+            return self._size(self._next("размер для -size"))
+        if token == "-mtime":
+            return self._mtime(self._next("число дней для -mtime"))
+
+        raise ExpressionSyntaxError(f"Неизвестная часть выражения: {token}")
+
+    def _either(self, left: Predicate, right: Predicate) -> Predicate:
+        """
+        :return: Функция проверки left -or right
+        """
+        return lambda entry: left(entry) or right(entry)
+
+    def _both(self, left: Predicate, right: Predicate) -> Predicate:
+        """
+        :return: Функция проверки left -and right
+        """
+        return lambda entry: left(entry) and right(entry)
+
+    def _prune(self, entry: FindEntry) -> bool:
+        """
+        Запрещает спуск в текущую директорию
+        :param entry: Запись директории
+        :return: Всегда True
+        """
+        self.pruned = True
+        return True
+
+    def _name(self, pattern: str, token: str) -> Node:
+        """
+        Компилирует проверку имени по шаблону fnmatch
+        :param pattern: Шаблон имени
+        :param token: -name или -iname (без учёта регистра)
+        :return: Функция проверки, стоимость и наличие -prune
+        """
+        flags = re.IGNORECASE if token == "-iname" else 0
+        regex = re.compile(fnmatch.translate(pattern), flags)
+        return (
+            lambda entry: regex.match(entry.name) is not None,
+            COST_ENTRY,
+            False,
+        )
+
+    def _type(self, kind: str) -> Node:
+        """
+        Компилирует проверку типа записи без раскрытия ссылок
+        :param kind: f — файл, d — директория, l — символическая ссылка
+        :return: Функция проверки, стоимость и наличие -prune
+        :raises ExpressionSyntaxError: Если тип неизвестен
+        """
+        predicates: dict[str, Predicate] = {
+            "f": lambda entry: entry.is_file(follow_symlinks=False),
+            "d": lambda entry: entry.is_dir(follow_symlinks=False),
+            "l": lambda entry: entry.is_symlink(),
+        }
+        if kind not in predicates:
+            raise ExpressionSyntaxError(f"Неизвестный тип для -type: {kind}")
+
+        return predicates[kind], COST_ENTRY, False
+
+    def _size(self, value: str) -> Node:
+        """
+        Компилирует проверку размера. Размер округляется вверх
+        до единиц: c — байты, w — 2 байта, b — 512 байт (по умолчанию),
+        k, M, G — КиБ, МиБ, ГиБ. +N — больше N, -N — меньше N
+        :param value: Размер со знаком и единицей
+        :return: Функция проверки, стоимость и наличие -prune
+        :raises ExpressionSyntaxError: Если размер некорректен
+        """
+        match = SIZE_REGEX.fullmatch(value)
+        if match is None:
+            raise ExpressionSyntaxError(f"Некорректный размер: {value}")
+
+        sign, number, unit = match.groups()
+        unit_size = SIZE_UNITS[unit or "b"]
+        compare = self._comparison(sign, int(number))
+
+        def predicate(entry: FindEntry) -> bool:
+            stats = self._stat(entry)
+            if stats is None:
+                return False
+            return compare(-(-stats.st_size // unit_size))
+
+        return predicate, COST_STAT, False
+
+    def _mtime(self, value: str) -> Node:
+        """
+        Компилирует проверку возраста в сутках с отбрасыванием дробной
+        части. +N — старше N суток, -N — моложе N суток
+        :param value: Число суток со знаком
+        :return: Функция проверки, стоимость и наличие -prune
+        :raises ExpressionSyntaxError: Если число некорректно
+        """
+        match = NUMBER_REGEX.fullmatch(value)
+        if match is None:
+            raise ExpressionSyntaxError(f"Некорректное число дней: {value}")
+
+        sign, number = match.groups()
+        compare = self._comparison(sign, int(number))
+        now = self._now
+
+        def predicate(entry: FindEntry) -> bool:
+            stats = self._stat(entry)
+            if stats is None:
+                return False
+            return compare(int((now - stats.st_mtime) // SECONDS_PER_DAY))
+
+        return predicate, COST_STAT, False
+
+    def _comparison(self, sign: str, number: int) -> Callable[[int], bool]:
+        """
+        :param sign: +, - или пустая строка
+        :param number: Число для сравнения
+        :return: Функция сравнения значения с числом
+        """
+        if sign == "+":
+            return lambda value: value > number
+        if sign == "-":
+            return lambda value: value < number
+        return lambda value: value == number
+
+    def _stat(self, entry: FindEntry) -> os.stat_result | None:
+        """
+        Возвращает stat записи без раскрытия ссылок.
+        Результат кэшируется в самой записи
+        :param entry: Запись директории
+        :return: Результат stat или None, если запись уже удалена
+        """
+        try:
+            return entry.stat(follow_symlinks=False)
+        except OSError:
+            return None
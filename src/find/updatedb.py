@@ -0,0 +1,54 @@
+import argparse
+import os
+
+from src.filesystem.base_command import BaseClass
+from src.find.locate_index import LocateIndex
+from src.utils.errors import SearchIndexError
+
+
+class Updatedb(BaseClass):
+    """
+    Класс для построения и обновления индекса имён файлов locate
+    """
+
+    def __init__(self) -> None:
+        """
+        Инициализация команды с путём к файлу индекса
+        """
+        self._index_path = os.path.join(os.getcwd(), "src/history/.locate_db")
+
+    def execute(self, tokens: argparse.Namespace) -> None:
+        """
+        Индексирует директории. Без путей обновляются ранее
+        проиндексированные корни. Перечитываются только директории,
+        время изменения которых изменилось с прошлого обновления
+        :param tokens: Аргументы команды (пути к директориям)
+        :raises SearchIndexError: Если пути не указаны и индекс не построен
+        :raises ShellError: При ошибке доступа к директории
+        """
+        index = LocateIndex(self._index_path)
+        if index.exists():
+            try:
+                index.load()
+            except (OSError, ValueError):
+                index = LocateIndex(self._index_path)
+
+        roots = [self._abs_path(path) for path in tokens.paths]
+        roots = roots or list(index.roots)
+        if not roots:
+            raise SearchIndexError(
+                "Индекс не построен, укажите директории для updatedb"
+            )
+
+        for root in roots:
+            root = os.path.normpath(root)
+            self._path_exists(root)
+            self._is_directory(root)
+
+            directories, rescanned, entries = index.update(root)
+            print(
+                f"{root}: директорий {directories}, "
+                f"перечитано {rescanned}, записей {entries}"
+            )
+
+        index.save()
@@ -0,0 +1,98 @@
+import tarfile
+import zipfile
+import zlib
+from collections.abc import Iterator
+from typing import IO
+
+from src.utils.errors import ArchiveError
+
+ZIP_SUFFIXES = (".zip",)
+TAR_SUFFIXES = (".tar", ".tar.gz", ".tgz")
+MEMBER_READ_ERRORS = (
+    zipfile.BadZipFile,
+    tarfile.TarError,
+    zlib.error,
+    EOFError,
+)
+MEMBER_OPEN_ERRORS = (zipfile.BadZipFile, RuntimeError, NotImplementedError)
+
+
+class ArchiveReader:
+    """
+    Потоковое чтение файлов внутри zip и tar архивов.
+    Файлы архива не распаковываются на диск,
+    а отдаются как потоки байтов по одному.
+    Ошибки чтения отдельного файла (неверная контрольная сумма,
+    повреждённые сжатые данные) возникают при чтении его потока
+    и входят в MEMBER_READ_ERRORS
+    """
+
+    def __init__(self, archive_path: str) -> None:
+        """
+        Инициализация по пути к архиву
+        :param archive_path: Путь к zip или tar архиву
+        """
+        self.archive_path = archive_path
+        self.skipped_members: list[tuple[str, str]] = []
+
+    @classmethod
+    def is_archive(cls, path: str) -> bool:
+        """
+        Проверяет, является ли файл архивом, по расширению
+        :param path: Путь к файлу
+        :return: True, если файл — zip или tar архив
+        """
+        name = path.lower()
+        return name.endswith(ZIP_SUFFIXES + TAR_SUFFIXES)
+
+    def members(self) -> Iterator[tuple[str, IO[bytes]]]:
+        """
+        Перебирает обычные файлы архива в порядке их записи.
+        Поток каждого файла действителен до перехода к следующему.
+        Файлы, которые невозможно открыть (зашифрованные или сжатые
+        неподдерживаемым методом), пропускаются и добавляются
+        в skipped_members вместе с причиной
+        :return: Итератор имён файлов внутри архива и их потоков
+        :raises ArchiveError: Если архив повреждён
+        """
+        try:
+            if self.archive_path.lower().endswith(ZIP_SUFFIXES):
+                yield from self._zip_members()
+            else:
+                yield from self._tar_members()
+        except (zipfile.BadZipFile, tarfile.TarError, EOFError):
+            raise ArchiveError(
+                f"Архив {self.archive_path} повреждён"
+            ) from None
+
+    def _zip_members(self) -> Iterator[tuple[str, IO[bytes]]]:
+        """
+        Перебирает файлы zip архива
+        :return: Итератор имён файлов и их потоков
+        """
+        with zipfile.ZipFile(self.archive_path, "r") as zip_file:
+            for info in zip_file.infolist():
+                if info.is_dir():
+                    continue
+                try:
+                    stream = zip_file.open(info)
+                except MEMBER_OPEN_ERRORS as error:
+                    self.skipped_members.append((info.filename, str(error)))
+                    continue
+                with stream:
+                    yield info.filename, stream
+
+    def _tar_members(self) -> Iterator[tuple[str, IO[bytes]]]:
+        """
+        Перебирает файлы tar архива, в том числе сжатого gzip
+        :return: Итератор имён файлов и их потоков
+        """
+        with tarfile.open(self.archive_path, "r:*") as tar:
+            for member in tar:
+                if not member.isfile():
+                    continue
+                stream = tar.extractfile(member)
+                if stream is None:
+                    continue
+                with stream:
+                    yield member.name, stream
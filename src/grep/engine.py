@@ -0,0 +1,754 @@
+import codecs
+import mmap
+import os
+import re
+from collections import deque
+from collections.abc import Iterator
+from itertools import islice
+from typing import IO
+
+from src.grep.matchers import (
+    AhoCorasickMatcher,
+    Buffer,
+    LiteralMatcher,
+    RegexMatcher,
+)
+from src.utils.errors import BinaryFileError, InvalidFileError
+
+Matcher = RegexMatcher | LiteralMatcher | AhoCorasickMatcher
+REGEX_SPECIAL = frozenset(".^$*+?{}[]\\|()")
+TEXT_ONLY_ESCAPES = frozenset("wWbBdDsSxuUNnr")
+INLINE_FLAGS = frozenset("aiLmsux-")
+COUNT_CHUNK_SIZE = 1 << 24
+BINARY_SNIFF_SIZE = 8192
+STREAM_CHUNK_SIZE = 1 << 20
+ASCII_BYTES = bytes(range(128))
+LITERAL_AUTOMATON_THRESHOLD = 40
+LITERAL_AUTOMATON_THRESHOLD_IGNORE_CASE = 14
+
+
+class SearchEngine:
+    """
+    Движок поиска по файлу.
+    Фиксированные строки ищутся поиском подстроки, альтернативой
+    в байтовом выражении или автоматом Ахо-Корасик, паттерны,
+    одинаково работающие для байтов и строк, —
+    байтовым выражением. В этих случаях файл отображается в память
+    и поиск идёт по всему буферу, иначе файл читается построчно как текст.
+    Файлы с нулевым байтом в первом блоке считаются двоичными
+    и не просматриваются.
+    При любом способе поиска файл читается в первой кодировке,
+    в которой декодируется вся его прочитанная часть — до последней
+    нужной совпавшей строки или до конца, — иначе файл пропускается.
+    Поэтому результат не зависит от того, ищется паттерн по байтам
+    или как текст, и одинаков для вывода строк, -c и -l
+    """
+
+    def __init__(
+        self,
+        regex: re.Pattern | None = None,
+        literals: list[str] | None = None,
+        ignore_case: bool = False,
+        encodings: list[str] | None = None,
+    ) -> None:
+        """
+        Инициализация движка по выражению или по списку фиксированных строк
+        :param regex: Регулярное выражение для поиска
+        :param literals: Фиксированные строки для поиска
+        :param ignore_case: Флаг игнорирования регистра для строк
+        :param encodings: Кодировки файлов в порядке попыток
+        """
+        self.regex = regex
+        self.literals = literals
+        self.ignore_case = ignore_case
+        self.encodings = encodings or ["utf-8"]
+        self.matcher: Matcher | None = None
+        self._utf8_only = all(
+            codecs.lookup(encoding).name == "utf-8"
+            for encoding in self.encodings
+        )
+        self._ascii_compatible = {
+            encoding
+            for encoding in self.encodings
+            if self._is_ascii_compatible(encoding)
+        }
+
+        if literals is not None:
+            self._setup_literals(literals)
+        elif regex is not None:
+            self.ignore_case = bool(regex.flags & re.IGNORECASE)
+            self._setup_regex(regex)
+
+    def search_file(
+        self, file_path: str, max_count: int | None = None
+    ) -> list[tuple[int, str]]:
+        """
+        Ищет совпадения в файле.
+        Чтение файла прекращается после max_count совпавших строк
+        :param file_path: Путь к файлу для поиска
+        :param max_count: Максимальное количество совпавших строк
+        :return: Номера и текст совпавших строк
+        :raises BinaryFileError: Если файл двоичный
+        :raises InvalidFileError: Если файл не читается ни в одной кодировке
+        :raises OSError: Если файл невозможно открыть
+        """
+        with open(file_path, "rb") as file:
+            self._check_binary(file.read(BINARY_SNIFF_SIZE), file_path)
+
+            if self.matcher is not None:
+                if not os.fstat(file.fileno()).st_size:
+                    return []
+                with self._map_file(file) as buffer:
+                    spans = list(
+                        islice(
+                            self._matched_lines(buffer, self.matcher),
+                            max_count,
+                        )
+                    )
+                    last_end = spans[-1][1] if spans else 0
+                    encoding = self._buffer_encoding(
+                        buffer,
+                        self._read_end(
+                            buffer, len(spans), last_end, max_count
+                        ),
+                        file_path,
+                    )
+                    return self._format_lines(buffer, spans, encoding)
+
+            if self.regex is not None:
+                return self._search_text(
+                    file, file_path, self.regex, max_count
+                )
+
+        return []
+
+    def count_file(self, file_path: str, max_count: int | None = None) -> int:
+        """
+        Считает совпавшие строки файла без их нумерации.
+        Подсчёт прекращается после max_count строк, поэтому
+        при max_count=1 файл читается только до первого совпадения.
+        Прочитанная часть проверяется на кодировку так же,
+        как при выводе строк
+        :param file_path: Путь к файлу для поиска
+        :param max_count: Максимальное количество совпавших строк
+        :return: Количество совпавших строк
+        :raises BinaryFileError: Если файл двоичный
+        :raises InvalidFileError: Если файл не читается ни в одной кодировке
+        :raises OSError: Если файл невозможно открыть
+        """
+        with open(file_path, "rb") as file:
+            self._check_binary(file.read(BINARY_SNIFF_SIZE), file_path)
+
+            if self.matcher is not None:
+                if not os.fstat(file.fileno()).st_size:
+                    return 0
+                with self._map_file(file) as buffer:
+                    count = 0
+                    last_end = 0
+                    for _, end in islice(
+                        self._matched_lines(buffer, self.matcher), max_count
+                    ):
+                        count += 1
+                        last_end = end
+                    self._buffer_encoding(
+                        buffer,
+                        self._read_end(buffer, count, last_end, max_count),
+                        file_path,
+                    )
+                    return count
+
+            if self.regex is not None:
+                return len(
+                    self._search_text(file, file_path, self.regex, max_count)
+                )
+
+        return 0
+
+    def search_stream(
+        self, stream: IO[bytes], name: str, max_count: int | None = None
+    ) -> list[tuple[int, str]]:
+        """
+        Ищет совпадения в потоке, например в файле внутри архива.
+        Поток читается блоками, не отображаясь в память
+        и не сохраняясь на диск
+        :param stream: Поток байтов, поддерживающий seek
+        :param name: Имя потока для сообщений об ошибках
+        :param max_count: Максимальное количество совпавших строк
+        :return: Номера и текст совпавших строк
+        :raises BinaryFileError: Если содержимое двоичное
+        :raises InvalidFileError: Если содержимое не читается
+            ни в одной кодировке
+        """
+        head = stream.read(BINARY_SNIFF_SIZE)
+        self._check_binary(head, name)
+
+        if self.matcher is not None:
+            encodings = list(self.encodings)
+            lines = list(
+                islice(
+                    self._stream_lines(
+                        stream, head, self.matcher, encodings, name
+                    ),
+                    max_count,
+                )
+            )
+            return [
+                (line_number, line.decode(encodings[0]).rstrip())
+                for line_number, line in lines
+            ]
+
+        if self.regex is not None:
+            return self._search_text(stream, name, self.regex, max_count)
+
+        return []
+
+    def count_stream(
+        self, stream: IO[bytes], name: str, max_count: int | None = None
+    ) -> int:
+        """
+        Считает совпавшие строки потока без их декодирования.
+        Прочитанная часть проверяется на кодировку так же,
+        как при выводе строк
+        :param stream: Поток байтов, поддерживающий seek
+        :param name: Имя потока для сообщений об ошибках
+        :param max_count: Максимальное количество совпавших строк
+        :return: Количество совпавших строк
+        :raises BinaryFileError: Если содержимое двоичное
+        :raises InvalidFileError: Если содержимое не читается
+            ни в одной кодировке
+        """
+        head = stream.read(BINARY_SNIFF_SIZE)
+        self._check_binary(head, name)
+
+        if self.matcher is not None:
+            lines = self._stream_lines(
+                stream, head, self.matcher, list(self.encodings), name
+            )
+            return sum(1 for _ in islice(lines, max_count))
+
+        if self.regex is not None:
+            return len(self._search_text(stream, name, self.regex, max_count))
+
+        return 0
+
+    def context_file(
+        self,
+        file_path: str,
+        before: int,
+        after: int,
+        max_count: int | None = None,
+    ) -> list[tuple[int, str, bool]]:
+        """
+        Ищет совпадения в файле вместе со строками контекста
+        :param file_path: Путь к файлу для поиска
+        :param before: Количество строк контекста до совпадения
+        :param after: Количество строк контекста после совпадения
+        :param max_count: Максимальное количество совпавших строк
+        :return: Номер, текст и признак совпадения для каждой строки вывода
+        :raises BinaryFileError: Если файл двоичный
+        :raises InvalidFileError: Если файл не читается ни в одной кодировке
+        :raises OSError: Если файл невозможно открыть
+        """
+        with open(file_path, "rb") as file:
+            return self.context_stream(
+                file, file_path, before, after, max_count
+            )
+
+    def context_stream(
+        self,
+        stream: IO[bytes],
+        name: str,
+        before: int,
+        after: int,
+        max_count: int | None = None,
+    ) -> list[tuple[int, str, bool]]:
+        """
+        Ищет совпадения в потоке вместе со строками контекста.
+        Поток читается построчно один раз: предыдущие строки хранятся
+        в кольцевом буфере на before строк, а после совпадения
+        выводятся ещё after строк, поэтому память не зависит от размера
+        файла. Кодировки пробуются по очереди с начала потока
+        :param stream: Поток байтов, поддерживающий seek
+        :param name: Путь к файлу или имя потока
+        :param before: Количество строк контекста до совпадения
+        :param after: Количество строк контекста после совпадения
+        :param max_count: Максимальное количество совпавших строк
+        :return: Номер, текст и признак совпадения для каждой строки вывода
+        :raises BinaryFileError: Если содержимое двоичное
+        :raises InvalidFileError: Если содержимое не читается
+            ни в одной кодировке
+        """
+        self._check_binary(stream.read(BINARY_SNIFF_SIZE), name)
+
+        if self.matcher is None and self.regex is None:
+            return []
+
+        for encoding in self.encodings:
+            stream.seek(0)
+            try:
+                return self._collect_context(
+                    self._marked_lines(stream, encoding),
+                    before,
+                    after,
+                    max_count,
+                )
+            except UnicodeDecodeError:
+                continue
+
+        raise InvalidFileError(f"Файл {name} невозможно прочитать")
+
+    def _marked_lines(
+        self, stream: IO[bytes], encoding: str
+    ) -> Iterator[tuple[bool, str]]:
+        """
+        Декодирует строки потока и отмечает совпавшие.
+        С байтовым способом поиска совпадение ищется в байтах строки
+        :param stream: Поток байтов
+        :param encoding: Кодировка потока
+        :return: Итератор признака совпадения и текста строки
+        :raises UnicodeDecodeError: Если строка не декодируется
+        """
+        matcher = self.matcher
+        regex = self.regex
+        for raw in stream:
+            line = raw.decode(encoding)
+            if matcher is not None:
+                yield matcher.search(raw, 0, len(raw)) is not None, line
+            else:
+                yield regex is not None and bool(regex.search(line)), line
+
+    def _collect_context(
+        self,
+        marked: Iterator[tuple[bool, str]],
+        before: int,
+        after: int,
+        max_count: int | None,
+    ) -> list[tuple[int, str, bool]]:
+        """
+        Отбирает совпавшие строки и строки контекста вокруг них
+        :param marked: Строки с признаком совпадения по порядку
+        :param before: Количество строк контекста до совпадения
+        :param after: Количество строк контекста после совпадения
+        :param max_count: Максимальное количество совпавших строк
+        :return: Номер, текст и признак совпадения для каждой строки вывода
+        """
+        result: list[tuple[int, str, bool]] = []
+        previous: deque[tuple[int, str]] = deque(maxlen=before)
+        trailing = 0
+        found = 0
+
+        for line_number, (is_match, line) in enumerate(marked, start=1):
+            if is_match and found != max_count:
+                result.extend(
+                    (number, text.rstrip(), False) for number, text in previous
+                )
+                previous.clear()
+                result.append((line_number, line.rstrip(), True))
+                found += 1
+                trailing = after
+            elif trailing:
+                result.append((line_number, line.rstrip(), False))
+                trailing -= 1
+            elif found == max_count:
+                break
+            else:
+                previous.append((line_number, line))
+
+        return result
+
+    def _check_binary(self, head: bytes, name: str) -> None:
+        """
+        Проверяет первый блок содержимого на нулевой байт
+        :param head: Первый блок содержимого
+        :param name: Путь к файлу или имя потока
+        :raises BinaryFileError: Если содержимое двоичное
+        """
+        if b"\0" in head:
+            raise BinaryFileError(f"Двоичный файл: {name}")
+
+    def _setup_regex(self, regex: re.Pattern) -> None:
+        """
+        Выбирает способ поиска для регулярного выражения.
+        Паттерны не из ASCII при кодировках, отличных от UTF-8,
+        ищутся как текст, потому что их байты зависят от кодировки
+        :param regex: Регулярное выражение для поиска
+        """
+        pattern = regex.pattern
+        if not self._utf8_only and not pattern.isascii():
+            return
+
+        if not self.ignore_case and pattern and self._is_literal(pattern):
+            self.matcher = LiteralMatcher(pattern.encode("utf-8"))
+        elif self._is_byte_safe(pattern):
+            flags = re.MULTILINE | (regex.flags & re.IGNORECASE)
+            self.matcher = RegexMatcher(re.compile(pattern.encode(), flags))
+
+    def _setup_literals(self, literals: list[str]) -> None:
+        """
+        Выбирает способ поиска для списка фиксированных строк.
+        Небольшой набор строк быстрее ищется альтернативой в байтовом
+        regex, автомат Ахо-Корасик выгоднее, начиная
+        с LITERAL_AUTOMATON_THRESHOLD строк (без учёта регистра —
+        с LITERAL_AUTOMATON_THRESHOLD_IGNORE_CASE), см.
+        benchmarks/grep_literals.py.
+        Без учёта регистра автомат работает только с ASCII,
+        поэтому остальные строки ищутся альтернативой в regex по тексту.
+        Так же ищутся строки не из ASCII, если файлы могут быть
+        не в UTF-8
+        :param literals: Фиксированные строки для поиска
+        """
+        ascii_only = all(literal.isascii() for literal in literals)
+        if not ascii_only and (self.ignore_case or not self._utf8_only):
+            self.regex = re.compile(
+                "|".join(re.escape(literal) for literal in literals),
+                re.IGNORECASE if self.ignore_case else 0,
+            )
+            return
+
+        encoded = [literal.encode("utf-8") for literal in literals]
+        threshold = (
+            LITERAL_AUTOMATON_THRESHOLD_IGNORE_CASE
+            if self.ignore_case
+            else LITERAL_AUTOMATON_THRESHOLD
+        )
+        if len(encoded) == 1 and not self.ignore_case:
+            self.matcher = LiteralMatcher(encoded[0])
+        elif 0 < len(encoded) < threshold:
+            self.matcher = RegexMatcher(
+                re.compile(
+                    b"|".join(re.escape(literal) for literal in encoded),
+                    re.IGNORECASE if self.ignore_case else 0,
+                )
+            )
+        else:
+            self.matcher = AhoCorasickMatcher(encoded, self.ignore_case)
+
+    def _map_file(self, file: IO[bytes]) -> mmap.mmap:
+        """
+        Отображает непустой файл в память для последовательного чтения
+        :param file: Открытый на чтение файл
+        :return: Отображение файла
+        """
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            buffer.madvise(mmap.MADV_SEQUENTIAL)
+        return buffer
+
+    def _stream_lines(
+        self,
+        stream: IO[bytes],
+        head: bytes,
+        matcher: Matcher,
+        encodings: list[str],
+        name: str,
+    ) -> Iterator[tuple[int, bytes]]:
+        """
+        Лениво находит совпавшие строки в потоке.
+        Поток читается блоками, неполная последняя строка блока
+        переносится в следующий, поэтому совпадения не теряются на стыках.
+        Перед выдачей строки всё прочитанное до её конца проверяется
+        на кодировку: из encodings удаляются кодировки, в которых
+        оно не декодируется, первая оставшаяся — кодировка потока
+        :param stream: Поток байтов
+        :param head: Уже прочитанное начало потока
+        :param matcher: Способ поиска по байтам
+        :param encodings: Кодировки, ещё подходящие для потока
+        :param name: Имя потока для сообщений об ошибках
+        :return: Итератор номеров и байтов совпавших строк
+        :raises InvalidFileError: Если поток не читается
+            ни в одной кодировке
+        """
+        decoders = [
+            (encoding, codecs.getincrementaldecoder(encoding)())
+            for encoding in encodings
+        ]
+        line_number = 1
+        tail = head
+
+        while True:
+            chunk = stream.read(STREAM_CHUNK_SIZE)
+            data = tail + chunk
+            cut = data.rfind(b"\n") + 1 if chunk else len(data)
+            block, tail = data[:cut], data[cut:]
+
+            counted_to = 0
+            checked_to = 0
+            for start, end in self._matched_lines(block, matcher):
+                line_number += block.count(b"\n", counted_to, start)
+                counted_to = start
+                self._narrow_encodings(
+                    encodings, decoders, block[checked_to : end + 1], name
+                )
+                checked_to = end + 1
+                yield line_number, block[start:end]
+            line_number += block.count(b"\n", counted_to)
+            self._narrow_encodings(
+                encodings, decoders, block[checked_to:], name, not chunk
+            )
+
+            if not chunk:
+                return
+
+    def _narrow_encodings(
+        self,
+        encodings: list[str],
+        decoders: list[tuple[str, codecs.IncrementalDecoder]],
+        data: bytes,
+        name: str,
+        final: bool = False,
+    ) -> None:
+        """
+        Удаляет кодировки, в которых очередная часть потока
+        не декодируется
+        :param encodings: Кодировки, ещё подходящие для потока
+        :param decoders: Декодеры этих кодировок в том же порядке
+        :param data: Очередная часть потока
+        :param name: Имя потока для сообщений об ошибках
+        :param final: Часть — конец потока
+        :raises InvalidFileError: Если не осталось ни одной кодировки
+        """
+        for index in reversed(range(len(encodings))):
+            try:
+                self._check_decodes(*decoders[index], data, final)
+            except UnicodeDecodeError:
+                del encodings[index]
+                del decoders[index]
+
+        if not encodings:
+            raise InvalidFileError(f"Файл {name} невозможно прочитать")
+
+    def _matched_lines(
+        self, buffer: Buffer, matcher: Matcher
+    ) -> Iterator[tuple[int, int]]:
+        """
+        Лениво находит границы совпавших строк в буфере.
+        Следующее совпадение ищется только по запросу,
+        поэтому остановка перебора прекращает чтение файла
+        :param buffer: Содержимое файла
+        :param matcher: Способ поиска по байтам
+        :return: Итератор начала и конца совпавших строк
+        """
+        size = len(buffer)
+        position = 0
+
+        while position < size:
+            found = matcher.search(buffer, position, size)
+            if found is None:
+                return
+
+            match_start, match_end = found
+            start = buffer.rfind(b"\n", 0, match_start) + 1
+            end = buffer.find(b"\n", match_start)
+            if end == -1:
+                end = size
+
+            position = end + 1
+            if match_end > end and matcher.search(buffer, start, end) is None:
+                continue
+
+            yield start, end
+
+    def _format_lines(
+        self,
+        buffer: mmap.mmap,
+        spans: list[tuple[int, int]],
+        encoding: str,
+    ) -> list[tuple[int, str]]:
+        """
+        Нумерует и декодирует совпавшие строки.
+        Переводы строк считаются только между совпадениями
+        :param buffer: Содержимое файла
+        :param spans: Начало и конец совпавших строк по порядку
+        :param encoding: Кодировка файла
+        :return: Номера и текст совпавших строк
+        """
+        matches = []
+        line_number = 1
+        counted_to = 0
+
+        for start, end in spans:
+            line_number += self._count_lines(buffer, counted_to, start)
+            counted_to = start
+
+            line = buffer[start:end].decode(encoding)
+            matches.append((line_number, line.rstrip()))
+
+        return matches
+
+    def _search_text(
+        self,
+        stream: IO[bytes],
+        name: str,
+        regex: re.Pattern,
+        max_count: int | None,
+    ) -> list[tuple[int, str]]:
+        """
+        Ищет совпадения, читая поток построчно как текст.
+        Кодировки пробуются по очереди с начала потока: строки
+        декодируются по одной, пока поток не прочитается целиком
+        или не наберётся max_count совпавших строк
+        :param stream: Поток байтов, поддерживающий seek
+        :param name: Путь к файлу или имя потока
+        :param regex: Регулярное выражение
+        :param max_count: Максимальное количество совпавших строк
+        :return: Номера и текст совпавших строк
+        :raises InvalidFileError: Если поток не читается ни в одной кодировке
+        """
+        for encoding in self.encodings:
+            matches = []
+            stream.seek(0)
+            try:
+                for line_number, raw in enumerate(stream, start=1):
+                    line = raw.decode(encoding)
+                    if not regex.search(line):
+                        continue
+                    matches.append((line_number, line.rstrip()))
+                    if len(matches) == max_count:
+                        break
+            except UnicodeDecodeError:
+                continue
+
+            return matches
+
+        raise InvalidFileError(f"Файл {name} невозможно прочитать")
+
+    def _read_end(
+        self,
+        buffer: mmap.mmap,
+        found: int,
+        last_end: int,
+        max_count: int | None,
+    ) -> int:
+        """
+        Определяет, до какого места файл читается при поиске:
+        до конца строки max_count-го совпадения или до конца файла
+        :param buffer: Содержимое файла
+        :param found: Количество найденных совпавших строк
+        :param last_end: Конец последней найденной строки
+        :param max_count: Максимальное количество совпавших строк
+        :return: Позиция конца прочитанной части
+        """
+        if found and found == max_count:
+            return min(last_end + 1, len(buffer))
+        return len(buffer)
+
+    def _buffer_encoding(self, buffer: mmap.mmap, end: int, name: str) -> str:
+        """
+        Выбирает первую кодировку, в которой декодируется
+        начало файла до end
+        :param buffer: Содержимое файла
+        :param end: Конец прочитанной части
+        :param name: Путь к файлу для сообщений об ошибках
+        :return: Кодировка файла
+        :raises InvalidFileError: Если часть файла не декодируется
+            ни в одной кодировке
+        """
+        for encoding in self.encodings:
+            decoder = codecs.getincrementaldecoder(encoding)()
+            try:
+                for chunk_start in range(0, end, COUNT_CHUNK_SIZE):
+                    chunk_end = min(chunk_start + COUNT_CHUNK_SIZE, end)
+                    self._check_decodes(
+                        encoding, decoder, buffer[chunk_start:chunk_end]
+                    )
+                self._check_decodes(encoding, decoder, b"", end == len(buffer))
+            except UnicodeDecodeError:
+                continue
+            return encoding
+
+        raise InvalidFileError(f"Файл {name} невозможно прочитать")
+
+    def _check_decodes(
+        self,
+        encoding: str,
+        decoder: codecs.IncrementalDecoder,
+        data: bytes,
+        final: bool = False,
+    ) -> None:
+        """
+        Проверяет, что очередная часть данных декодируется.
+        Часть только из ASCII в совместимой с ASCII кодировке
+        декодируется всегда, если перед ней нет незавершённого
+        символа, поэтому она не декодируется, а только проверяется
+        :param encoding: Кодировка декодера
+        :param decoder: Инкрементальный декодер
+        :param data: Очередная часть данных
+        :param final: Часть — конец данных
+        :raises UnicodeDecodeError: Если часть не декодируется
+        """
+        if not (
+            encoding in self._ascii_compatible
+            and data.isascii()
+            and not decoder.getstate()[0]
+        ):
+            decoder.decode(data)
+        if final:
+            decoder.decode(b"", True)
+
+    def _is_ascii_compatible(self, encoding: str) -> bool:
+        """
+        :param encoding: Кодировка
+        :return: True, если символы ASCII кодируются в ней как в ASCII
+        """
+        try:
+            return ASCII_BYTES.decode(encoding) == ASCII_BYTES.decode("ascii")
+        except UnicodeDecodeError:
+            return False
+
+    def _count_lines(self, buffer: mmap.mmap, start: int, end: int) -> int:
+        """
+        Считает переводы строк в части буфера, не копируя её целиком
+        :param buffer: Содержимое файла
+        :param start: Начало части
+        :param end: Конец части
+        :return: Количество переводов строк
+        """
+        count = 0
+        for chunk_start in range(start, end, COUNT_CHUNK_SIZE):
+            chunk_end = min(chunk_start + COUNT_CHUNK_SIZE, end)
+            count += buffer[chunk_start:chunk_end].count(b"\n")
+
+        return count
+
+    def _is_literal(self, pattern: str) -> bool:
+        """
+        Проверяет, что паттерн не содержит специальных символов regex
+        :param pattern: Исходный паттерн
+        :return: True, если паттерн — фиксированная строка
+        """
+        return not any(char in REGEX_SPECIAL for char in pattern)
+
+    def _is_byte_safe(self, pattern: str) -> bool:
+        """
+        Проверяет, совпадает ли смысл паттерна для байтов и для строк.
+        Точка, конец строки, отрицательные классы, юникодные классы
+        и встроенные флаги в байтах работают иначе,
+        поэтому такие паттерны ищутся как текст
+        :param pattern: Исходный паттерн
+        :return: True, если паттерн можно искать по байтам
+        """
+        if not pattern.isascii():
+            return False
+
+        index = 0
+        while index < len(pattern):
+            char = pattern[index]
+            following = pattern[index + 1 : index + 2]
+            flag = pattern[index + 2 : index + 3]
+
+            if char == "\\":
+                if following in TEXT_ONLY_ESCAPES:
+                    return False
+                index += 2
+                continue
+
+            if char in ".$":
+                return False
+            if char == "[" and following == "^":
+                return False
+            if char == "(" and following == "?" and flag in INLINE_FLAGS:
+                return False
+
+            index += 1
+
+        return True
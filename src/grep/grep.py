@@ -1,13 +1,44 @@
 import argparse
+import codecs
+import copy
+import logging
 import os
 import re
+from collections import Counter, deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import IO
 
 from src.filesystem.base_command import BaseClass
+from src.grep.archive_reader import MEMBER_READ_ERRORS, ArchiveReader
+from src.grep.engine import SearchEngine
+from src.grep.result_cache import ResultCache
+from src.grep.trigram_index import TrigramIndex
 from src.utils.errors import (
+    ArchiveError,
+    BinaryFileError,
     InvalidFileError,
     NotAFileError,
     RegualarVerbError,
 )
+from src.utils.logger import Logger
+from src.utils.path_filter import PathFilter
+
+SKIPPED_BINARY = "двоичных файлов"
+SKIPPED_ENCODING = "файлов в неизвестной кодировке"
+SKIPPED_UNREADABLE = "недоступных файлов"
+SKIPPED_DIRECTORY = "недоступных директорий"
+SKIPPED_ARCHIVE = "повреждённых архивов"
+SKIPPED_ARCHIVE_MEMBER = "повреждённых файлов в архивах"
+
+OUTPUT_LINES = "lines"
+OUTPUT_MATCHING = "files_with_matches"
+OUTPUT_NON_MATCHING = "files_without_match"
+OUTPUT_COUNT = "count"
+GROUP_SEPARATOR = "--"
+ASCII_SAMPLE = "".join(chr(code) for code in range(32, 127))
+
+CacheSlot = tuple[str, int]
 
 
 class Grep(BaseClass):
@@ -15,6 +46,24 @@ class Grep(BaseClass):
     Класс для поиска текста по регулярному выражению в файлах
     """
 
+    def __init__(self) -> None:
+        """
+        Инициализация команды поиска с путями к триграммному индексу
+        и к кэшу результатов
+        """
+        self._index_path = os.path.join(os.getcwd(), "src/history/.grep_index")
+        self._cache_path = os.path.join(os.getcwd(), "src/history/.grep_cache")
+        self._cache: ResultCache | None = None
+        self._search_key = ""
+        self._skipped: Counter[str] = Counter()
+        self._output = OUTPUT_LINES
+        self._max_count: int | None = None
+        self._path_filter: PathFilter | None = None
+        self._archives = False
+        self._before = 0
+        self._after = 0
+        self._printed = False
+
     def execute(self, tokens: argparse.Namespace) -> None:
         """
         Выполняет поиск по паттерну в файлах и директориях
@@ -23,65 +72,602 @@ class Grep(BaseClass):
         """
         ignore_case = tokens.ignore_case or tokens.ri
         recursive = tokens.recursive or tokens.ri
-        regex = self._is_correct_regular(tokens, ignore_case)
-        paths = tokens.paths if tokens.paths else [os.getcwd()]
+        jobs = getattr(tokens, "jobs", 1)
+        patterns_file = getattr(tokens, "patterns_file", None)
+        encodings = getattr(tokens, "encodings", None)
+
+        if patterns_file:
+            literals = self._read_patterns(patterns_file)
+            engine = SearchEngine(
+                literals=literals,
+                ignore_case=ignore_case,
+                encodings=encodings,
+            )
+            paths = tokens.pattern + tokens.paths
+        else:
+            regex = self._is_correct_regular(tokens, ignore_case)
+            engine = SearchEngine(regex, encodings=encodings)
+            paths = tokens.paths
+        if not paths:
+            paths = [os.getcwd()]
 
-        self._grep_paths(paths, regex, recursive, ignore_case)
+        self._output = self._output_mode(tokens)
+        self._max_count = getattr(tokens, "max_count", None)
+        self._path_filter = self._build_path_filter(tokens)
+        self._archives = getattr(tokens, "archives", False)
+        self._before, self._after = self._context_size(tokens)
+        self._printed = False
+        self._skipped.clear()
+
+        self._cache = None
+        if getattr(tokens, "cache", False):
+            self._cache = ResultCache(self._cache_path)
+            self._cache.load()
+            self._search_key = self._describe_search(engine)
+
+        try:
+            self._grep_paths(paths, engine, recursive, jobs)
+        finally:
+            if self._cache is not None:
+                self._cache.save()
+
+        self._print_skipped()
+        if self._cache is not None:
+            Logger.cache_summary("grep", self._cache.hits, self._cache.misses)
+
+    def _describe_search(self, engine: SearchEngine) -> str:
+        """
+        Строит ключ кэша по паттерну и всем флагам,
+        от которых зависит вывод для файла
+        :param engine: Движок поиска
+        :return: Ключ описания поиска
+        """
+        return ResultCache.search_key(
+            [
+                engine.regex.pattern if engine.regex is not None else None,
+                engine.literals,
+                engine.ignore_case,
+                engine.encodings,
+                self._output,
+                self._max_count,
+                self._archives,
+                self._before,
+                self._after,
+            ]
+        )
+
+    def _output_mode(self, tokens: argparse.Namespace) -> str:
+        """
+        Определяет формат вывода по флагам -l, -L и -c
+        :param tokens: Аргументы команды
+        :return: Формат вывода
+        """
+        if getattr(tokens, "files_with_matches", False):
+            return OUTPUT_MATCHING
+        if getattr(tokens, "files_without_match", False):
+            return OUTPUT_NON_MATCHING
+        if getattr(tokens, "count", False):
+            return OUTPUT_COUNT
+        return OUTPUT_LINES
+
+    def _context_size(self, tokens: argparse.Namespace) -> tuple[int, int]:
+        """
+        Определяет количество строк контекста по флагам -A, -B и -C.
+        Флаги -A и -B имеют приоритет над -C
+        :param tokens: Аргументы команды
+        :return: Количество строк до и после совпадения
+        """
+        context = getattr(tokens, "context", None)
+        before = getattr(tokens, "before_context", None)
+        after = getattr(tokens, "after_context", None)
+
+        return (
+            before if before is not None else context or 0,
+            after if after is not None else context or 0,
+        )
+
+    def _build_path_filter(
+        self, tokens: argparse.Namespace
+    ) -> PathFilter | None:
+        """
+        Собирает фильтр обхода из флагов --include, --exclude,
+        --exclude-dir и --ignore-file
+        :param tokens: Аргументы команды
+        :return: Фильтр путей или None, если фильтры не заданы
+        :raises ShellError: Если файл игнорирования не найден
+        """
+        include = getattr(tokens, "include", None)
+        exclude = getattr(tokens, "exclude", None)
+        exclude_dir = getattr(tokens, "exclude_dir", None)
+        ignore_files = getattr(tokens, "ignore_files", None)
+
+        if not (include or exclude or exclude_dir or ignore_files):
+            return None
+
+        ignore_paths = [self._abs_path(path) for path in ignore_files or []]
+        for ignore_path in ignore_paths:
+            self._path_exists(ignore_path)
+            self._is_file(ignore_path)
+
+        return PathFilter(include, exclude, exclude_dir, ignore_paths)
+
+    def _read_patterns(self, patterns_file: str) -> list[str]:
+        """
+        Читает фиксированные строки для поиска, по одной на строку файла.
+        Пустые строки пропускаются
+        :param patterns_file: Путь к файлу со строками
+        :return: Список строк для поиска
+        :raises ShellError: Если файл не найден или невозможно прочитать
+        """
+        abs_path = self._abs_path(patterns_file)
+        self._path_exists(abs_path)
+        self._is_file(abs_path)
+
+        try:
+            with open(abs_path, "r", encoding="utf-8") as file:
+                return [line.rstrip("\r\n") for line in file if line.strip()]
+        except UnicodeDecodeError:
+            raise InvalidFileError(
+                f"Файл {abs_path} невозможно прочитать"
+            ) from None
 
     def _grep_paths(
         self,
         paths: list,
-        regex: re.Pattern,
+        engine: SearchEngine,
         recursive: bool,
-        ignore_case: bool,
+        jobs: int,
+    ) -> None:
+        """
+        Обрабатывает список путей для поиска.
+        При jobs > 1 файлы ищутся в пуле процессов, потому что поиск
+        по байтам не отпускает GIL и в потоках не распараллеливается.
+        Вывод каждого файла печатается одним блоком в порядке обхода,
+        кэш результатов читается и пополняется только в основном процессе.
+        Индекс не применяется для -L и -c, потому что по ним
+        выводятся и файлы без совпадений
+        :param paths: Список путей к файлам или директориям
+        :param engine: Движок поиска
+        :param recursive: Флаг рекурсивного поиска
+        :param jobs: Количество процессов для поиска
+        """
+        files = self._walk_files(paths, recursive)
+        if self._output in (OUTPUT_LINES, OUTPUT_MATCHING):
+            files = self._narrow_by_index(files, engine)
+
+        single_file = len(paths) == 1 and os.path.isfile(
+            self._abs_path(paths[0])
+        )
+        if jobs <= 1 or single_file:
+            for file_path in files:
+                self._report(self._find_coincidence(file_path, engine))
+            return
+
+        worker = copy.copy(self)
+        worker._cache = None
+        worker._skipped = Counter()
+
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_search_worker,
+            initargs=(worker, engine),
+        ) as executor:
+            pending: deque[tuple[str, CacheSlot | None, Future]] = deque()
+            for file_path in files:
+                slot, cached = self._cached_result(file_path)
+                if cached is None:
+                    future = executor.submit(_search_in_worker, file_path)
+                else:
+                    future = Future()
+                    future.set_result(cached)
+                pending.append((file_path, slot, future))
+
+                if len(pending) >= jobs * 4:
+                    self._collect(*pending.popleft())
+
+            while pending:
+                self._collect(*pending.popleft())
+
+    def _collect(
+        self, file_path: str, slot: CacheSlot | None, future: Future
     ) -> None:
         """
-        Обрабатывает список путей для поиска
+        Дожидается результата поиска в файле, сохраняет его в кэш
+        и выводит
+        :param file_path: Путь к файлу
+        :param slot: Ключ кэша и время изменения файла для промаха
+            или None
+        :param future: Результат поиска в пуле процессов
+        """
+        result = future.result()
+        self._store_result(slot, file_path, result)
+        self._report(result)
+
+    def _walk_files(self, paths: list, recursive: bool) -> Iterator[str]:
+        """
+        Обходит пути и возвращает файлы для поиска в стабильном порядке
         :param paths: Список путей к файлам или директориям
-        :param regex: Регулярное выражение
         :param recursive: Флаг рекурсивного поиска
-        :param ignore_case: Флаг игнорирования регистра
+        :return: Итератор абсолютных путей к файлам
+        :raises NotAFileError: Если директория указана без флага -r
         """
         for path in paths:
             abs_path = self._abs_path(path)
             self._path_exists(abs_path)
 
             if os.path.isfile(abs_path):
-                self._find_coincidence(abs_path, regex, ignore_case)
-            elif os.path.isdir(abs_path):
-                if recursive:
-                    for item in os.listdir(abs_path):
-                        item_path = os.path.join(abs_path, item)
-                        self._grep_paths(
-                            [item_path], regex, recursive, ignore_case
-                        )
-                else:
-                    raise NotAFileError(f"{abs_path} не является файлом")
+                yield abs_path
+                continue
+
+            if not os.path.isdir(abs_path):
+                continue
+
+            if not recursive:
+                raise NotAFileError(f"{abs_path} не является файлом")
+
+            for entry in self._walk_tree(
+                abs_path, self._skip_directory, self._path_filter
+            ):
+                yield entry.path
+
+    def _skip_directory(self, error: OSError) -> None:
+        """
+        Учитывает директорию, которую невозможно прочитать при обходе
+        :param error: Ошибка чтения директории
+        """
+        logging.warning(f"Пропущена директория {error.filename}: {error}")
+        self._skipped[SKIPPED_DIRECTORY] += 1
+
+    def _narrow_by_index(
+        self, files: Iterator[str], engine: SearchEngine
+    ) -> Iterator[str]:
+        """
+        Отсеивает файлы, которые по триграммному индексу не могут
+        содержать совпадение. Без индекса, для паттернов,
+        не сводимых к триграммам, и для кодировок, в которых паттерн
+        записан иначе, чем в UTF-8, файлы не отсеиваются
+        :param files: Итератор путей к файлам
+        :param engine: Движок поиска
+        :return: Итератор путей к файлам-кандидатам
+        """
+        index = TrigramIndex(self._index_path)
+        if not index.exists() or not self._index_encoding_matches(engine):
+            return files
+
+        index.load()
+        file_ids = None
+        if engine.literals is not None:
+            file_ids = index.candidates_any(
+                engine.literals, engine.ignore_case
+            )
+        elif engine.regex is not None:
+            file_ids = index.candidates(engine.regex)
+
+        if file_ids is None:
+            return files
+
+        return (
+            file_path
+            for file_path in files
+            if self._is_searched_archive(file_path)
+            or self._may_match(index, file_path, file_ids)
+        )
+
+    def _index_encoding_matches(self, engine: SearchEngine) -> bool:
+        """
+        Проверяет, что триграммы паттерна в UTF-8, по которым построен
+        индекс, совпадают с байтами в файлах выбранных кодировок.
+        Для кодировок, совместимых с ASCII, это верно, пока паттерн
+        состоит из символов ASCII; UTF-16 и UTF-32 несовместимы всегда
+        :param engine: Движок поиска
+        :return: True, если индексом можно пользоваться
+        """
+        names = {codecs.lookup(name).name for name in engine.encodings}
+        if names == {"utf-8"}:
+            return True
+
+        for name in names:
+            if ASCII_SAMPLE.encode(name) != ASCII_SAMPLE.encode("ascii"):
+                return False
+
+        if engine.literals is not None:
+            texts = engine.literals
+        elif engine.regex is not None:
+            texts = [engine.regex.pattern]
+        else:
+            texts = []
+
+        return all(text.isascii() for text in texts)
+
+    def _is_searched_archive(self, file_path: str) -> bool:
+        """
+        Проверяет, нужно ли искать внутри файла как внутри архива
+        :param file_path: Путь к файлу
+        :return: True, если задан флаг -z и файл — архив
+        """
+        return self._archives and ArchiveReader.is_archive(file_path)
+
+    def _may_match(
+        self, index: TrigramIndex, file_path: str, file_ids: set[int]
+    ) -> bool:
+        """
+        Проверяет файл по индексу.
+        Если файл не удаётся проверить, он передаётся на поиск
+        :param index: Загруженный триграммный индекс
+        :param file_path: Путь к файлу
+        :param file_ids: Номера файлов-кандидатов
+        :return: True, если файл нужно просмотреть
+        """
+        try:
+            return index.may_match(file_path, os.stat(file_path), file_ids)
+        except OSError:
+            return True
+
+    def _report(self, result: tuple[list[str], list[str]]) -> None:
+        """
+        Выводит найденные в одном файле строки одним блоком
+        и учитывает пропущенные файлы
+        :param result: Строки вывода и причины пропуска файлов
+        """
+        lines, skip_reasons = result
+        self._skipped.update(skip_reasons)
+        if not lines:
+            return
+
+        if self._printed and self._has_context():
+            print(GROUP_SEPARATOR)
+        print("\n".join(lines))
+        self._printed = True
+
+    def _has_context(self) -> bool:
+        """
+        Проверяет, выводятся ли строки контекста
+        :return: True, если заданы -A, -B или -C для вывода строк
+        """
+        return self._output == OUTPUT_LINES and bool(
+            self._before or self._after
+        )
+
+    def _print_skipped(self) -> None:
+        """
+        Выводит сводку по пропущенным файлам и директориям
+        """
+        if not self._skipped:
+            return
+
+        details = ", ".join(
+            f"{reason}: {count}" for reason, count in self._skipped.items()
+        )
+        print(f"Пропущено {details}")
 
     def _find_coincidence(
-        self, file_path: str, regex: re.Pattern, ignore_case: bool
+        self, file_path: str, engine: SearchEngine
+    ) -> tuple[list[str], list[str]]:
+        """
+        Ищет совпадения в файле или, с флагом -z, в файлах архива.
+        С флагом --cache результат для неизменённого файла берётся
+        из кэша без открытия файла. В кэше строки хранятся без пути,
+        чтобы жёсткие ссылки на один файл выводились под своими именами.
+        Файлы, которые невозможно просмотреть, не прерывают поиск,
+        а возвращаются с причиной пропуска
+        :param file_path: Путь к файлу для поиска
+        :param engine: Движок поиска
+        :return: Строки вывода и причины пропуска файлов
+        """
+        slot, cached = self._cached_result(file_path)
+        if cached is not None:
+            return cached
+
+        result = self._search_file(file_path, engine)
+        self._store_result(slot, file_path, result)
+        return result
+
+    def _cached_result(
+        self, file_path: str
+    ) -> tuple[CacheSlot | None, tuple[list[str], list[str]] | None]:
+        """
+        Ищет результат для файла в кэше
+        :param file_path: Путь к файлу
+        :return: Ключ кэша и время изменения файла, если файл нужно
+            просмотреть и сохранить результат, и результат из кэша
+            или None
+        """
+        if self._cache is None:
+            return None, None
+
+        try:
+            stats = os.stat(file_path)
+        except OSError:
+            return None, None
+
+        key = ResultCache.file_key(self._search_key, stats)
+        cached = self._cache.get(key)
+        if cached is None:
+            return (key, stats.st_mtime_ns), None
+
+        return None, (
+            [
+                suffix if suffix == GROUP_SEPARATOR else f"{file_path}{suffix}"
+                for suffix in cached
+            ],
+            [],
+        )
+
+    def _store_result(
+        self,
+        slot: CacheSlot | None,
+        file_path: str,
+        result: tuple[list[str], list[str]],
     ) -> None:
         """
-        Ищет совпадения регулярного выражения в файле
+        Сохраняет в кэш результат файла, просмотренного без пропусков
+        :param slot: Ключ кэша и время изменения файла или None,
+            если сохранять не нужно
+        :param file_path: Путь к файлу
+        :param result: Строки вывода и причины пропуска файлов
+        """
+        lines, skip_reasons = result
+        if slot is None or self._cache is None or skip_reasons:
+            return
+
+        key, mtime_ns = slot
+        self._cache.put(
+            key, mtime_ns, [line.removeprefix(file_path) for line in lines]
+        )
+
+    def _search_file(
+        self, file_path: str, engine: SearchEngine
+    ) -> tuple[list[str], list[str]]:
+        """
+        Ищет совпадения в файле или в файлах архива
         :param file_path: Путь к файлу для поиска
-        :param regex: Регулярное выражение
-        :param ignore_case: Флаг игнорирования регистра
-        :raises InvalidFileError: Если файл невозможно прочитать
+        :param engine: Движок поиска
+        :return: Строки вывода и причины пропуска файлов
         """
+        if self._is_searched_archive(file_path):
+            return self._search_archive(file_path, engine)
+
+        return self._search_source(file_path, engine)
+
+    def _search_archive(
+        self, archive_path: str, engine: SearchEngine
+    ) -> tuple[list[str], list[str]]:
+        """
+        Ищет совпадения в файлах архива без распаковки на диск.
+        Файлы архива обозначаются как архив!путь/внутри.
+        Повреждённый, зашифрованный или сжатый неподдерживаемым методом
+        файл архива пропускается, и поиск продолжается со следующего
+        :param archive_path: Путь к архиву
+        :param engine: Движок поиска
+        :return: Строки вывода и причины пропуска файлов
+        """
+        lines: list[str] = []
+        skip_reasons: list[str] = []
+        reader = ArchiveReader(archive_path)
+
         try:
-            line_number = 1
-            with open(file_path, "r", encoding="utf-8") as file:
-                for line in file:
-                    search_line = line.lower() if ignore_case else line
+            for name, stream in reader.members():
+                label = f"{archive_path}!{name}"
+                try:
+                    member_lines, member_skipped = self._search_source(
+                        label, engine, stream
+                    )
+                except MEMBER_READ_ERRORS as message:
+                    logging.warning(f"Пропущен файл {label}: {message}")
+                    skip_reasons.append(SKIPPED_ARCHIVE_MEMBER)
+                    continue
 
-                    if regex.search(search_line):
-                        print(f"{file_path}:{line_number}:{line.rstrip()}")
+                if lines and member_lines and self._has_context():
+                    lines.append(GROUP_SEPARATOR)
+                lines.extend(member_lines)
+                skip_reasons.extend(member_skipped)
+        except (ArchiveError, OSError) as message:
+            logging.warning(f"Пропущен архив {archive_path}: {message}")
+            skip_reasons.append(SKIPPED_ARCHIVE)
 
-                    line_number += 1
-        except UnicodeDecodeError:
-            raise InvalidFileError(
-                f"Файл {file_path} невозможно прочитать"
-            ) from None
+        for name, reason in reader.skipped_members:
+            logging.warning(f"Пропущен файл {archive_path}!{name}: {reason}")
+            skip_reasons.append(SKIPPED_ARCHIVE_MEMBER)
+
+        return lines, skip_reasons
+
+    def _search_source(
+        self,
+        label: str,
+        engine: SearchEngine,
+        stream: IO[bytes] | None = None,
+    ) -> tuple[list[str], list[str]]:
+        """
+        Ищет совпадения в файле или в потоке файла из архива
+        и переводит ошибки чтения в причины пропуска
+        :param label: Путь к файлу или обозначение файла в архиве
+        :param engine: Движок поиска
+        :param stream: Поток файла из архива или None для файла на диске
+        :return: Строки вывода и причины пропуска файла
+        """
+        try:
+            return self._search_output(label, engine, stream), []
+        except BinaryFileError:
+            return [], [SKIPPED_BINARY]
+        except InvalidFileError as message:
+            logging.warning(f"Пропущен файл {label}: {message}")
+            return [], [SKIPPED_ENCODING]
+        except OSError as message:
+            logging.warning(f"Пропущен файл {label}: {message}")
+            return [], [SKIPPED_UNREADABLE]
+
+    def _search_output(
+        self,
+        label: str,
+        engine: SearchEngine,
+        stream: IO[bytes] | None = None,
+    ) -> list[str]:
+        """
+        Ищет в файле столько, сколько нужно для выбранного вывода.
+        Для -c, -l и -L строки не нумеруются и не декодируются,
+        но файл читается и проверяется на кодировку до того же места,
+        что и при выводе строк, поэтому пропускаются те же файлы
+        :param label: Путь к файлу или обозначение файла в архиве
+        :param engine: Движок поиска
+        :param stream: Поток файла из архива или None для файла на диске
+        :return: Строки вывода для файла
+        """
+        if self._has_context():
+            return self._context_output(label, engine, stream)
+
+        if self._output == OUTPUT_LINES:
+            if stream is None:
+                matches = engine.search_file(label, self._max_count)
+            else:
+                matches = engine.search_stream(stream, label, self._max_count)
+            return [f"{label}:{number}:{line}" for number, line in matches]
+
+        if stream is None:
+            count = engine.count_file(label, self._max_count)
+        else:
+            count = engine.count_stream(stream, label, self._max_count)
+
+        if self._output == OUTPUT_COUNT:
+            return [f"{label}:{count}"]
+
+        listed = (count > 0) == (self._output == OUTPUT_MATCHING)
+        return [label] if listed else []
+
+    def _context_output(
+        self,
+        label: str,
+        engine: SearchEngine,
+        stream: IO[bytes] | None = None,
+    ) -> list[str]:
+        """
+        Форматирует совпадения со строками контекста.
+        Совпавшие строки выводятся как путь:номер:строка, строки
+        контекста — как путь-номер-строка, а несмежные группы
+        разделяются строкой --
+        :param label: Путь к файлу или обозначение файла в архиве
+        :param engine: Движок поиска
+        :param stream: Поток файла из архива или None для файла на диске
+        :return: Строки вывода для файла
+        """
+        if stream is None:
+            found = engine.context_file(
+                label, self._before, self._after, self._max_count
+            )
+        else:
+            found = engine.context_stream(
+                stream, label, self._before, self._after, self._max_count
+            )
+
+        lines = []
+        previous_number = None
+        for number, line, is_match in found:
+            if previous_number is not None and number != previous_number + 1:
+                lines.append(GROUP_SEPARATOR)
+            separator = ":" if is_match else "-"
+            lines.append(f"{label}{separator}{number}{separator}{line}")
+            previous_number = number
+
+        return lines
 
     def _is_correct_regular(
         self, tokens: argparse.Namespace, ignore_case: bool
@@ -90,8 +676,12 @@ class Grep(BaseClass):
         Компилирует регулярное выражение с учётом флагов
         :param tokens: Аргументы команды (паттерн)
         :return: Скомпилированное регулярное выражение
-        :raises RegualarVerbError: Неверное регулярное выражение
+        :raises RegualarVerbError: Неверное или не указанное
+            регулярное выражение
         """
+        if not tokens.pattern:
+            raise RegualarVerbError("Не указано регулярное выражение")
+
         try:
             regex = "".join(tokens.pattern[0])
             compiled_regex = (
@@ -104,3 +694,26 @@ class Grep(BaseClass):
             raise RegualarVerbError(
                 "Неккоректное регулярное выражение"
             ) from None
+
+
+_worker_state: dict[str, tuple[Grep, SearchEngine]] = {}
+
+
+def _init_search_worker(grep: Grep, engine: SearchEngine) -> None:
+    """
+    Сохраняет настроенную команду и движок поиска в процессе пула,
+    чтобы не передавать их с каждым файлом
+    :param grep: Копия команды с флагами вывода, без кэша
+    :param engine: Движок поиска
+    """
+    _worker_state["search"] = (grep, engine)
+
+
+def _search_in_worker(file_path: str) -> tuple[list[str], list[str]]:
+    """
+    Ищет совпадения в файле в процессе пула
+    :param file_path: Путь к файлу для поиска
+    :return: Строки вывода и причины пропуска файлов
+    """
+    grep, engine = _worker_state["search"]
+    return grep._search_file(file_path, engine)
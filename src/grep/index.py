@@ -0,0 +1,51 @@
+import argparse
+import os
+
+from src.filesystem.base_command import BaseClass
+from src.grep.trigram_index import TrigramIndex
+from src.utils.errors import SearchIndexError
+
+
+class Index(BaseClass):
+    """
+    Класс для построения и обновления триграммного индекса grep
+    """
+
+    def __init__(self) -> None:
+        """
+        Инициализация команды с путём к файлу индекса
+        """
+        self._index_path = os.path.join(os.getcwd(), "src/history/.grep_index")
+
+    def execute(self, tokens: argparse.Namespace) -> None:
+        """
+        Строит индекс для директорий или обновляет изменённые файлы
+        :param tokens: Аргументы команды (действие и пути к директориям)
+        :raises SearchIndexError: Если индекс для обновления не построен
+        :raises ShellError: При ошибке обхода директорий
+        """
+        index = TrigramIndex(self._index_path)
+        if index.exists():
+            index.load()
+
+        if tokens.action == "build":
+            self._is_tokens(tokens)
+            roots = [self._abs_path(path) for path in tokens.paths]
+        else:
+            if not index.exists():
+                raise SearchIndexError(
+                    "Индекс не построен, выполните index build"
+                )
+            roots = [self._abs_path(path) for path in tokens.paths]
+            roots = roots or list(index.roots)
+
+        for root in roots:
+            self._path_exists(root)
+            self._is_directory(root)
+
+            indexed, removed = index.update(
+                root, self._walk_tree(root), tokens.action == "build"
+            )
+            print(f"{root}: проиндексировано {indexed}, удалено {removed}")
+
+        index.save()
@@ -0,0 +1,161 @@
+import mmap
+import re
+from collections import deque
+
+Buffer = bytes | mmap.mmap
+SCAN_CHUNK_SIZE = 1 << 16
+
+
+class RegexMatcher:
+    """
+    Поиск байтового регулярного выражения
+    """
+
+    def __init__(self, regex: re.Pattern[bytes]) -> None:
+        """
+        Инициализация по скомпилированному байтовому выражению
+        :param regex: Байтовое регулярное выражение
+        """
+        self.regex = regex
+
+    def search(
+        self, buffer: Buffer, position: int, endpos: int
+    ) -> tuple[int, int] | None:
+        """
+        Ищет первое совпадение в части буфера
+        :param buffer: Содержимое файла
+        :param position: Начало поиска
+        :param endpos: Конец поиска
+        :return: Начало и конец совпадения или None
+        """
+        match = self.regex.search(buffer, position, endpos)
+        if match is None:
+            return None
+
+        return match.start(), match.end()
+
+
+class LiteralMatcher:
+    """
+    Поиск фиксированной строки без регулярных выражений.
+    Используется встроенный поиск подстроки,
+    работающий по алгоритму Бойера-Мура-Хорспула
+    """
+
+    def __init__(self, literal: bytes) -> None:
+        """
+        Инициализация по искомой строке
+        :param literal: Искомая строка в байтах
+        """
+        self.literal = literal
+
+    def search(
+        self, buffer: Buffer, position: int, endpos: int
+    ) -> tuple[int, int] | None:
+        """
+        Ищет первое вхождение строки в части буфера
+        :param buffer: Содержимое файла
+        :param position: Начало поиска
+        :param endpos: Конец поиска
+        :return: Начало и конец вхождения или None
+        """
+        start = buffer.find(self.literal, position, endpos)
+        if start == -1:
+            return None
+
+        return start, start + len(self.literal)
+
+
+class AhoCorasickMatcher:
+    """
+    Поиск множества фиксированных строк за один проход
+    автоматом Ахо-Корасик. Время поиска не зависит
+    от количества строк, в отличие от альтернативы в regex,
+    но на небольших наборах строк автомат медленнее её
+    """
+
+    def __init__(self, literals: list[bytes], ignore_case: bool) -> None:
+        """
+        Строит автомат по списку строк
+        :param literals: Искомые строки в байтах
+        :param ignore_case: Не учитывать регистр ASCII
+        """
+        goto: list[dict[int, int]] = [{}]
+        lengths = [0]
+
+        for literal in literals:
+            state = 0
+            for byte in literal.lower() if ignore_case else literal:
+                if byte not in goto[state]:
+                    goto.append({})
+                    lengths.append(0)
+                    goto[state][byte] = len(goto) - 1
+                state = goto[state][byte]
+            lengths[state] = len(literal)
+
+        self._root = goto[0]
+        self._lengths = lengths
+        self._transitions = self._build_transitions(goto)
+
+        if ignore_case:
+            for transitions in [self._root, *self._transitions]:
+                lowercase = [byte for byte in transitions if 97 <= byte <= 122]
+                for byte in lowercase:
+                    transitions[byte - 32] = transitions[byte]
+
+    def search(
+        self, buffer: Buffer, position: int, endpos: int
+    ) -> tuple[int, int] | None:
+        """
+        Ищет первое вхождение любой из строк в части буфера
+        :param buffer: Содержимое файла
+        :param position: Начало поиска
+        :param endpos: Конец поиска
+        :return: Начало и конец вхождения или None
+        """
+        root = self._root
+        transitions = self._transitions
+        lengths = self._lengths
+        state = 0
+
+        for chunk_start in range(position, endpos, SCAN_CHUNK_SIZE):
+            chunk_end = min(chunk_start + SCAN_CHUNK_SIZE, endpos)
+            for offset, byte in enumerate(buffer[chunk_start:chunk_end]):
+                target = transitions[state].get(byte)
+                state = root.get(byte, 0) if target is None else target
+                if lengths[state]:
+                    end = chunk_start + offset + 1
+                    return end - lengths[state], end
+
+        return None
+
+    def _build_transitions(
+        self, goto: list[dict[int, int]]
+    ) -> list[dict[int, int]]:
+        """
+        Достраивает переходы автомата по суффиксным ссылкам.
+        Переходы, совпадающие с переходами из корня, не хранятся,
+        чтобы автомат занимал меньше памяти
+        :param goto: Переходы бора
+        :return: Переходы автомата для каждого состояния
+        """
+        transitions: list[dict[int, int]] = [{} for _ in goto]
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            if fail[state]:
+                transitions[state].update(transitions[fail[state]])
+                if not self._lengths[state]:
+                    self._lengths[state] = self._lengths[fail[state]]
+            transitions[state].update(goto[state])
+
+            for byte, child in goto[state].items():
+                target = transitions[fail[state]].get(byte)
+                if target is None:
+                    target = goto[0].get(byte, 0)
+                fail[child] = target
+                queue.append(child)
+
+        return transitions
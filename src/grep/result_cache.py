@@ -0,0 +1,131 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_CACHE_BYTES = 16 << 20
+RACY_INTERVAL_NS = 2_000_000_000
+
+
+class ResultCache:
+    """
+    Постоянный кэш результатов grep по отдельным файлам.
+    Ключ состоит из описания поиска (паттерн и флаги) и идентичности
+    файла: устройства, inode, размера и времени изменения.
+    Записи вытесняются по давности использования, а размер файла кэша
+    на диске ограничен
+    """
+
+    def __init__(
+        self, cache_path: str, max_bytes: int = DEFAULT_CACHE_BYTES
+    ) -> None:
+        """
+        Инициализация пустого кэша
+        :param cache_path: Путь к файлу кэша на диске
+        :param max_bytes: Максимальный размер файла кэша в байтах
+        """
+        self.cache_path = cache_path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, list[str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def search_key(cls, description: list) -> str:
+        """
+        Строит короткий ключ описания поиска
+        :param description: Паттерн и флаги, влияющие на результат
+        :return: Хэш описания
+        """
+        data = json.dumps(description, ensure_ascii=False)
+        return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def file_key(cls, search_key: str, stats: os.stat_result) -> str:
+        """
+        Строит ключ результата для файла
+        :param search_key: Ключ описания поиска
+        :param stats: Результат stat для файла
+        :return: Ключ записи кэша
+        """
+        return (
+            f"{search_key}:{stats.st_dev}:{stats.st_ino}:"
+            f"{stats.st_size}:{stats.st_mtime_ns}"
+        )
+
+    def load(self) -> None:
+        """
+        Загружает кэш с диска. Повреждённый файл кэша не считается
+        ошибкой, кэш просто начинается заново
+        """
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return
+
+        self._entries = OrderedDict(
+            (key, lines) for key, lines in data.get("entries", [])
+        )
+
+    def save(self) -> None:
+        """
+        Вытесняет давно не использованные записи сверх лимита размера
+        и атомарно сохраняет кэш на диск
+        """
+        with self._lock:
+            entries = list(self._entries.items())
+
+        kept: list[tuple[str, list[str]]] = []
+        size = 0
+        for key, lines in reversed(entries):
+            entry_size = len(json.dumps([key, lines], ensure_ascii=False))
+            if size + entry_size > self.max_bytes:
+                break
+            kept.append((key, lines))
+            size += entry_size
+        kept.reverse()
+
+        with self._lock:
+            self._entries = OrderedDict(kept)
+
+        temp_path = f"{self.cache_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump({"entries": kept}, file, ensure_ascii=False)
+        os.replace(temp_path, self.cache_path)
+
+    def get(self, key: str) -> list[str] | None:
+        """
+        Возвращает сохранённый результат и отмечает его использование
+        :param key: Ключ записи
+        :return: Сохранённые строки или None при промахе
+        """
+        with self._lock:
+            lines = self._entries.get(key)
+            if lines is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return lines
+
+    def put(self, key: str, mtime_ns: int, lines: list[str]) -> None:
+        """
+        Сохраняет результат для файла.
+        Недавно изменённый файл не сохраняется: изменение в пределах
+        точности времени файловой системы не меняет ключ, и устаревший
+        результат выдавался бы из кэша
+        :param key: Ключ записи
+        :param mtime_ns: Время изменения файла
+        :param lines: Строки результата
+        """
+        if time.time_ns() - mtime_ns < RACY_INTERVAL_NS:
+            return
+
+        with self._lock:
+            self._entries[key] = lines
+            self._entries.move_to_end(key)
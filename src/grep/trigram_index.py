@@ -0,0 +1,367 @@
+import json
+import os
+import re
+from collections import defaultdict
+from collections.abc import Iterable
+
+from src.utils.dir_cache import DirectoryEntry
+
+TRIGRAM_REGEX = re.compile(rb"(?=(...))", re.DOTALL)
+INDEX_CHUNK_SIZE = 1 << 20
+QUANTIFIERS = frozenset("*?{")
+REPEAT_REGEX = re.compile(r"\{\d*(?:,\d*)?\}")
+ESCAPE_REGEX = re.compile(
+    r"\\(?:x[0-9a-fA-F]{2}|u[0-9a-fA-F]{4}|U[0-9a-fA-F]{8}|N\{[^}]*\}"
+    r"|0[0-7]{0,2}|[0-7]{3}|[1-9][0-9]?|.)",
+    re.DOTALL,
+)
+
+
+class TrigramIndex:
+    """
+    Постоянный триграммный индекс файлов для grep.
+    Для каждого файла хранятся размер, время изменения и номер,
+    а для каждой триграммы — номера файлов, в которых она встречается
+    """
+
+    def __init__(self, index_path: str) -> None:
+        """
+        Инициализация пустого индекса
+        :param index_path: Путь к файлу индекса на диске
+        """
+        self.index_path = index_path
+        self.roots: list[str] = []
+        self.files: dict[str, list[int]] = {}
+        self.postings: dict[str, list[int]] = {}
+        self.next_id = 0
+
+    def exists(self) -> bool:
+        """
+        Проверяет, построен ли индекс на диске
+        :return: True, если файл индекса существует
+        """
+        return os.path.isfile(self.index_path)
+
+    def load(self) -> None:
+        """
+        Загружает индекс с диска
+        """
+        with open(self.index_path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+
+        self.roots = data["roots"]
+        self.files = data["files"]
+        self.postings = data["postings"]
+        self.next_id = data["next_id"]
+
+    def save(self) -> None:
+        """
+        Атомарно сохраняет индекс на диск
+        """
+        data = {
+            "roots": self.roots,
+            "files": self.files,
+            "postings": self.postings,
+            "next_id": self.next_id,
+        }
+
+        temp_path = f"{self.index_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+        os.replace(temp_path, self.index_path)
+
+    def update(
+        self, root: str, entries: Iterable[DirectoryEntry], force: bool
+    ) -> tuple[int, int]:
+        """
+        Обновляет индекс для дерева директорий.
+        Перечитываются только новые и изменённые файлы,
+        удалённые файлы убираются из индекса
+        :param root: Корневая директория дерева
+        :param entries: Записи о файлах дерева
+        :param force: Перечитать все файлы, даже неизменённые
+        :return: Количество проиндексированных и удалённых файлов
+        """
+        if root not in self.roots:
+            self.roots.append(root)
+
+        indexed = 0
+        seen = set()
+        stale_ids = set()
+        new_postings: dict[str, list[int]] = defaultdict(list)
+
+        for entry in entries:
+            seen.add(entry.path)
+            stats = entry.stat()
+            known = self.files.get(entry.path)
+
+            if known is not None:
+                if not force and known[:2] == [
+                    stats.st_size,
+                    stats.st_mtime_ns,
+                ]:
+                    continue
+                stale_ids.add(known[2])
+                del self.files[entry.path]
+
+            try:
+                trigrams = self._file_trigrams(entry.path)
+            except OSError:
+                continue
+
+            file_id = self.next_id
+            self.next_id += 1
+            self.files[entry.path] = [
+                stats.st_size,
+                stats.st_mtime_ns,
+                file_id,
+            ]
+            for trigram in trigrams:
+                new_postings[trigram].append(file_id)
+            indexed += 1
+
+        prefix = os.path.join(root, "")
+        removed = [
+            path
+            for path in self.files
+            if path.startswith(prefix) and path not in seen
+        ]
+        for path in removed:
+            stale_ids.add(self.files.pop(path)[2])
+
+        self._merge_postings(new_postings, stale_ids)
+
+        return indexed, len(removed)
+
+    def candidates(self, regex: re.Pattern) -> set[int] | None:
+        """
+        Находит номера файлов, которые могут содержать совпадение
+        :param regex: Регулярное выражение поиска
+        :return: Номера файлов или None, если паттерн не сводится
+            к триграммам и нужен полный перебор
+        """
+        literals = self._required_literals(regex.pattern)
+        if literals is None:
+            return None
+
+        return self._intersect(literals, bool(regex.flags & re.IGNORECASE))
+
+    def candidates_any(
+        self, literals: list[str], ignore_case: bool
+    ) -> set[int] | None:
+        """
+        Находит номера файлов, которые могут содержать хотя бы одну
+        из фиксированных строк
+        :param literals: Фиксированные строки поиска
+        :param ignore_case: Флаг игнорирования регистра
+        :return: Номера файлов или None, если нужен полный перебор
+        """
+        file_ids: set[int] = set()
+        for literal in literals:
+            literal_ids = self._intersect([literal], ignore_case)
+            if literal_ids is None:
+                return None
+            file_ids |= literal_ids
+
+        return file_ids
+
+    def may_match(
+        self, path: str, stats: os.stat_result, file_ids: set[int]
+    ) -> bool:
+        """
+        Проверяет, нужно ли искать в файле.
+        Файлы вне индекса и изменённые после индексации ищутся всегда
+        :param path: Абсолютный путь к файлу
+        :param stats: Результат stat для файла
+        :param file_ids: Номера файлов-кандидатов
+        :return: True, если файл нужно просмотреть
+        """
+        known = self.files.get(path)
+        if known is None or known[:2] != [stats.st_size, stats.st_mtime_ns]:
+            return True
+
+        return known[2] in file_ids
+
+    def _intersect(
+        self, literals: list[str], ignore_case: bool
+    ) -> set[int] | None:
+        """
+        Пересекает списки файлов для триграмм всех подстрок
+        :param literals: Подстроки, обязательные для совпадения
+        :param ignore_case: Флаг игнорирования регистра
+        :return: Номера файлов или None, если триграмм нет
+        """
+        trigrams: set[str] = set()
+        for literal in literals:
+            if ignore_case and not literal.isascii():
+                continue
+            data = literal.encode("utf-8").lower()
+            trigrams.update(
+                data[index : index + 3].decode("latin-1")
+                for index in range(len(data) - 2)
+            )
+
+        if not trigrams:
+            return None
+
+        file_ids: set[int] | None = None
+        for trigram in sorted(
+            trigrams, key=lambda item: len(self.postings.get(item, []))
+        ):
+            posting = set(self.postings.get(trigram, []))
+            file_ids = posting if file_ids is None else file_ids & posting
+            if not file_ids:
+                break
+
+        return file_ids
+
+    def _merge_postings(
+        self, new_postings: dict[str, list[int]], stale_ids: set[int]
+    ) -> None:
+        """
+        Удаляет устаревшие номера файлов и добавляет новые
+        :param new_postings: Новые списки файлов по триграммам
+        :param stale_ids: Номера файлов, которые больше не актуальны
+        """
+        if stale_ids:
+            for trigram in list(self.postings):
+                posting = [
+                    file_id
+                    for file_id in self.postings[trigram]
+                    if file_id not in stale_ids
+                ]
+                if posting:
+                    self.postings[trigram] = posting
+                else:
+                    del self.postings[trigram]
+
+        for trigram, file_ids in new_postings.items():
+            self.postings.setdefault(trigram, []).extend(file_ids)
+
+    def _file_trigrams(self, path: str) -> set[str]:
+        """
+        Собирает триграммы файла без учёта регистра ASCII
+        :param path: Путь к файлу
+        :return: Множество триграмм
+        """
+        trigrams: set[bytes] = set()
+        tail = b""
+        with open(path, "rb") as file:
+            while chunk := file.read(INDEX_CHUNK_SIZE):
+                data = tail + chunk.lower()
+                trigrams.update(TRIGRAM_REGEX.findall(data))
+                tail = data[-2:]
+
+        return {trigram.decode("latin-1") for trigram in trigrams}
+
+    def _required_literals(self, pattern: str) -> list[str] | None:
+        """
+        Выделяет подстроки, которые обязаны быть в любом совпадении.
+        Экранированные последовательности из букв и цифр (\\d, \\x41,
+        \\101, \\N{...}) прерывают подстроку и пропускаются целиком
+        вместе с аргументом
+        :param pattern: Исходный паттерн
+        :return: Список подстрок или None, если паттерн не разобрать
+        """
+        literals: list[str] = []
+        groups: list[int] = []
+        run = ""
+        index = 0
+
+        while index < len(pattern):
+            char = pattern[index]
+            following = pattern[index + 1 : index + 2]
+
+            if char == "|":
+                return None
+
+            if char == "\\":
+                escape = ESCAPE_REGEX.match(pattern, index)
+                if escape is None or following.isalnum():
+                    literals.append(run)
+                    run = ""
+                else:
+                    run += following
+                index = escape.end() if escape else index + 1
+                continue
+
+            if char == "{" and "}" in pattern[index:]:
+                literals.append(run[:-1])
+                run = ""
+                index = pattern.index("}", index)
+            elif char in QUANTIFIERS:
+                literals.append(run[:-1])
+                run = ""
+            elif char == "+":
+                literals.append(run)
+                run = ""
+            elif char == "(":
+                prefix_end = self._group_prefix_end(pattern, index)
+                if prefix_end is None:
+                    return None
+                literals.append(run)
+                run = ""
+                groups.append(len(literals))
+                index = prefix_end
+            elif char == ")":
+                literals.append(run)
+                run = ""
+                start = groups.pop() if groups else 0
+                if following in QUANTIFIERS:
+                    del literals[start:]
+            elif char == "[":
+                literals.append(run)
+                run = ""
+                index = self._class_end(pattern, index)
+            elif char in ".^$":
+                literals.append(run)
+                run = ""
+            else:
+                run += char
+
+            index += 1
+
+        literals.append(run)
+        return [literal for literal in literals if len(literal) >= 3]
+
+    def _group_prefix_end(self, pattern: str, start: int) -> int | None:
+        """
+        Пропускает начало группы: (, (?: или (?P<имя>
+        :param pattern: Исходный паттерн
+        :param start: Позиция открывающей скобки группы
+        :return: Позиция последнего символа начала группы или None
+            для остальных конструкций (?...)
+        """
+        if pattern[start + 1 : start + 2] != "?":
+            return start
+        if pattern[start + 2 : start + 3] == ":":
+            return start + 2
+        if pattern[start + 2 : start + 4] == "P<" and ">" in pattern[start:]:
+            return pattern.index(">", start)
+
+        return None
+
+    def _class_end(self, pattern: str, start: int) -> int:
+        """
+        Находит конец символьного класса вместе с квантификатором после
+        него, в том числе полным повторением {m,n}
+        :param pattern: Исходный паттерн
+        :param start: Позиция открывающей скобки класса
+        :return: Позиция последнего символа класса или квантификатора
+        """
+        index = start + 1
+        if pattern[index : index + 1] == "^":
+            index += 1
+        if pattern[index : index + 1] == "]":
+            index += 1
+
+        while index < len(pattern) and pattern[index] != "]":
+            index += 2 if pattern[index] == "\\" else 1
+
+        repeat = REPEAT_REGEX.match(pattern, index + 1)
+        if repeat is not None:
+            return repeat.end() - 1
+        if pattern[index + 1 : index + 2] in ("*", "?"):
+            index += 1
+
+        return index
@@ -0,0 +1,245 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_MAX_ENTRIES = 200_000
+RACY_INTERVAL_NS = 2_000_000_000
+
+IS_DIR = 1
+IS_FILE = 2
+IS_SYMLINK = 4
+IS_DIR_TARGET = 8
+IS_FILE_TARGET = 16
+
+
+class CachedEntry:
+    """
+    Запись директории из кэша с тем же интерфейсом, что и os.DirEntry.
+    Тип и inode берутся из кэша, а stat выполняется заново,
+    потому что изменение файла не меняет время изменения директории
+    """
+
+    __slots__ = ("name", "path", "_flags", "_inode", "_stats")
+
+    def __init__(self, directory: str, name: str, flags: int, inode: int):
+        """
+        Инициализация записи по сохранённым данным scandir
+        :param directory: Путь к директории
+        :param name: Имя записи
+        :param flags: Битовые признаки типа записи
+        :param inode: Номер inode записи
+        """
+        self.name = name
+        self.path = os.path.join(directory, name)
+        self._flags = flags
+        self._inode = inode
+        self._stats: dict[bool, os.stat_result] = {}
+
+    def is_dir(self, follow_symlinks: bool = True) -> bool:
+        """
+        :param follow_symlinks: Раскрывать символические ссылки
+        :return: True, если запись — директория
+        """
+        flag = IS_DIR_TARGET if follow_symlinks else IS_DIR
+        return bool(self._flags & flag)
+
+    def is_file(self, follow_symlinks: bool = True) -> bool:
+        """
+        :param follow_symlinks: Раскрывать символические ссылки
+        :return: True, если запись — обычный файл
+        """
+        flag = IS_FILE_TARGET if follow_symlinks else IS_FILE
+        return bool(self._flags & flag)
+
+    def is_symlink(self) -> bool:
+        """
+        :return: True, если запись — символическая ссылка
+        """
+        return bool(self._flags & IS_SYMLINK)
+
+    def inode(self) -> int:
+        """
+        :return: Номер inode записи
+        """
+        return self._inode
+
+    def stat(self, follow_symlinks: bool = True) -> os.stat_result:
+        """
+        Выполняет stat один раз на объект записи
+        :param follow_symlinks: Раскрывать символические ссылки
+        :return: Результат stat
+        """
+        if follow_symlinks not in self._stats:
+            self._stats[follow_symlinks] = os.stat(
+                self.path, follow_symlinks=follow_symlinks
+            )
+        return self._stats[follow_symlinks]
+
+
+DirectoryEntry = os.DirEntry | CachedEntry
+
+
+class DirectoryCache:
+    """
+    Кэш результатов os.scandir по директориям, общий для команд.
+    Запись кэша действительна, пока не изменилось время изменения
+    директории (st_mtime_ns). Недавно изменённые директории не кэшируются,
+    чтобы изменение в пределах точности времени файловой системы
+    не осталось незамеченным. Память ограничена суммарным количеством
+    записей, вытесняются давно не использованные директории
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """
+        Инициализация пустого кэша
+        :param max_entries: Максимальное суммарное количество записей
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._directories: OrderedDict[
+            str, tuple[int, dict[str, tuple[int, int]]]
+        ] = OrderedDict()
+        self._entries = 0
+        self._lock = threading.Lock()
+
+    def scandir(self, path: str) -> list[DirectoryEntry]:
+        """
+        Возвращает записи директории в порядке os.scandir.
+        При промахе возвращаются сами os.DirEntry с их кэшем stat
+        :param path: Путь к директории
+        :return: Записи директории
+        :raises OSError: Если директорию невозможно прочитать
+        """
+        mtime_ns = os.stat(path).st_mtime_ns
+        with self._lock:
+            cached = self._directories.get(path)
+            if cached is not None and cached[0] == mtime_ns:
+                self._directories.move_to_end(path)
+                self.hits += 1
+                return [
+                    CachedEntry(path, name, flags, inode)
+                    for name, (flags, inode) in cached[1].items()
+                ]
+            self.misses += 1
+
+        with os.scandir(path) as iterator:
+            entries = list(iterator)
+
+        if time.time_ns() - mtime_ns >= RACY_INTERVAL_NS:
+            records = {entry.name: self._record(entry) for entry in entries}
+            self._store(path, mtime_ns, records)
+
+        result: list[DirectoryEntry] = list(entries)
+        return result
+
+    def lookup(self, path: str) -> tuple[bool, CachedEntry | None]:
+        """
+        Ищет путь в кэше родительской директории, не заполняя кэш.
+        Цель символической ссылки может измениться без изменения
+        директории, поэтому для ссылок ответ из кэша не даётся
+        :param path: Абсолютный путь
+        :return: Признак того, что ответ известен из кэша,
+            и запись или None, если пути не существует
+        """
+        directory, name = os.path.split(path)
+        if name in ("", ".", ".."):
+            return False, None
+
+        with self._lock:
+            cached = self._directories.get(directory)
+        if cached is None:
+            return False, None
+
+        try:
+            if os.stat(directory).st_mtime_ns != cached[0]:
+                return False, None
+        except OSError:
+            return False, None
+
+        record = cached[1].get(name)
+        if record is None:
+            return True, None
+        if record[0] & IS_SYMLINK:
+            return False, None
+
+        return True, CachedEntry(directory, name, *record)
+
+    def clear(self) -> None:
+        """
+        Очищает кэш и счётчики
+        """
+        with self._lock:
+            self._directories.clear()
+            self._entries = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """
+        Возвращает состояние кэша
+        :return: Количество директорий, записей, попаданий и промахов
+        """
+        with self._lock:
+            return {
+                "directories": len(self._directories),
+                "entries": self._entries,
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def _record(self, entry: os.DirEntry) -> tuple[int, int]:
+        """
+        Сохраняет тип записи в битовых признаках.
+        Тип цели ссылки определяется только для символических ссылок
+        :param entry: Запись os.scandir
+        :return: Признаки типа и inode
+        """
+        flags = 0
+        if entry.is_dir(follow_symlinks=False):
+            flags |= IS_DIR | IS_DIR_TARGET
+        elif entry.is_file(follow_symlinks=False):
+            flags |= IS_FILE | IS_FILE_TARGET
+        elif entry.is_symlink():
+            flags |= IS_SYMLINK
+            try:
+                if entry.is_dir():
+                    flags |= IS_DIR_TARGET
+                elif entry.is_file():
+                    flags |= IS_FILE_TARGET
+            except OSError:
+                pass
+
+        return flags, entry.inode()
+
+    def _store(
+        self,
+        path: str,
+        mtime_ns: int,
+        records: dict[str, tuple[int, int]],
+    ) -> None:
+        """
+        Сохраняет директорию и вытесняет старые сверх лимита записей
+        :param path: Путь к директории
+        :param mtime_ns: Время изменения директории
+        :param records: Записи директории
+        """
+        if len(records) > self.max_entries:
+            return
+
+        with self._lock:
+            previous = self._directories.pop(path, None)
+            if previous is not None:
+                self._entries -= len(previous[1])
+
+            self._directories[path] = (mtime_ns, records)
+            self._entries += len(records)
+
+            while self._entries > self.max_entries:
+                _, (_, evicted) = self._directories.popitem(last=False)
+                self._entries -= len(evicted)
+
+
+directory_cache = DirectoryCache()
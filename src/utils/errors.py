@@ -86,3 +86,27 @@ class ExpressionSyntaxError(ShellError):
     """Неправильно введенное выражение"""
 
     pass
+
+
+class SearchIndexError(ShellError):
+    """Ошибка поискового индекса"""
+
+    pass
+
+
+class BinaryFileError(ShellError):
+    """Файл является двоичным"""
+
+    pass
+
+
+class ArchiveError(ShellError):
+    """Архив повреждён или имеет неизвестный формат"""
+
+    pass
+
+
+class CopyingError(ShellError):
+    """Часть файлов не удалось скопировать"""
+
+    pass
@@ -41,3 +41,39 @@ class Logger:
         :param message: Сообщение об ошибке
         """
         logging.error(f"{type(message).__name__}: {message}")
+
+    @classmethod
+    def operation_summary(
+        cls,
+        operation: str,
+        bytes_count: int,
+        files: int,
+        seconds: float,
+        failed: bool = False,
+    ) -> None:
+        """
+        Логирует объём и скорость долгой операции
+        :param operation: Название операции
+        :param bytes_count: Количество обработанных байт
+        :param files: Количество обработанных файлов
+        :param seconds: Длительность операции в секундах
+        :param failed: Операция завершилась ошибкой
+        """
+        rate = bytes_count / 1_000_000 / seconds if seconds > 0 else 0.0
+        status = "FAILED" if failed else "DONE"
+        logging.info(
+            f"METRICS: {operation} {status}: {bytes_count} байт, "
+            f"{files} файлов, {seconds:.3f} с, {rate:.2f} МБ/с"
+        )
+
+    @classmethod
+    def cache_summary(cls, operation: str, hits: int, misses: int) -> None:
+        """
+        Логирует попадания и промахи кэша результатов команды
+        :param operation: Название команды
+        :param hits: Количество попаданий в кэш
+        :param misses: Количество промахов кэша
+        """
+        logging.info(
+            f"CACHE: {operation}: попаданий {hits}, промахов {misses}"
+        )
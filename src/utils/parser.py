@@ -1,9 +1,86 @@
 import argparse
-from typing import NoReturn
+import codecs
+from collections.abc import Sequence
+from typing import Any, NoReturn
 
 from src.utils.errors import ParserError
 
 
+def positive_int(value: str) -> int:
+    """
+    Преобразует аргумент в положительное целое число
+    :param value: Строковое значение аргумента
+    :return: Положительное целое число
+    :raises argparse.ArgumentTypeError: Если число не положительное
+    """
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} не является положительным")
+
+    return number
+
+
+def non_negative_int(value: str) -> int:
+    """
+    Преобразует аргумент в неотрицательное целое число
+    :param value: Строковое значение аргумента
+    :return: Неотрицательное целое число
+    :raises argparse.ArgumentTypeError: Если число отрицательное
+    """
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"{value} является отрицательным")
+
+    return number
+
+
+def encoding_list(value: str) -> list[str]:
+    """
+    Преобразует аргумент в список кодировок через запятую
+    :param value: Строковое значение аргумента
+    :return: Список названий кодировок
+    :raises argparse.ArgumentTypeError: Если кодировка неизвестна
+    """
+    encodings = [name.strip() for name in value.split(",") if name.strip()]
+    if not encodings:
+        raise argparse.ArgumentTypeError("Не указаны кодировки")
+
+    for name in encodings:
+        try:
+            codecs.lookup(name)
+        except LookupError:
+            raise argparse.ArgumentTypeError(
+                f"Неизвестная кодировка {name}"
+            ) from None
+
+    return encodings
+
+
+class OptionalPattern(argparse.Action):
+    """
+    Сохраняет необязательный паттерн списком, как nargs=1.
+    Без паттерна сохраняется пустой список
+    """
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: str | Sequence[Any] | None,
+        option_string: str | None = None,
+    ) -> None:
+        """
+        Сохраняет паттерн в пространство имён
+        :param parser: Парсер команды
+        :param namespace: Распаршенные аргументы
+        :param values: Паттерн или None, если он не указан
+        :param option_string: Не используется для позиционных аргументов
+        """
+        setattr(
+            namespace, self.dest, [values] if isinstance(values, str) else []
+        )
+
+
 class NoErrorParser(argparse.ArgumentParser):
     """
     ArgumentParser, который не выводит ошибки в stderr
@@ -65,6 +142,10 @@ class Parser:
         self._cp_setup()
         self._history_setup()
         self._ls_setup()
+        self._du_setup()
+        self._find_setup()
+        self._updatedb_setup()
+        self._locate_setup()
         self._mv_setup()
         self._rm_setup()
         self._undo_setup()
@@ -73,6 +154,8 @@ class Parser:
         self._tar_setup()
         self._untar_setup()
         self._grep_setup()
+        self._index_setup()
+        self._cache_setup()
         self._stop_setup()
         self._touch_setup()
         self._mkdir_setup()
@@ -97,6 +180,61 @@ class Parser:
             action="store_true",
             help="Подробный вывод файлов с поддержкой скрытых",
         )
+        ls_parser.add_argument(
+            "--recursive",
+            "-R",
+            action="store_true",
+            help="Рекурсивный вывод поддиректорий",
+        )
+        ls_parser.add_argument(
+            "--jobs",
+            "-j",
+            type=positive_int,
+            default=4,
+            help="Количество потоков для чтения директорий при -R",
+        )
+        order_group = ls_parser.add_mutually_exclusive_group()
+        order_group.add_argument(
+            "-U",
+            dest="unsorted",
+            action="store_true",
+            help="Вывод без сортировки по мере чтения директории",
+        )
+        order_group.add_argument(
+            "-S",
+            dest="sort_size",
+            action="store_true",
+            help="Сортировка по размеру, сначала большие",
+        )
+        order_group.add_argument(
+            "-t",
+            dest="sort_time",
+            action="store_true",
+            help="Сортировка по времени изменения, сначала новые",
+        )
+        format_group = ls_parser.add_mutually_exclusive_group()
+        format_group.add_argument(
+            "--json",
+            action="store_true",
+            help="Вывод записей массивом JSON",
+        )
+        format_group.add_argument(
+            "--ndjson",
+            action="store_true",
+            help="Потоковый вывод по одному объекту JSON в строке",
+        )
+        ls_parser.add_argument(
+            "--color",
+            choices=["auto", "always", "never"],
+            default="auto",
+            help="Цветной вывод: auto — только в терминале",
+        )
+        ls_parser.add_argument(
+            "--head",
+            type=positive_int,
+            metavar="N",
+            help="Вывод только первых N записей",
+        )
         ls_parser.add_argument("paths", nargs="*", help="Пути к директориям")
 
     def _cd_setup(self) -> None:
@@ -131,6 +269,36 @@ class Parser:
             action="store_true",
             help="Копирование директории",
         )
+        cp_parser.add_argument(
+            "--jobs",
+            "-j",
+            type=positive_int,
+            default=1,
+            help="Количество потоков для копирования файлов при -r",
+        )
+        cp_parser.add_argument(
+            "--update",
+            "-u",
+            action="store_true",
+            help="Пропускать файлы с тем же размером и временем изменения",
+        )
+        cp_parser.add_argument(
+            "--checksum",
+            "-c",
+            action="store_true",
+            help="Пропускать файлы с тем же содержимым",
+        )
+        cp_parser.add_argument(
+            "--delta",
+            action="store_true",
+            help="Перезаписывать только изменённые блоки больших файлов",
+        )
+        cp_parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Копировать файл с сохранением прогресса "
+            "и продолжить прерванное копирование",
+        )
         cp_parser.add_argument(
             "paths", nargs="*", help="Исходный и целевой путь"
         )
@@ -255,11 +423,136 @@ class Parser:
             action="store_true",
             help="Поиск без учёта регистра в подкаталогах",
         )
-        grep_parser.add_argument("pattern", nargs=1, help="Шаблон для поиска")
+        grep_parser.add_argument(
+            "--jobs",
+            "-j",
+            type=positive_int,
+            default=1,
+            help="Количество процессов для параллельного поиска",
+        )
+        grep_parser.add_argument(
+            "--file",
+            "-f",
+            dest="patterns_file",
+            help="Файл с фиксированными строками для поиска",
+        )
+        grep_parser.add_argument(
+            "--encoding",
+            dest="encodings",
+            type=encoding_list,
+            default=["utf-8"],
+            help="Кодировки файлов через запятую в порядке попыток",
+        )
+        grep_parser.add_argument(
+            "--include",
+            action="append",
+            metavar="GLOB",
+            help="Просматривать только файлы с подходящим именем",
+        )
+        grep_parser.add_argument(
+            "--exclude",
+            action="append",
+            metavar="GLOB",
+            help="Пропускать файлы с подходящим именем",
+        )
+        grep_parser.add_argument(
+            "--exclude-dir",
+            action="append",
+            metavar="GLOB",
+            help="Не спускаться в директории с подходящим именем",
+        )
+        grep_parser.add_argument(
+            "--ignore-file",
+            action="append",
+            dest="ignore_files",
+            metavar="PATH",
+            help="Файл с правилами игнорирования в стиле .gitignore",
+        )
+        grep_parser.add_argument(
+            "--search-archives",
+            "-z",
+            dest="archives",
+            action="store_true",
+            help="Поиск внутри zip и tar архивов без распаковки",
+        )
+        grep_parser.add_argument(
+            "--after-context",
+            "-A",
+            type=non_negative_int,
+            metavar="N",
+            help="Вывод N строк после каждого совпадения",
+        )
+        grep_parser.add_argument(
+            "--before-context",
+            "-B",
+            type=non_negative_int,
+            metavar="N",
+            help="Вывод N строк перед каждым совпадением",
+        )
+        grep_parser.add_argument(
+            "--context",
+            "-C",
+            type=non_negative_int,
+            metavar="N",
+            help="Вывод N строк до и после каждого совпадения",
+        )
+        grep_parser.add_argument(
+            "--cache",
+            action="store_true",
+            help="Брать результаты для неизменённых файлов из кэша",
+        )
+        output_group = grep_parser.add_mutually_exclusive_group()
+        output_group.add_argument(
+            "--files-with-matches",
+            "-l",
+            action="store_true",
+            help="Вывод только имён файлов с совпадениями",
+        )
+        output_group.add_argument(
+            "--files-without-match",
+            "-L",
+            action="store_true",
+            help="Вывод только имён файлов без совпадений",
+        )
+        output_group.add_argument(
+            "--count",
+            "-c",
+            action="store_true",
+            help="Вывод количества совпавших строк в каждом файле",
+        )
+        grep_parser.add_argument(
+            "--max-count",
+            "-m",
+            type=positive_int,
+            default=None,
+            help="Остановка поиска в файле после N совпавших строк",
+        )
+        grep_parser.add_argument(
+            "pattern",
+            nargs="?",
+            action=OptionalPattern,
+            help="Шаблон для поиска (с -f — первый путь)",
+        )
         grep_parser.add_argument(
             "paths", nargs="*", help="Файлы или каталоги для поиска"
         )
 
+    def _index_setup(self) -> None:
+        """
+        Настраивает парсер для команды index
+        """
+        index_parser = self.subparsers.add_parser(
+            "index", help="Построение и обновление триграммного индекса grep"
+        )
+        index_parser.add_argument(
+            "action",
+            choices=["build", "update"],
+            help="Построить индекс или обновить изменённые файлы",
+        )
+        index_parser.add_argument(
+            "paths", nargs="*", help="Директории для индексации"
+        )
+
     def _mkdir_setup(self) -> None:
         """
         Настраивает парсер для команды mkdir
@@ -281,6 +574,115 @@ class Parser:
         )
         touch_parser.add_argument("paths", nargs="*", help="Файл для создания")
 
+    def _du_setup(self) -> None:
+        """
+        Настраивает парсер для команды du
+        """
+        du_parser = self.subparsers.add_parser(
+            "du", help="Подсчёт места, занимаемого файлами и директориями"
+        )
+        du_parser.add_argument(
+            "paths", nargs="*", help="Файлы и директории для подсчёта"
+        )
+        du_parser.add_argument(
+            "--summarize",
+            "-s",
+            action="store_true",
+            help="Выводить только итог для каждого пути",
+        )
+        du_parser.add_argument(
+            "--apparent-size",
+            "-b",
+            action="store_true",
+            help="Сумма размеров файлов в байтах вместо места на диске",
+        )
+        du_parser.add_argument(
+            "--jobs",
+            "-j",
+            type=positive_int,
+            default=4,
+            help="Количество потоков для чтения директорий",
+        )
+        du_parser.add_argument(
+            "--cache",
+            action="store_true",
+            help="Не перечитывать директории с неизменённым временем",
+        )
+
+    def _find_setup(self) -> None:
+        """
+        Настраивает парсер для команды find.
+        Части выражения начинаются с дефиса, поэтому разбор префиксов
+        для команды отключён, а выражение разбирается самой командой
+        """
+        find_parser = self.subparsers.add_parser(
+            "find",
+            help="Поиск файлов по имени, типу, размеру и времени изменения",
+            prefix_chars="+",
+            add_help=False,
+        )
+        find_parser.add_argument(
+            "arguments",
+            nargs="*",
+            help="Стартовые пути и выражение",
+        )
+
+    def _updatedb_setup(self) -> None:
+        """
+        Настраивает парсер для команды updatedb
+        """
+        updatedb_parser = self.subparsers.add_parser(
+            "updatedb", help="Построение и обновление индекса имён для locate"
+        )
+        updatedb_parser.add_argument(
+            "paths",
+            nargs="*",
+            help="Директории для индексации, по умолчанию — все ранее "
+            "проиндексированные",
+        )
+
+    def _locate_setup(self) -> None:
+        """
+        Настраивает парсер для команды locate
+        """
+        locate_parser = self.subparsers.add_parser(
+            "locate", help="Поиск путей по индексу имён"
+        )
+        locate_parser.add_argument(
+            "pattern", help="Подстрока пути или шаблон с *, ? и [...]"
+        )
+        locate_parser.add_argument(
+            "--ignore-case",
+            "-i",
+            action="store_true",
+            help="Поиск без учёта регистра",
+        )
+        locate_parser.add_argument(
+            "--limit",
+            "-l",
+            type=positive_int,
+            help="Вывести не больше N путей",
+        )
+        locate_parser.add_argument(
+            "--count",
+            "-c",
+            action="store_true",
+            help="Вывести только количество найденных путей",
+        )
+
+    def _cache_setup(self) -> None:
+        """
+        Настраивает парсер для команды cache
+        """
+        cache_parser = self.subparsers.add_parser(
+            "cache", help="Управление кэшем директорий"
+        )
+        cache_parser.add_argument(
+            "action",
+            choices=["clear", "stats"],
+            help="Очистить кэш или показать его состояние",
+        )
+
     def _stop_setup(self) -> None:
         """
         Настраивает парсер для команды stop
@@ -0,0 +1,193 @@
+import fnmatch
+import re
+
+from src.utils.errors import InvalidFileError
+
+
+class IgnoreRule:
+    """
+    Правило файла игнорирования в стиле .gitignore
+    """
+
+    def __init__(self, line: str) -> None:
+        """
+        Разбирает строку файла игнорирования.
+        Восклицательный знак в начале отменяет игнорирование,
+        косая черта в конце ограничивает правило директориями,
+        косая черта в начале или в середине привязывает его к корню обхода
+        :param line: Строка файла без перевода строки
+        """
+        self.negated = line.startswith("!")
+        pattern = line[1:] if self.negated else line
+        self.directory_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+
+        anchored = "/" in pattern
+        pattern = pattern.lstrip("/")
+        prefix = "" if anchored else "(?:.*/)?"
+        self.regex = re.compile(f"{prefix}{self._translate(pattern)}")
+
+    def matches(self, relative_path: str, is_directory: bool) -> bool:
+        """
+        Проверяет, подходит ли путь под правило
+        :param relative_path: Путь относительно корня обхода через /
+        :param is_directory: Является ли путь директорией
+        :return: True, если правило применяется к пути
+        """
+        if self.directory_only and not is_directory:
+            return False
+
+        return self.regex.fullmatch(relative_path) is not None
+
+    def _translate(self, pattern: str) -> str:
+        """
+        Переводит шаблон в регулярное выражение.
+        Звёздочка и вопросительный знак не пересекают косую черту,
+        двойная звёздочка соответствует любому количеству директорий
+        :param pattern: Шаблон без признаков отмены и директории
+        :return: Текст регулярного выражения
+        """
+        result = ""
+        index = 0
+
+        while index < len(pattern):
+            char = pattern[index]
+
+            if pattern.startswith("**/", index):
+                result += "(?:.*/)?"
+                index += 3
+                continue
+            if pattern.startswith("**", index):
+                result += ".*"
+                index += 2
+                continue
+
+            if char == "*":
+                result += "[^/]*"
+            elif char == "?":
+                result += "[^/]"
+            elif char == "[" and "]" in pattern[index + 2 :]:
+                end = pattern.index("]", index + 2)
+                body = pattern[index + 1 : end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                result += "[" + body.replace("\\", "\\\\") + "]"
+                index = end
+            elif char == "\\" and index + 1 < len(pattern):
+                index += 1
+                result += re.escape(pattern[index])
+            else:
+                result += re.escape(char)
+
+            index += 1
+
+        return result
+
+
+class PathFilter:
+    """
+    Фильтр путей для рекурсивного обхода директорий.
+    Шаблоны --include, --exclude и --exclude-dir применяются к имени,
+    правила файлов игнорирования — к пути относительно корня обхода.
+    Все шаблоны компилируются один раз при создании фильтра,
+    а отброшенные директории не читаются совсем
+    """
+
+    def __init__(
+        self,
+        include: list[str] | None = None,
+        exclude: list[str] | None = None,
+        exclude_dir: list[str] | None = None,
+        ignore_files: list[str] | None = None,
+    ) -> None:
+        """
+        Компилирует шаблоны фильтра
+        :param include: Шаблоны имён файлов, которые нужно просматривать
+        :param exclude: Шаблоны имён файлов, которые нужно пропускать
+        :param exclude_dir: Шаблоны имён директорий, которые нужно пропускать
+        :param ignore_files: Пути к файлам игнорирования
+        :raises InvalidFileError: Если файл игнорирования невозможно прочитать
+        """
+        self._include = self._compile(include)
+        self._exclude = self._compile(exclude)
+        self._exclude_dir = self._compile(exclude_dir)
+        self._rules: list[IgnoreRule] = []
+
+        for ignore_file in ignore_files or []:
+            self._rules.extend(self._read_rules(ignore_file))
+
+    def accepts_file(self, name: str, relative_path: str) -> bool:
+        """
+        Проверяет, нужно ли просматривать файл
+        :param name: Имя файла
+        :param relative_path: Путь относительно корня обхода через /
+        :return: True, если файл проходит фильтр
+        """
+        if self._include is not None and not self._include.match(name):
+            return False
+        if self._exclude is not None and self._exclude.match(name):
+            return False
+
+        return not self._ignored(relative_path, False)
+
+    def accepts_directory(self, name: str, relative_path: str) -> bool:
+        """
+        Проверяет, нужно ли спускаться в директорию
+        :param name: Имя директории
+        :param relative_path: Путь относительно корня обхода через /
+        :return: True, если директорию нужно обойти
+        """
+        if self._exclude_dir is not None and self._exclude_dir.match(name):
+            return False
+
+        return not self._ignored(relative_path, True)
+
+    def _ignored(self, relative_path: str, is_directory: bool) -> bool:
+        """
+        Применяет правила файлов игнорирования.
+        Решение принимает последнее подходящее правило
+        :param relative_path: Путь относительно корня обхода через /
+        :param is_directory: Является ли путь директорией
+        :return: True, если путь игнорируется
+        """
+        ignored = False
+        for rule in self._rules:
+            if rule.matches(relative_path, is_directory):
+                ignored = not rule.negated
+
+        return ignored
+
+    def _compile(self, patterns: list[str] | None) -> re.Pattern | None:
+        """
+        Объединяет шаблоны имён в одно регулярное выражение
+        :param patterns: Шаблоны в синтаксисе fnmatch
+        :return: Скомпилированное выражение или None, если шаблонов нет
+        """
+        if not patterns:
+            return None
+
+        return re.compile(
+            "|".join(f"(?:{fnmatch.translate(item)})" for item in patterns)
+        )
+
+    def _read_rules(self, ignore_file: str) -> list[IgnoreRule]:
+        """
+        Читает правила из файла игнорирования.
+        Пустые строки и комментарии пропускаются
+        :param ignore_file: Путь к файлу игнорирования
+        :return: Список правил
+        :raises InvalidFileError: Если файл невозможно прочитать
+        """
+        try:
+            with open(ignore_file, "r", encoding="utf-8") as file:
+                lines = [line.rstrip("\r\n") for line in file]
+        except (OSError, UnicodeDecodeError):
+            raise InvalidFileError(
+                f"Файл {ignore_file} невозможно прочитать"
+            ) from None
+
+        return [
+            IgnoreRule(line.rstrip())
+            for line in lines
+            if line.strip() and not line.startswith("#")
+        ]
@@ -0,0 +1,199 @@
+import os
+import sys
+import threading
+import time
+from types import TracebackType
+from typing import TextIO
+
+from src.utils.logger import Logger
+
+STATUS_INTERVAL = 0.5
+BYTES_PER_MB = 1_000_000
+
+
+class Progress:
+    """
+    Счётчик байт и файлов для долгих операций.
+    Пока операция идёт, на терминал не чаще раза в STATUS_INTERVAL
+    секунд выводится строка состояния со скоростью и оставшимся
+    временем, по завершении итог записывается в лог через Logger.
+    Счётчик можно пополнять из нескольких потоков
+    """
+
+    def __init__(
+        self,
+        operation: str,
+        total_bytes: int | None = None,
+        total_files: int | None = None,
+        stream: TextIO | None = None,
+        interval: float = STATUS_INTERVAL,
+    ) -> None:
+        """
+        Инициализация счётчика
+        :param operation: Название операции для строки состояния и лога
+        :param total_bytes: Ожидаемое количество байт, если известно
+        :param total_files: Ожидаемое количество файлов, если известно
+        :param stream: Поток для строки состояния, по умолчанию stderr.
+            Строка выводится, только если поток — терминал
+        :param interval: Минимальный интервал между обновлениями строки
+        """
+        self.operation = operation
+        self.total_bytes = total_bytes
+        self.total_files = total_files
+        self.bytes = 0
+        self.files = 0
+        self._stream = sys.stderr if stream is None else stream
+        self._enabled = self._stream.isatty()
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._rendered = self._started
+        self._status_width = 0
+        self._finished = threading.Event()
+
+    def __enter__(self) -> "Progress":
+        """
+        :return: Сам счётчик
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """
+        Завершает операцию и записывает итог, в том числе при ошибке
+        """
+        self.finish(failed=exc_type is not None)
+
+    def estimate_tree(self, path: str) -> None:
+        """
+        Оценивает общий объём дерева для оставшегося времени.
+        Оценка нужна только строке состояния, поэтому без терминала
+        дерево не обходится, а в терминале обходится в фоновом потоке,
+        не задерживая начало операции. Обход прекращается
+        по завершении операции
+        :param path: Путь к директории
+        """
+        if not self._enabled:
+            return
+
+        threading.Thread(
+            target=self._count_tree, args=(path,), daemon=True
+        ).start()
+
+    def _count_tree(self, path: str) -> None:
+        """
+        Считает объём дерева и сохраняет его как ожидаемый
+        :param path: Путь к директории
+        """
+        total_bytes, total_files = tree_totals(path, self._finished)
+        with self._lock:
+            if not self._finished.is_set():
+                self.total_bytes = total_bytes
+                self.total_files = total_files
+
+    def advance(self, bytes_count: int = 0, files: int = 0) -> None:
+        """
+        Учитывает обработанные данные и при необходимости
+        обновляет строку состояния
+        :param bytes_count: Количество обработанных байт
+        :param files: Количество обработанных файлов
+        """
+        with self._lock:
+            self.bytes += bytes_count
+            self.files += files
+            if not self._enabled:
+                return
+
+            now = time.monotonic()
+            if now - self._rendered < self._interval:
+                return
+            self._rendered = now
+            self._write_status(self._status(now - self._started))
+
+    def finish(self, failed: bool = False) -> None:
+        """
+        Стирает строку состояния и записывает итог в лог
+        :param failed: Операция завершилась ошибкой
+        """
+        seconds = time.monotonic() - self._started
+        self._finished.set()
+        with self._lock:
+            if self._enabled and self._status_width:
+                self._write_status("")
+                self._stream.write("\r")
+                self._stream.flush()
+
+        Logger.operation_summary(
+            self.operation, self.bytes, self.files, seconds, failed
+        )
+
+    def _status(self, seconds: float) -> str:
+        """
+        :param seconds: Время с начала операции
+        :return: Строка состояния
+        """
+        rate = self.bytes / BYTES_PER_MB / seconds if seconds > 0 else 0.0
+        status = (
+            f"{self.operation}: файлов {self.files}, "
+            f"{self.bytes / BYTES_PER_MB:.1f} МБ, {rate:.1f} МБ/с"
+        )
+
+        eta = self._eta(seconds)
+        if eta is not None:
+            status += f", осталось ~{eta:.0f} с"
+        return status
+
+    def _eta(self, seconds: float) -> float | None:
+        """
+        Оценивает оставшееся время по байтам, а если их общее
+        количество неизвестно — по файлам
+        :param seconds: Время с начала операции
+        :return: Оставшееся время в секундах или None
+        """
+        if self.total_bytes and self.bytes:
+            done, total = self.bytes, self.total_bytes
+        elif self.total_files and self.files:
+            done, total = self.files, self.total_files
+        else:
+            return None
+
+        return max(total - done, 0) * seconds / done
+
+    def _write_status(self, status: str) -> None:
+        """
+        Перерисовывает строку состояния поверх предыдущей
+        :param status: Новая строка состояния
+        """
+        padding = max(self._status_width - len(status), 0)
+        self._stream.write(f"\r{status}{' ' * padding}")
+        self._stream.flush()
+        self._status_width = len(status)
+
+
+def tree_totals(
+    path: str, stop: threading.Event | None = None
+) -> tuple[int, int]:
+    """
+    Считает размер и количество файлов дерева для оценки
+    оставшегося времени. Символические ссылки не раскрываются
+    :param path: Путь к директории
+    :param stop: Событие, по которому подсчёт прекращается досрочно
+    :return: Сумма размеров файлов и их количество
+    """
+    total_bytes = 0
+    total_files = 0
+    for root, _, files in os.walk(path):
+        if stop is not None and stop.is_set():
+            break
+        for name in files:
+            try:
+                total_bytes += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                continue
+            total_files += 1
+
+    return total_bytes, total_files
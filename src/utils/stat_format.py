@@ -0,0 +1,59 @@
+import stat
+from datetime import datetime
+
+NS_PER_MINUTE = 60_000_000_000
+MAX_CACHED_VALUES = 65536
+
+
+class StatFormatter:
+    """
+    Форматирование полей stat для подробного вывода ls.
+    Время выводится с точностью до минуты, поэтому строка
+    вычисляется один раз на минуту и переиспользуется для всех файлов,
+    изменённых в ту же минуту. Строки прав доступа кэшируются
+    по значению st_mode, которых в директории обычно немного
+    """
+
+    def __init__(self, max_cached: int = MAX_CACHED_VALUES) -> None:
+        """
+        Инициализация пустых кэшей
+        :param max_cached: Максимальный размер каждого кэша.
+            При переполнении кэш очищается целиком
+        """
+        self._max_cached = max_cached
+        self._minutes: dict[int, str] = {}
+        self._modes: dict[int, str] = {}
+
+    def format_time(self, mtime_ns: int) -> str:
+        """
+        Форматирует время изменения как ГГГГ-ММ-ДД ЧЧ:ММ в местном времени.
+        Смещения часовых поясов кратны минуте, поэтому все моменты
+        одной минуты дают одну и ту же строку
+        :param mtime_ns: Время изменения в наносекундах
+        :return: Строка времени
+        """
+        minute = mtime_ns // NS_PER_MINUTE
+        text = self._minutes.get(minute)
+        if text is None:
+            if len(self._minutes) >= self._max_cached:
+                self._minutes.clear()
+            moment = datetime.fromtimestamp(minute * 60)
+            text = moment.strftime("%Y-%m-%d %H:%M")
+            self._minutes[minute] = text
+
+        return text
+
+    def format_mode(self, mode: int) -> str:
+        """
+        Форматирует тип и права доступа как stat.filemode
+        :param mode: Значение st_mode
+        :return: Строка вида -rw-r--r--
+        """
+        text = self._modes.get(mode)
+        if text is None:
+            if len(self._modes) >= self._max_cached:
+                self._modes.clear()
+            text = stat.filemode(mode)
+            self._modes[mode] = text
+
+        return text
@@ -1,6 +1,7 @@
 import argparse
 import tarfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
@@ -234,3 +235,21 @@ class TestsTar:
 
         archive_path = make_temp_directory / "folder_to_tar.tar.gz"
         assert archive_path.exists()
+
+    def test_tar_logs_metrics(self, make_temp_structure: Path) -> None:
+        """
+        Проверяет запись объёма и скорости архивации в лог
+        :param make_temp_structure: Фикстура с тестовой структурой
+        """
+        archive = make_temp_structure.parent / "archive.tar.gz"
+
+        with patch("src.utils.logger.logging.info") as mock_info:
+            Tar().execute(
+                argparse.Namespace(
+                    paths=[str(make_temp_structure), str(archive)]
+                )
+            )
+
+        assert mock_info.call_args[0][0].startswith(
+            "METRICS: tar DONE: 24 байт, 3 файлов"
+        )
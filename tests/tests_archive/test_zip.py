@@ -1,6 +1,7 @@
 import argparse
 import zipfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
@@ -290,3 +291,21 @@ class TestsZip:
         with zipfile.ZipFile(archive_path, "r") as zf:
             extracted_content = zf.read("file.txt").decode("utf-8")
             assert extracted_content == content
+
+    def test_zip_logs_metrics(self, make_temp_structure: Path) -> None:
+        """
+        Проверяет запись объёма и скорости архивации в лог
+        :param make_temp_structure: Фикстура с тестовой структурой
+        """
+        archive = make_temp_structure.parent / "archive.zip"
+
+        with patch("src.utils.logger.logging.info") as mock_info:
+            Zip().execute(
+                argparse.Namespace(
+                    paths=[str(make_temp_structure), str(archive)]
+                )
+            )
+
+        assert mock_info.call_args[0][0].startswith(
+            "METRICS: zip DONE: 24 байт, 3 файлов"
+        )
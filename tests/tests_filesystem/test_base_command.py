@@ -12,6 +12,7 @@ from src.utils.errors import (
     NotAFileError,
     PathNotFoundError,
 )
+from src.utils.path_filter import PathFilter
 
 
 class ConcreteCommand(BaseClass):
@@ -264,3 +265,54 @@ class TestsBaseCommand:
 
         with pytest.raises(AttributeError):
             cmd._is_tokens(tokens)
+
+    def test_walk_tree_sorted_depth_first(
+        self, make_temp_structure: Path
+    ) -> None:
+        """
+        Проверяет обход дерева в глубину с сортировкой по имени
+        :param make_temp_structure: Фикстура с тестовой структурой
+        """
+        cmd = ConcreteCommand()
+
+        names = [
+            os.path.relpath(entry.path, make_temp_structure)
+            for entry in cmd._walk_tree(str(make_temp_structure))
+        ]
+
+        assert names == [
+            "file1.txt",
+            "file2.txt",
+            os.path.join("subdirectory", "nested.txt"),
+        ]
+
+    def test_walk_tree_prunes_filtered_directories(
+        self, make_temp_structure: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        """
+        Проверяет, что отброшенные фильтром директории не читаются
+        :param make_temp_structure: Фикстура с тестовой структурой
+        :param monkeypatch: Фикстура для подмены функций
+        """
+        cmd = ConcreteCommand()
+        scanned = []
+        scandir = os.scandir
+
+        def tracking_scandir(path: str):
+            scanned.append(path)
+            return scandir(path)
+
+        monkeypatch.setattr(os, "scandir", tracking_scandir)
+        path_filter = PathFilter(
+            exclude=["file2.*"], exclude_dir=["subdirectory"]
+        )
+
+        names = [
+            entry.name
+            for entry in cmd._walk_tree(
+                str(make_temp_structure), path_filter=path_filter
+            )
+        ]
+
+        assert names == ["file1.txt"]
+        assert scanned == [str(make_temp_structure)]
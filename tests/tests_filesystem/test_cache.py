@@ -0,0 +1,81 @@
+import argparse
+import os
+from pathlib import Path
+
+from _pytest.capture import CaptureFixture
+
+from src.filesystem.cache import Cache
+from src.filesystem.ls import Ls
+from src.utils.dir_cache import directory_cache
+
+OLD_TIME_NS = 1_000_000_000_000_000_000
+
+
+class TestsCache:
+    """Тесты для команды cache"""
+
+    def test_ls_uses_shared_cache(
+        self, make_temp_structure: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет попадание в общий кэш при повторном ls
+        :param make_temp_structure: Фикстура для временной структуры
+        :param capsys: Фикстура для захвата вывода
+        """
+        os.utime(make_temp_structure, ns=(OLD_TIME_NS, OLD_TIME_NS))
+        tokens = argparse.Namespace(
+            paths=[str(make_temp_structure)], l=False, all=False, al=False
+        )
+        directory_cache.clear()
+
+        Ls().execute(tokens)
+        first = capsys.readouterr().out
+        Ls().execute(tokens)
+        second = capsys.readouterr().out
+
+        assert first == second
+        assert directory_cache.stats()["hits"] == 1
+
+    def test_ls_sees_new_file_after_cache(
+        self, make_temp_structure: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет, что новый файл виден после заполнения кэша
+        :param make_temp_structure: Фикстура для временной структуры
+        :param capsys: Фикстура для захвата вывода
+        """
+        os.utime(make_temp_structure, ns=(OLD_TIME_NS, OLD_TIME_NS))
+        tokens = argparse.Namespace(
+            paths=[str(make_temp_structure)], l=False, all=False, al=False
+        )
+        Ls().execute(tokens)
+        capsys.readouterr()
+
+        (make_temp_structure / "new_file.txt").write_text("new")
+        Ls().execute(tokens)
+
+        assert "new_file.txt" in capsys.readouterr().out
+
+    def test_cache_stats_and_clear(
+        self, make_temp_structure: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет вывод состояния и очистку кэша
+        :param make_temp_structure: Фикстура для временной структуры
+        :param capsys: Фикстура для захвата вывода
+        """
+        os.utime(make_temp_structure, ns=(OLD_TIME_NS, OLD_TIME_NS))
+        directory_cache.clear()
+        directory_cache.scandir(str(make_temp_structure))
+        command = Cache()
+
+        command.execute(argparse.Namespace(action="stats"))
+        stats = capsys.readouterr().out
+
+        command.execute(argparse.Namespace(action="clear"))
+        cleared = capsys.readouterr().out
+
+        assert stats.startswith("Директорий: 1,")
+        assert "промахов: 1" in stats
+        assert cleared == "Кэш директорий очищен\n"
+        assert directory_cache.stats()["directories"] == 0
@@ -0,0 +1,322 @@
+import errno
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from src.filesystem import copy_engine
+from src.filesystem.copy_engine import (
+    DELTA_BLOCK_SIZE,
+    METHOD_COPY_FILE_RANGE,
+    METHOD_READINTO,
+    METHOD_REFLINK,
+    METHOD_SENDFILE,
+    CopyEngine,
+)
+
+DATA_SIZE = 300_000
+
+
+def unsupported(*args: object) -> int:
+    """
+    Заменяет системный вызов, не поддерживаемый файловой системой
+    :raises OSError: Всегда, с кодом EOPNOTSUPP
+    """
+    raise OSError(errno.EOPNOTSUPP, "Operation not supported")
+
+
+@pytest.fixture
+def make_source(make_temp_directory: Path) -> Path:
+    """
+    Создаёт исходный файл со случайным содержимым
+    :param make_temp_directory: Фикстура для временных директорий
+    :return: Путь к файлу
+    """
+    source = make_temp_directory / "source.bin"
+    source.write_bytes(os.urandom(DATA_SIZE))
+    source.chmod(0o640)
+    return source
+
+
+@pytest.fixture
+def no_reflink(monkeypatch: MonkeyPatch) -> None:
+    """
+    Отключает reflink, чтобы проверить остальные способы
+    :param monkeypatch: Фикстура для подмены объектов
+    """
+    monkeypatch.setattr(copy_engine.fcntl, "ioctl", unsupported)
+
+
+class TestsCopyEngine:
+    """Тесты для копирования содержимого файлов"""
+
+    def test_copy_file_content_and_mode(self, make_source: Path) -> None:
+        """
+        Проверяет копирование содержимого и прав доступа
+        :param make_source: Фикстура с исходным файлом
+        """
+        destination = make_source.parent / "copy.bin"
+
+        method = CopyEngine().copy_file(str(make_source), str(destination))
+
+        assert method in (METHOD_REFLINK, METHOD_COPY_FILE_RANGE)
+        assert destination.read_bytes() == make_source.read_bytes()
+        assert destination.stat().st_mode == make_source.stat().st_mode
+
+    def test_copy_file_range_in_chunks(
+        self,
+        make_source: Path,
+        monkeypatch: MonkeyPatch,
+        no_reflink: None,
+    ) -> None:
+        """
+        Проверяет copy_file_range за несколько вызовов
+        :param make_source: Фикстура с исходным файлом
+        :param monkeypatch: Фикстура для подмены объектов
+        :param no_reflink: Фикстура, отключающая reflink
+        """
+        monkeypatch.setattr(copy_engine, "COPY_RANGE_CHUNK_SIZE", 4096)
+        destination = make_source.parent / "copy.bin"
+
+        method = CopyEngine().copy_file(str(make_source), str(destination))
+
+        assert method == METHOD_COPY_FILE_RANGE
+        assert destination.read_bytes() == make_source.read_bytes()
+
+    def test_fallback_to_sendfile(
+        self,
+        make_source: Path,
+        monkeypatch: MonkeyPatch,
+        no_reflink: None,
+    ) -> None:
+        """
+        Проверяет переход на sendfile и запоминание неподдерживаемого
+        способа для следующих файлов
+        :param make_source: Фикстура с исходным файлом
+        :param monkeypatch: Фикстура для подмены объектов
+        :param no_reflink: Фикстура, отключающая reflink
+        """
+        calls = []
+
+        def failing_copy_file_range(*args: object) -> int:
+            calls.append(args)
+            return unsupported()
+
+        monkeypatch.setattr(
+            copy_engine.os, "copy_file_range", failing_copy_file_range
+        )
+        engine = CopyEngine()
+
+        for name in ("first.bin", "second.bin"):
+            destination = make_source.parent / name
+            method = engine.copy_file(str(make_source), str(destination))
+
+            assert method == METHOD_SENDFILE
+            assert destination.read_bytes() == make_source.read_bytes()
+
+        assert len(calls) == 1
+
+    def test_fallback_to_readinto(
+        self,
+        make_source: Path,
+        monkeypatch: MonkeyPatch,
+        no_reflink: None,
+    ) -> None:
+        """
+        Проверяет копирование через readinto без поддержки ядра
+        :param make_source: Фикстура с исходным файлом
+        :param monkeypatch: Фикстура для подмены объектов
+        :param no_reflink: Фикстура, отключающая reflink
+        """
+        monkeypatch.setattr(copy_engine.os, "copy_file_range", unsupported)
+        monkeypatch.setattr(copy_engine.os, "sendfile", unsupported)
+        monkeypatch.setattr(copy_engine, "COPY_BUFFER_SIZE", 4096)
+        destination = make_source.parent / "copy.bin"
+
+        method = CopyEngine().copy_file(str(make_source), str(destination))
+
+        assert method == METHOD_READINTO
+        assert destination.read_bytes() == make_source.read_bytes()
+
+    def test_continues_after_short_copy(
+        self,
+        make_source: Path,
+        monkeypatch: MonkeyPatch,
+        no_reflink: None,
+    ) -> None:
+        """
+        Проверяет, что следующий способ продолжает с позиции,
+        на которой остановился предыдущий
+        :param make_source: Фикстура с исходным файлом
+        :param monkeypatch: Фикстура для подмены объектов
+        :param no_reflink: Фикстура, отключающая reflink
+        """
+        real_copy_file_range = os.copy_file_range
+        copied: list[int] = []
+
+        def short_copy_file_range(
+            source_fd: int, destination_fd: int, count: int, *offsets: int
+        ) -> int:
+            if copied:
+                return 0
+            copied.append(count)
+            return real_copy_file_range(
+                source_fd, destination_fd, 1000, *offsets
+            )
+
+        monkeypatch.setattr(
+            copy_engine.os, "copy_file_range", short_copy_file_range
+        )
+        destination = make_source.parent / "copy.bin"
+
+        method = CopyEngine().copy_file(str(make_source), str(destination))
+
+        assert method == METHOD_COPY_FILE_RANGE
+        assert destination.read_bytes() == make_source.read_bytes()
+
+    def test_other_errors_are_raised(
+        self,
+        make_source: Path,
+        monkeypatch: MonkeyPatch,
+        no_reflink: None,
+    ) -> None:
+        """
+        Проверяет, что ошибка записи не маскируется переходом
+        на другой способ
+        :param make_source: Фикстура с исходным файлом
+        :param monkeypatch: Фикстура для подмены объектов
+        :param no_reflink: Фикстура, отключающая reflink
+        """
+
+        def no_space(*args: object) -> int:
+            raise OSError(errno.ENOSPC, "No space left on device")
+
+        monkeypatch.setattr(copy_engine.os, "copy_file_range", no_space)
+
+        with pytest.raises(OSError) as exc_info:
+            CopyEngine().copy_file(
+                str(make_source), str(make_source.parent / "copy.bin")
+            )
+        assert exc_info.value.errno == errno.ENOSPC
+
+    def test_copy_empty_file(self, make_temp_directory: Path) -> None:
+        """
+        Проверяет копирование пустого файла
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        source = make_temp_directory / "empty"
+        source.write_bytes(b"")
+        destination = make_temp_directory / "copy"
+        destination.write_text("old")
+
+        CopyEngine().copy_file(str(source), str(destination))
+
+        assert destination.read_bytes() == b""
+
+    def test_copy_same_file_raises(self, make_source: Path) -> None:
+        """
+        Проверяет, что файл не копируется сам в себя
+        :param make_source: Фикстура с исходным файлом
+        """
+        content = make_source.read_bytes()
+
+        with pytest.raises(shutil.SameFileError):
+            CopyEngine().copy(str(make_source), str(make_source.parent))
+
+        assert make_source.read_bytes() == content
+
+    def test_copy_into_directory(self, make_source: Path) -> None:
+        """
+        Проверяет копирование в директорию под исходным именем
+        :param make_source: Фикстура с исходным файлом
+        """
+        target = make_source.parent / "target"
+        target.mkdir()
+
+        result = CopyEngine().copy(str(make_source), str(target))
+
+        assert result == str(target / "source.bin")
+        assert (target / "source.bin").read_bytes() == make_source.read_bytes()
+
+    def test_copy2_keeps_mtime(self, make_source: Path) -> None:
+        """
+        Проверяет сохранение времени изменения
+        :param make_source: Фикстура с исходным файлом
+        """
+        os.utime(make_source, ns=(10**18, 10**18))
+        destination = make_source.parent / "copy.bin"
+
+        CopyEngine().copy2(str(make_source), str(destination))
+
+        assert destination.stat().st_mtime_ns == 10**18
+
+    def test_same_content(self, make_source: Path) -> None:
+        """
+        Проверяет сравнение содержимого файлов
+        :param make_source: Фикстура с исходным файлом
+        """
+        destination = make_source.parent / "copy.bin"
+        data = bytearray(make_source.read_bytes())
+        destination.write_bytes(data)
+        engine = CopyEngine()
+
+        assert engine.same_content(str(make_source), str(destination))
+
+        data[-1] ^= 0xFF
+        destination.write_bytes(data)
+
+        assert not engine.same_content(str(make_source), str(destination))
+
+    def test_copy_delta_rewrites_changed_blocks(
+        self, make_source: Path
+    ) -> None:
+        """
+        Проверяет, что перезаписывается только изменённый блок
+        :param make_source: Фикстура с исходным файлом
+        """
+        destination = make_source.parent / "copy.bin"
+        data = bytearray(make_source.read_bytes())
+        data[DELTA_BLOCK_SIZE + 10] ^= 0xFF
+        destination.write_bytes(data)
+
+        rewritten = CopyEngine().copy_delta(str(make_source), str(destination))
+
+        assert rewritten == DELTA_BLOCK_SIZE
+        assert destination.read_bytes() == make_source.read_bytes()
+
+    def test_copy_delta_reports_each_block(self, make_source: Path) -> None:
+        """
+        Проверяет, что прогресс пополняется после каждого блока
+        :param make_source: Фикстура с исходным файлом
+        """
+        destination = make_source.parent / "copy.bin"
+        destination.write_bytes(make_source.read_bytes())
+        reported: list[int] = []
+
+        CopyEngine().copy_delta(
+            str(make_source), str(destination), reported.append
+        )
+
+        size = make_source.stat().st_size
+        assert len(reported) == -(-size // DELTA_BLOCK_SIZE)
+        assert sum(reported) == size
+
+    def test_copy_delta_resizes_file(self, make_source: Path) -> None:
+        """
+        Проверяет обрезку длинного и дополнение короткого назначения
+        :param make_source: Фикстура с исходным файлом
+        """
+        content = make_source.read_bytes()
+        longer = make_source.parent / "longer.bin"
+        longer.write_bytes(content + b"tail")
+        shorter = make_source.parent / "shorter.bin"
+        shorter.write_bytes(content[:1000])
+        engine = CopyEngine()
+
+        assert engine.copy_delta(str(make_source), str(longer)) == 0
+        engine.copy_delta(str(make_source), str(shorter))
+
+        assert longer.read_bytes() == content
+        assert shorter.read_bytes() == content
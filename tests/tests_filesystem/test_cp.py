@@ -1,10 +1,61 @@
 import argparse
+import io
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
+from _pytest.capture import CaptureFixture
+from _pytest.monkeypatch import MonkeyPatch
 
+from src.filesystem import cp
+from src.filesystem.copy_engine import CopyEngine
+from src.filesystem.copy_journal import CopyJournal
 from src.filesystem.cp import Cp
-from src.utils.errors import PathNotFoundError, ShellError
+from src.utils.errors import CopyingError, PathNotFoundError, ShellError
+
+OLD_TIME_NS = 10**18
+LARGE_FILE_SIZE = (64 << 20) + 1
+COPY_PART = CopyEngine.copy_part
+
+
+def interrupt_after(monkeypatch: MonkeyPatch, parts: int) -> None:
+    """
+    Делает копирование частями и прерывает его после нескольких частей
+    :param monkeypatch: Фикстура для подмены объектов
+    :param parts: Количество частей до прерывания
+    """
+    calls: list[int] = []
+
+    def failing_copy_part(
+        self: CopyEngine,
+        source_file: io.FileIO,
+        destination_file: io.FileIO,
+        offset: int,
+        end: int,
+    ) -> None:
+        if len(calls) == parts:
+            raise OSError("Копирование прервано")
+        calls.append(offset)
+        COPY_PART(self, source_file, destination_file, offset, end)
+
+    monkeypatch.setattr(cp, "CHECKPOINT_INTERVAL", 4096)
+    monkeypatch.setattr(CopyEngine, "clone", lambda self, *args: False)
+    monkeypatch.setattr(CopyEngine, "copy_part", failing_copy_part)
+
+
+def make_tree(root: Path) -> None:
+    """
+    Создаёт дерево из нескольких директорий с файлами
+    :param root: Корень дерева
+    """
+    for directory in range(5):
+        subdirectory = root / f"dir{directory}" / "nested"
+        subdirectory.mkdir(parents=True)
+        for number in range(20):
+            file = subdirectory.parent / f"file{number}.txt"
+            file.write_text(f"{directory}-{number}")
+        (subdirectory / "deep.bin").write_bytes(os.urandom(5000))
 
 
 class TestsCp:
@@ -256,3 +307,470 @@ class TestsCp:
 
         assert destination.exists()
         assert destination.read_text() == ""
+
+    def test_cp_recursive_parallel(self, make_temp_directory: Path) -> None:
+        """
+        Проверяет копирование дерева в несколько потоков
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        source = make_temp_directory / "source"
+        make_tree(source)
+        destination = make_temp_directory / "copied"
+
+        tokens = argparse.Namespace(
+            paths=[str(source), str(destination)], recursive=True, jobs=4
+        )
+        Cp().execute(tokens)
+
+        for path in source.rglob("*"):
+            copied = destination / path.relative_to(source)
+            if path.is_dir():
+                assert copied.is_dir()
+            else:
+                assert copied.read_bytes() == path.read_bytes()
+
+    def test_cp_recursive_keeps_metadata(
+        self, make_temp_structure: Path
+    ) -> None:
+        """
+        Проверяет, что файлы и директории сохраняют права и время
+        изменения, несмотря на создание файлов внутри директорий
+        :param make_temp_structure: Фикстура с тестовой структурой
+        """
+        file = make_temp_structure / "file1.txt"
+        file.chmod(0o600)
+        for path in (file, make_temp_structure / "subdirectory"):
+            os.utime(path, ns=(OLD_TIME_NS, OLD_TIME_NS))
+        destination = make_temp_structure.parent / "copied"
+
+        tokens = argparse.Namespace(
+            paths=[str(make_temp_structure), str(destination)],
+            recursive=True,
+            jobs=2,
+        )
+        Cp().execute(tokens)
+
+        copied_file = destination / "file1.txt"
+        assert copied_file.stat().st_mode & 0o777 == 0o600
+        assert copied_file.stat().st_mtime_ns == OLD_TIME_NS
+        subdirectory = destination / "subdirectory"
+        assert subdirectory.stat().st_mtime_ns == OLD_TIME_NS
+
+    def test_cp_recursive_restores_metadata_after_data(
+        self, make_temp_structure: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        """
+        Проверяет, что время изменения выставляется после копирования
+        всех данных, директориям — от вложенных к внешним
+        :param make_temp_structure: Фикстура с тестовой структурой
+        :param monkeypatch: Фикстура для подмены объектов
+        """
+        events: list[tuple[str, str]] = []
+        copy_file = CopyEngine.copy_file
+        copystat = cp.shutil.copystat
+
+        def recording_copy_file(
+            self: CopyEngine, source: str, destination: str
+        ) -> str:
+            events.append(("data", destination))
+            return copy_file(self, source, destination)
+
+        def recording_copystat(source: str, destination: str) -> None:
+            events.append(("stat", destination))
+            copystat(source, destination)
+
+        monkeypatch.setattr(CopyEngine, "copy_file", recording_copy_file)
+        monkeypatch.setattr(cp.shutil, "copystat", recording_copystat)
+        destination = make_temp_structure.parent / "copied"
+
+        tokens = argparse.Namespace(
+            paths=[str(make_temp_structure), str(destination)],
+            recursive=True,
+        )
+        Cp().execute(tokens)
+
+        kinds = [kind for kind, _ in events]
+        assert kinds == ["data"] * 3 + ["stat"] * 5
+        assert [path for _, path in events[-2:]] == [
+            str(destination / "subdirectory"),
+            str(destination),
+        ]
+
+    def test_cp_recursive_reports_failed_files(
+        self, make_temp_structure: Path
+    ) -> None:
+        """
+        Проверяет, что ошибка одного файла не останавливает
+        копирование остальных
+        :param make_temp_structure: Фикстура с тестовой структурой
+        :raises CopyingError: Если часть файлов не скопирована
+        """
+        (make_temp_structure / "broken").symlink_to("missing")
+        destination = make_temp_structure.parent / "copied"
+
+        tokens = argparse.Namespace(
+            paths=[str(make_temp_structure), str(destination)],
+            recursive=True,
+            jobs=2,
+        )
+        with pytest.raises(CopyingError) as exc_info:
+            Cp().execute(tokens)
+
+        assert "broken" in str(exc_info.value)
+        assert (destination / "subdirectory" / "nested.txt").exists()
+
+    @pytest.mark.parametrize("side", ["source", "destination"])
+    def test_cp_recursive_reports_special_files(
+        self, make_temp_structure: Path, side: str
+    ) -> None:
+        """
+        Проверяет, что именованный канал в источнике или на месте
+        файла в назначении не открывается, а попадает в ошибки
+        :param make_temp_structure: Фикстура с тестовой структурой
+        :param side: Где находится именованный канал
+        :raises CopyingError: Если часть файлов не скопирована
+        """
+        destination = make_temp_structure.parent / "copied"
+        if side == "source":
+            os.mkfifo(make_temp_structure / "pipe")
+        else:
+            destination.mkdir()
+            os.mkfifo(destination / "file1.txt")
+
+        tokens = argparse.Namespace(
+            paths=[str(make_temp_structure), str(destination)],
+            recursive=True,
+        )
+        with pytest.raises(CopyingError) as exc_info:
+            Cp().execute(tokens)
+
+        assert "не обычный файл" in str(exc_info.value)
+        assert (destination / "subdirectory" / "nested.txt").exists()
+
+    def test_cp_recursive_symlink_loop(
+        self, make_temp_structure: Path
+    ) -> None:
+        """
+        Проверяет, что ссылка на родительскую директорию
+        не копируется бесконечно
+        :param make_temp_structure: Фикстура с тестовой структурой
+        """
+        loop = make_temp_structure / "subdirectory" / "loop"
+        loop.symlink_to(make_temp_structure)
+        destination = make_temp_structure.parent / "copied"
+
+        tokens = argparse.Namespace(
+            paths=[str(make_temp_structure), str(destination)],
+            recursive=True,
+        )
+        Cp().execute(tokens)
+
+        assert (destination / "subdirectory" / "nested.txt").exists()
+        assert not (destination / "subdirectory" / "loop").exists()
+
+    def test_cp_update_skips_unchanged(
+        self, make_temp_structure: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет, что повторное копирование с --update
+        пропускает неизменённые файлы
+        :param make_temp_structure: Фикстура с тестовой структурой
+        :param capsys: Фикстура для захвата stdout
+        """
+        destination = make_temp_structure.parent / "copied"
+        tokens = argparse.Namespace(
+            paths=[str(make_temp_structure), str(destination)],
+            recursive=True,
+            update=True,
+        )
+        Cp().execute(tokens)
+        assert "Скопировано: 3, без изменений: 0" in capsys.readouterr().out
+
+        (make_temp_structure / "file1.txt").write_text("changed")
+        Cp().execute(tokens)
+
+        assert "Скопировано: 1, без изменений: 2" in capsys.readouterr().out
+        assert (destination / "file1.txt").read_text() == "changed"
+
+    def test_cp_checksum_compares_content(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет, что --checksum находит изменение содержимого
+        при том же размере и времени изменения
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        source = make_temp_directory / "source.txt"
+        source.write_text("new")
+        destination = make_temp_directory / "destination.txt"
+        destination.write_text("old")
+        for path in (source, destination):
+            os.utime(path, ns=(OLD_TIME_NS, OLD_TIME_NS))
+
+        tokens = argparse.Namespace(
+            paths=[str(source), str(destination)],
+            recursive=False,
+            update=True,
+        )
+        Cp().execute(tokens)
+        assert destination.read_text() == "old"
+
+        tokens.checksum = True
+        Cp().execute(tokens)
+
+        assert destination.read_text() == "new"
+        assert "Скопировано: 1, без изменений: 0" in capsys.readouterr().out
+
+    def test_cp_delta_rewrites_changed_blocks(
+        self,
+        make_temp_directory: Path,
+        capsys: CaptureFixture[str],
+        monkeypatch: MonkeyPatch,
+    ) -> None:
+        """
+        Проверяет, что --delta записывает только изменённые блоки
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        :param monkeypatch: Фикстура для подмены объектов
+        """
+        monkeypatch.setattr(cp, "DELTA_MIN_SIZE", 0)
+        source = make_temp_directory / "source.bin"
+        data = bytearray(os.urandom(1 << 20))
+        source.write_bytes(data)
+        destination = make_temp_directory / "destination.bin"
+        data[0] ^= 0xFF
+        destination.write_bytes(data)
+
+        tokens = argparse.Namespace(
+            paths=[str(source), str(destination)],
+            recursive=False,
+            delta=True,
+        )
+        Cp().execute(tokens)
+
+        assert destination.read_bytes() == source.read_bytes()
+        assert destination.stat().st_mtime_ns == source.stat().st_mtime_ns
+        assert "записано байт: 131072" in capsys.readouterr().out
+
+    def test_cp_interrupted_copy_keeps_checkpoint(
+        self, make_temp_directory: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        """
+        Проверяет, что прерванное копирование не трогает назначение
+        и оставляет временный файл и запись в журнале
+        :param make_temp_directory: Фикстура для временных директорий
+        :param monkeypatch: Фикстура для подмены объектов
+        """
+        interrupt_after(monkeypatch, 2)
+        source = make_temp_directory / "source.bin"
+        source.write_bytes(os.urandom(20000))
+        destination = make_temp_directory / "destination.bin"
+
+        command = Cp()
+        tokens = argparse.Namespace(
+            paths=[str(source), str(destination)],
+            recursive=False,
+            resume=True,
+        )
+        with pytest.raises(OSError):
+            command.execute(tokens)
+
+        journal = CopyJournal(command.journal_path)
+        journal.load()
+        checkpoint = journal.get(str(destination))
+
+        assert not destination.exists()
+        assert checkpoint is not None
+        assert checkpoint[3] == 8192
+        partial = make_temp_directory / ".destination.bin.cp-partial"
+        assert partial.read_bytes()[:8192] == source.read_bytes()[:8192]
+
+    def test_cp_large_file_uses_copy_engine(
+        self, make_temp_directory: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        """
+        Проверяет, что без --resume большой файл копируется
+        через CopyEngine.copy, как и маленький
+        :param make_temp_directory: Фикстура для временных директорий
+        :param monkeypatch: Фикстура для подмены объектов
+        """
+        calls: list[tuple[str, str]] = []
+        copy = CopyEngine.copy
+
+        def recording_copy(
+            self: CopyEngine, source: str, destination: str
+        ) -> str:
+            calls.append((source, destination))
+            return copy(self, source, destination)
+
+        monkeypatch.setattr(CopyEngine, "copy", recording_copy)
+        source = make_temp_directory / "source.bin"
+        with open(source, "wb") as file:
+            file.truncate(LARGE_FILE_SIZE)
+        destination = make_temp_directory / "destination.bin"
+
+        tokens = argparse.Namespace(
+            paths=[str(source), str(destination)], recursive=False
+        )
+        Cp().execute(tokens)
+
+        assert calls == [(str(source), str(destination))]
+        assert destination.stat().st_size == LARGE_FILE_SIZE
+
+    def test_cp_without_resume_keeps_no_checkpoint(
+        self, make_temp_directory: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        """
+        Проверяет, что без --resume файл копируется без временного
+        файла и журнала
+        :param make_temp_directory: Фикстура для временных директорий
+        :param monkeypatch: Фикстура для подмены объектов
+        """
+        interrupt_after(monkeypatch, 2)
+        source = make_temp_directory / "source.bin"
+        source.write_bytes(os.urandom(20000))
+        destination = make_temp_directory / "destination.bin"
+
+        command = Cp()
+        tokens = argparse.Namespace(
+            paths=[str(source), str(destination)], recursive=False
+        )
+        command.execute(tokens)
+
+        journal = CopyJournal(command.journal_path)
+        journal.load()
+
+        assert destination.read_bytes() == source.read_bytes()
+        assert journal.get(str(destination)) is None
+        assert not (
+            make_temp_directory / ".destination.bin.cp-partial"
+        ).exists()
+
+    def test_cp_resume_continues_from_checkpoint(
+        self,
+        make_temp_directory: Path,
+        monkeypatch: MonkeyPatch,
+        capsys: CaptureFixture[str],
+    ) -> None:
+        """
+        Проверяет продолжение копирования с сохранённой позиции
+        :param make_temp_directory: Фикстура для временных директорий
+        :param monkeypatch: Фикстура для подмены объектов
+        :param capsys: Фикстура для захвата stdout
+        """
+        interrupt_after(monkeypatch, 2)
+        source = make_temp_directory / "source.bin"
+        source.write_bytes(os.urandom(20000))
+        destination = make_temp_directory / "destination.bin"
+        tokens = argparse.Namespace(
+            paths=[str(source), str(destination)],
+            recursive=False,
+            resume=True,
+        )
+        with pytest.raises(OSError):
+            Cp().execute(tokens)
+
+        interrupt_after(monkeypatch, 10)
+        command = Cp()
+        command.execute(tokens)
+
+        journal = CopyJournal(command.journal_path)
+        journal.load()
+
+        assert "с байта 8192" in capsys.readouterr().out
+        assert destination.read_bytes() == source.read_bytes()
+        assert journal.get(str(destination)) is None
+        assert not (
+            make_temp_directory / ".destination.bin.cp-partial"
+        ).exists()
+
+    def test_cp_resume_restarts_changed_source(
+        self,
+        make_temp_directory: Path,
+        monkeypatch: MonkeyPatch,
+        capsys: CaptureFixture[str],
+    ) -> None:
+        """
+        Проверяет, что изменённый источник копируется с начала
+        :param make_temp_directory: Фикстура для временных директорий
+        :param monkeypatch: Фикстура для подмены объектов
+        :param capsys: Фикстура для захвата stdout
+        """
+        interrupt_after(monkeypatch, 1)
+        source = make_temp_directory / "source.bin"
+        source.write_bytes(os.urandom(20000))
+        destination = make_temp_directory / "destination.bin"
+        tokens = argparse.Namespace(
+            paths=[str(source), str(destination)],
+            recursive=False,
+            resume=True,
+        )
+        with pytest.raises(OSError):
+            Cp().execute(tokens)
+
+        source.write_bytes(os.urandom(30000))
+        interrupt_after(monkeypatch, 10)
+        Cp().execute(tokens)
+
+        assert "с начала" in capsys.readouterr().out
+        assert destination.read_bytes() == source.read_bytes()
+
+    def test_cp_logs_metrics(self, make_temp_structure: Path) -> None:
+        """
+        Проверяет запись объёма и скорости копирования в лог
+        :param make_temp_structure: Фикстура с тестовой структурой
+        """
+        destination = make_temp_structure.parent / "copied"
+        tokens = argparse.Namespace(
+            paths=[str(make_temp_structure), str(destination)],
+            recursive=True,
+            jobs=2,
+        )
+
+        with patch("src.utils.logger.logging.info") as mock_info:
+            Cp().execute(tokens)
+
+        assert mock_info.call_args[0][0].startswith(
+            "METRICS: cp DONE: 24 байт, 3 файлов"
+        )
+
+    @pytest.mark.parametrize("target", [".", "copy", "subdirectory/copy"])
+    def test_cp_recursive_into_itself_raises_error(
+        self, make_temp_structure: Path, target: str
+    ) -> None:
+        """
+        Проверяет ошибку при копировании директории в саму себя
+        или в свою поддиректорию
+        :param make_temp_structure: Фикстура с тестовой структурой
+        :param target: Назначение относительно источника
+        :raises CopyingError: Если директория копируется в саму себя
+        """
+        destination = make_temp_structure / target
+
+        tokens = argparse.Namespace(
+            paths=[str(make_temp_structure), str(destination)],
+            recursive=True,
+        )
+        with pytest.raises(CopyingError):
+            Cp().execute(tokens)
+
+        assert destination.exists() == (target == ".")
+
+    def test_cp_recursive_into_sibling_with_common_prefix(
+        self, make_temp_structure: Path
+    ) -> None:
+        """
+        Проверяет, что директория с тем же началом имени
+        не считается поддиректорией источника
+        :param make_temp_structure: Фикстура с тестовой структурой
+        """
+        destination = Path(f"{make_temp_structure}-copy")
+
+        tokens = argparse.Namespace(
+            paths=[str(make_temp_structure), str(destination)],
+            recursive=True,
+        )
+        Cp().execute(tokens)
+
+        assert (destination / "file1.txt").read_text() == "file1"
@@ -0,0 +1,150 @@
+import argparse
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from _pytest.capture import CaptureFixture
+from _pytest.monkeypatch import MonkeyPatch
+
+from src.filesystem.du import Du
+from src.utils.errors import PathNotFoundError
+
+OLD_TIME_NS = 1_000_000_000_000_000_000
+
+
+def du_tokens(paths: list[str], **options: object) -> argparse.Namespace:
+    """
+    Создаёт аргументы команды du
+    :param paths: Пути для подсчёта
+    :param options: Дополнительные флаги
+    :return: Аргументы команды
+    """
+    return argparse.Namespace(paths=paths, **options)
+
+
+def parse_output(output: str) -> dict[str, int]:
+    """
+    Разбирает вывод du в словарь путь -> размер
+    :param output: Вывод команды
+    :return: Размеры по путям
+    """
+    result = {}
+    for line in output.splitlines():
+        size, path = line.split("\t")
+        result[path] = int(size)
+    return result
+
+
+class TestsDu:
+    """Тесты для команды du"""
+
+    def test_du_apparent_size_tree(
+        self, make_temp_structure: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет суммы размеров по директориям дерева
+        :param make_temp_structure: Фикстура с тестовой структурой
+        :param capsys: Фикстура для захвата stdout
+        """
+        root = str(make_temp_structure)
+        Du().execute(du_tokens([root], apparent_size=True, jobs=2))
+        sizes = parse_output(capsys.readouterr().out)
+
+        subdirectory = os.path.join(root, "subdirectory")
+        directory_size = os.stat(subdirectory).st_size
+        root_size = os.stat(root).st_size
+
+        assert list(sizes) == [subdirectory, root]
+        assert sizes[subdirectory] == directory_size + 14
+        assert sizes[root] == root_size + 10 + sizes[subdirectory]
+
+    def test_du_counts_hardlinks_once(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет, что жёсткие ссылки на файл учитываются один раз
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        root = make_temp_directory / "data"
+        (root / "a").mkdir(parents=True)
+        (root / "b").mkdir()
+        (root / "a" / "file.bin").write_bytes(b"x" * 1000)
+        os.link(root / "a" / "file.bin", root / "b" / "link.bin")
+
+        Du().execute(
+            du_tokens([str(root)], apparent_size=True, summarize=True)
+        )
+        sizes = parse_output(capsys.readouterr().out)
+
+        directories = sum(
+            os.stat(path).st_size for path in (root, root / "a", root / "b")
+        )
+        assert sizes == {str(root): directories + 1000}
+
+    def test_du_disk_usage_in_kib(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет подсчёт места на диске по st_blocks
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        file = make_temp_directory / "file.bin"
+        file.write_bytes(os.urandom(10000))
+
+        Du().execute(du_tokens([str(file)]))
+        sizes = parse_output(capsys.readouterr().out)
+
+        assert sizes[str(file)] == -(-os.stat(file).st_blocks * 512 // 1024)
+
+    def test_du_cache_skips_unchanged_directories(
+        self,
+        make_temp_structure: Path,
+        capsys: CaptureFixture[str],
+        monkeypatch: MonkeyPatch,
+    ) -> None:
+        """
+        Проверяет, что неизменённые директории берутся из кэша
+        :param make_temp_structure: Фикстура с тестовой структурой
+        :param capsys: Фикстура для захвата stdout
+        :param monkeypatch: Фикстура для подмены функций
+        """
+        root = make_temp_structure
+        subdirectory = root / "subdirectory"
+        for directory in (root, subdirectory):
+            os.utime(directory, ns=(OLD_TIME_NS, OLD_TIME_NS))
+
+        tokens = du_tokens([str(root)], apparent_size=True, cache=True)
+        Du().execute(tokens)
+        first = capsys.readouterr().out
+
+        (subdirectory / "new.txt").write_text("12345")
+        scanned: list[str] = []
+        original_scandir = os.scandir
+
+        def tracking_scandir(path: str):
+            scanned.append(path)
+            return original_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", tracking_scandir)
+        with patch("src.utils.logger.logging.info") as mock_info:
+            Du().execute(tokens)
+        second = capsys.readouterr().out
+
+        first_sizes = parse_output(first)
+        second_sizes = parse_output(second)
+        assert scanned == [str(subdirectory)]
+        assert second_sizes[str(root)] > first_sizes[str(root)]
+        assert mock_info.call_args[0][0] == (
+            "CACHE: du: попаданий 1, промахов 1"
+        )
+
+    def test_du_missing_path_raises_error(self) -> None:
+        """
+        Проверяет ошибку для несуществующего пути
+        :raises PathNotFoundError: Если путь не существует
+        """
+        with pytest.raises(PathNotFoundError):
+            Du().execute(du_tokens(["missing_directory"]))
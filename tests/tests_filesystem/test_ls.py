@@ -1,11 +1,15 @@
 import argparse
+import json
+import os
+import sys
 from pathlib import Path
+from typing import Any
 
 import pytest
 from _pytest.capture import CaptureFixture
 from _pytest.monkeypatch import MonkeyPatch
 
-from src.filesystem.ls import Ls
+from src.filesystem.ls import READ_AHEAD_PER_JOB, Ls
 from src.utils.errors import ShellError
 
 
@@ -63,7 +67,11 @@ class TestsLs:
         (make_temp_directory / "file2.txt").write_text("content")
 
         tokens = argparse.Namespace(
-            paths=[str(make_temp_directory)], l=False, al=False, all=False
+            paths=[str(make_temp_directory)],
+            l=False,
+            al=False,
+            all=False,
+            color="always",
         )
         Ls().execute(tokens)
         captured = capsys.readouterr()
@@ -84,7 +92,11 @@ class TestsLs:
         (make_temp_directory / "file.txt").write_text("content")
 
         tokens = argparse.Namespace(
-            paths=[str(make_temp_directory)], l=False, al=False, all=False
+            paths=[str(make_temp_directory)],
+            l=False,
+            al=False,
+            all=False,
+            color="always",
         )
         Ls().execute(tokens)
         captured = capsys.readouterr()
@@ -123,7 +135,11 @@ class TestsLs:
         (make_temp_directory / "subdir").mkdir()
 
         tokens = argparse.Namespace(
-            paths=[str(make_temp_directory)], l=True, al=False, all=False
+            paths=[str(make_temp_directory)],
+            l=True,
+            al=False,
+            all=False,
+            color="always",
         )
         Ls().execute(tokens)
         captured = capsys.readouterr()
@@ -142,7 +158,11 @@ class TestsLs:
         (make_temp_directory / "file.txt").write_text("content")
 
         tokens = argparse.Namespace(
-            paths=[str(make_temp_directory)], l=True, al=False, all=False
+            paths=[str(make_temp_directory)],
+            l=True,
+            al=False,
+            all=False,
+            color="always",
         )
         Ls().execute(tokens)
         captured = capsys.readouterr()
@@ -357,3 +377,438 @@ class TestsLs:
 
         assert "file.txt" in captured.out
         assert "another.txt" in captured.out
+
+    def test_ls_detailed_does_not_stat_by_path(
+        self,
+        make_temp_directory: Path,
+        capsys: CaptureFixture[str],
+        monkeypatch: MonkeyPatch,
+    ) -> None:
+        """
+        Проверяет, что количество os.stat не зависит от числа записей
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        :param monkeypatch: Фикстура для изменения окружения
+        """
+        for index in range(50):
+            (make_temp_directory / f"file{index}.txt").write_text("content")
+            (make_temp_directory / f"dir{index}").mkdir()
+
+        calls = []
+        original_stat = os.stat
+
+        def counting_stat(path, *args, **kwargs):
+            calls.append(path)
+            return original_stat(path, *args, **kwargs)
+
+        monkeypatch.setattr(os, "stat", counting_stat)
+        tokens = argparse.Namespace(
+            paths=[str(make_temp_directory)], l=True, al=False, all=False
+        )
+        Ls().execute(tokens)
+        captured = capsys.readouterr()
+
+        assert "file49.txt" in captured.out
+        assert len(calls) < 5
+
+    def test_ls_recursive_depth_first(
+        self, make_temp_structure: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет порядок разделов рекурсивного вывода
+        :param make_temp_structure: Фикстура с тестовой структурой
+        :param capsys: Фикстура для захвата stdout
+        """
+        (make_temp_structure / "subdirectory" / "deep").mkdir()
+        (make_temp_structure / "zeta").mkdir()
+
+        tokens = argparse.Namespace(
+            paths=[str(make_temp_structure)],
+            l=False,
+            al=False,
+            all=False,
+            recursive=True,
+            jobs=4,
+        )
+        Ls().execute(tokens)
+        captured = capsys.readouterr()
+
+        headers = [
+            line for line in captured.out.splitlines() if line.endswith(":")
+        ]
+        root = str(make_temp_structure)
+        assert headers == [
+            f"{root}:",
+            f"{os.path.join(root, 'subdirectory')}:",
+            f"{os.path.join(root, 'subdirectory', 'deep')}:",
+            f"{os.path.join(root, 'zeta')}:",
+        ]
+
+    def test_ls_recursive_symlink_loop(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет, что цикл символических ссылок не зацикливает обход
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        root = make_temp_directory / "root"
+        (root / "child").mkdir(parents=True)
+        (root / "child" / "back").symlink_to(root)
+
+        tokens = argparse.Namespace(
+            paths=[str(root)],
+            l=False,
+            al=False,
+            all=False,
+            recursive=True,
+            jobs=2,
+        )
+        Ls().execute(tokens)
+        captured = capsys.readouterr()
+
+        headers = [
+            line for line in captured.out.splitlines() if line.endswith(":")
+        ]
+        assert headers == [f"{root}:", f"{root / 'child'}:"]
+        assert "back" in captured.out
+
+    def test_ls_sort_by_size_with_head(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет вывод N самых больших файлов
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        directory = make_temp_directory / "data"
+        directory.mkdir()
+        (directory / "small.txt").write_text("a")
+        (directory / "large.txt").write_text("a" * 100)
+        (directory / "medium.txt").write_text("a" * 10)
+
+        tokens = argparse.Namespace(
+            paths=[str(directory)],
+            l=False,
+            al=False,
+            all=False,
+            sort_size=True,
+            head=2,
+        )
+        Ls().execute(tokens)
+        captured = capsys.readouterr()
+
+        assert captured.out.find("large.txt") < captured.out.find("medium")
+        assert "small.txt" not in captured.out
+
+    def test_ls_sort_by_time(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет сортировку по времени изменения, сначала новые
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        directory = make_temp_directory / "data"
+        directory.mkdir()
+        old = directory / "a_old.txt"
+        new = directory / "b_new.txt"
+        old.write_text("old")
+        new.write_text("new")
+        os.utime(old, ns=(1_000_000_000, 1_000_000_000))
+        os.utime(new, ns=(2_000_000_000, 2_000_000_000))
+
+        tokens = argparse.Namespace(
+            paths=[str(directory)],
+            l=False,
+            al=False,
+            all=False,
+            sort_time=True,
+        )
+        Ls().execute(tokens)
+        captured = capsys.readouterr()
+
+        assert captured.out.find("b_new.txt") < captured.out.find("a_old")
+
+    def test_ls_unsorted_head(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет потоковый вывод без сортировки с ограничением
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        directory = make_temp_directory / "data"
+        directory.mkdir()
+        for index in range(5):
+            (directory / f"file{index}.txt").write_text("content")
+
+        tokens = argparse.Namespace(
+            paths=[str(directory)],
+            l=True,
+            al=False,
+            all=False,
+            unsorted=True,
+            head=3,
+        )
+        Ls().execute(tokens)
+        captured = capsys.readouterr()
+
+        assert captured.out.count(".txt") == 3
+
+    def test_ls_without_terminal_has_no_colors(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет вывод без цветов по одному имени в строке вне терминала
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        directory = make_temp_directory / "data"
+        directory.mkdir()
+        (directory / "a.txt").write_text("content")
+        (directory / "b").mkdir()
+
+        tokens = argparse.Namespace(
+            paths=[str(directory)], l=False, al=False, all=False
+        )
+        Ls().execute(tokens)
+        captured = capsys.readouterr()
+
+        assert "\033[" not in captured.out
+        assert captured.out == f"{directory}:\na.txt\nb\n\n"
+
+    def test_ls_columns_fit_terminal_width(self) -> None:
+        """
+        Проверяет раскладку имён по столбцам сверху вниз
+        """
+        command = Ls()
+        command._width = 20
+        lengths = [5, 5, 5, 5, 12]
+
+        rows_count, widths = command._column_layout(lengths)
+
+        assert rows_count == 3
+        assert widths == [7, 14]
+        assert sum(widths) - 2 <= 20
+
+    def test_ls_columns_skip_non_fitting_count(self) -> None:
+        """
+        Проверяет, что раскладка находится и тогда, когда меньшее
+        количество столбцов не помещается, а большее помещается
+        """
+        command = Ls()
+        command._width = 21
+        lengths = [4, 2, 9, 11, 2]
+
+        rows_count, widths = command._column_layout(lengths)
+
+        assert rows_count == 2
+        assert widths == [6, 13, 4]
+
+    def test_ls_recursive_bounded_read_ahead(
+        self,
+        make_temp_directory: Path,
+        capsys: CaptureFixture[str],
+        monkeypatch: MonkeyPatch,
+    ) -> None:
+        """
+        Проверяет, что заранее прочитанных, но не выведенных директорий
+        не больше jobs * READ_AHEAD_PER_JOB и что дерево выводится целиком
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        :param monkeypatch: Фикстура для подмены функций
+        """
+        root = make_temp_directory / "root"
+        for index in range(30):
+            for child in range(3):
+                (root / f"dir{index:02}" / f"sub{child}").mkdir(parents=True)
+
+        scan_level = Ls._scan_level
+        print_section = Ls._print_section
+        counters = {"scanned": 0, "printed": 0, "ahead": 0}
+
+        def counting_scan(self: Ls, abs_path: str, all_files: bool) -> tuple:
+            counters["scanned"] += 1
+            return scan_level(self, abs_path, all_files)
+
+        def counting_print(self: Ls, *args: Any) -> None:
+            counters["ahead"] = max(
+                counters["ahead"], counters["scanned"] - counters["printed"]
+            )
+            counters["printed"] += 1
+            print_section(self, *args)
+
+        monkeypatch.setattr(Ls, "_scan_level", counting_scan)
+        monkeypatch.setattr(Ls, "_print_section", counting_print)
+
+        jobs = 2
+        tokens = argparse.Namespace(
+            paths=[str(root)],
+            l=False,
+            al=False,
+            all=False,
+            recursive=True,
+            jobs=jobs,
+        )
+        Ls().execute(tokens)
+        captured = capsys.readouterr()
+
+        headers = [
+            line for line in captured.out.splitlines() if line.endswith(":")
+        ]
+        assert len(headers) == 1 + 30 + 30 * 3
+        assert counters["ahead"] <= jobs * READ_AHEAD_PER_JOB + 1
+
+    def test_ls_detailed_aligns_sizes(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет выравнивание столбца размера по самому длинному значению
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        directory = make_temp_directory / "data"
+        directory.mkdir()
+        (directory / "big.txt").write_text("x" * 12345)
+        (directory / "small.txt").write_text("x")
+
+        tokens = argparse.Namespace(
+            paths=[str(directory)], l=True, al=False, all=False
+        )
+        Ls().execute(tokens)
+        lines = capsys.readouterr().out.splitlines()[1:3]
+
+        assert " 12345 " in lines[0]
+        assert "     1 " in lines[1]
+        assert lines[0].index("big.txt") == lines[1].index("small.txt")
+
+    def test_ls_detailed_broken_symlink(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет, что битая символическая ссылка выводится
+        в подробном формате по stat самой ссылки
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        directory = make_temp_directory / "data"
+        directory.mkdir()
+        (directory / "file.txt").write_text("content")
+        (directory / "broken").symlink_to(directory / "missing.txt")
+
+        tokens = argparse.Namespace(
+            paths=[str(directory)], l=True, al=False, all=False
+        )
+        Ls().execute(tokens)
+        captured = capsys.readouterr()
+
+        lines = captured.out.splitlines()
+        broken = [line for line in lines[1:] if "broken" in line]
+        assert len(broken) == 1
+        assert broken[0].startswith("l")
+        assert any("file.txt" in line for line in lines[1:])
+
+    def test_ls_writes_section_at_once(
+        self, make_temp_directory: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        """
+        Проверяет, что раздел выводится одним вызовом write
+        :param make_temp_directory: Фикстура для временных директорий
+        :param monkeypatch: Фикстура для подмены функций
+        """
+        for index in range(100):
+            (make_temp_directory / f"file{index}.txt").write_text("content")
+
+        writes: list[str] = []
+        monkeypatch.setattr(sys.stdout, "write", writes.append)
+        tokens = argparse.Namespace(
+            paths=[str(make_temp_directory)], l=True, al=False, all=False
+        )
+        Ls().execute(tokens)
+
+        assert len(writes) == 2
+        assert writes[0].count(".txt") == 100
+
+    def test_ls_json_records(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет вывод записей массивом JSON
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        directory = make_temp_directory / "data"
+        directory.mkdir()
+        (directory / "file.txt").write_text("content")
+        (directory / "sub").mkdir()
+        (directory / "link").symlink_to(directory / "file.txt")
+
+        tokens = argparse.Namespace(
+            paths=[str(directory)], l=False, al=False, all=False, json=True
+        )
+        Ls().execute(tokens)
+        records = json.loads(capsys.readouterr().out)
+
+        by_name = {record["name"]: record for record in records}
+        stats = os.stat(directory / "file.txt")
+        assert [record["name"] for record in records] == [
+            "file.txt",
+            "link",
+            "sub",
+        ]
+        assert by_name["file.txt"] == {
+            "directory": str(directory),
+            "name": "file.txt",
+            "type": "file",
+            "size": 7,
+            "mode": stats.st_mode,
+            "mtime_ns": stats.st_mtime_ns,
+            "inode": stats.st_ino,
+        }
+        assert by_name["link"]["type"] == "symlink"
+        assert by_name["sub"]["type"] == "directory"
+
+    def test_ls_json_empty_directory(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет пустой массив для пустой директории
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        directory = make_temp_directory / "empty"
+        directory.mkdir()
+
+        tokens = argparse.Namespace(
+            paths=[str(directory)], l=False, al=False, all=False, json=True
+        )
+        Ls().execute(tokens)
+
+        assert json.loads(capsys.readouterr().out) == []
+
+    def test_ls_ndjson_recursive(
+        self, make_temp_structure: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет потоковый вывод по одному объекту в строке
+        :param make_temp_structure: Фикстура с тестовой структурой
+        :param capsys: Фикстура для захвата stdout
+        """
+        tokens = argparse.Namespace(
+            paths=[str(make_temp_structure)],
+            l=False,
+            al=False,
+            all=False,
+            recursive=True,
+            jobs=2,
+            ndjson=True,
+        )
+        Ls().execute(tokens)
+        lines = capsys.readouterr().out.splitlines()
+        records = [json.loads(line) for line in lines]
+
+        directories = {record["directory"] for record in records}
+        assert str(make_temp_structure / "subdirectory") in directories
+        assert all("\033[" not in line for line in lines)
+        assert len(records) == len(lines)
@@ -1,6 +1,7 @@
 import argparse
 import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
@@ -276,3 +277,21 @@ class TestsMv:
 
         assert not source.exists()
         assert destination.exists()
+
+    def test_mv_logs_metrics(self, make_temp_directory: Path) -> None:
+        """
+        Проверяет, что переименование учитывается как один файл
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        source = make_temp_directory / "source.txt"
+        source.write_text("content")
+        destination = make_temp_directory / "destination.txt"
+
+        with patch("src.utils.logger.logging.info") as mock_info:
+            Mv().execute(
+                argparse.Namespace(paths=[str(source), str(destination)])
+            )
+
+        assert mock_info.call_args[0][0].startswith(
+            "METRICS: mv DONE: 0 байт, 1 файлов"
+        )
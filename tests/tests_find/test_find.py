@@ -0,0 +1,129 @@
+import argparse
+import os
+from pathlib import Path
+
+import pytest
+from _pytest.capture import CaptureFixture
+from _pytest.monkeypatch import MonkeyPatch
+
+from src.find.find import Find
+from src.utils.errors import ExpressionSyntaxError, PathNotFoundError
+
+
+def run_find(arguments: list[str], capsys: CaptureFixture[str]) -> list[str]:
+    """
+    Выполняет find и возвращает строки вывода
+    :param arguments: Стартовые пути и выражение
+    :param capsys: Фикстура для захвата stdout
+    :return: Строки вывода
+    """
+    Find().execute(argparse.Namespace(arguments=arguments))
+    return capsys.readouterr().out.splitlines()
+
+
+class TestsFind:
+    """Тесты для команды find"""
+
+    def test_find_all_preorder(
+        self, make_temp_structure: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет вывод всех путей: директория перед содержимым
+        :param make_temp_structure: Фикстура с тестовой структурой
+        :param capsys: Фикстура для захвата stdout
+        """
+        root = str(make_temp_structure)
+
+        assert run_find([root], capsys) == [
+            root,
+            os.path.join(root, "file1.txt"),
+            os.path.join(root, "file2.txt"),
+            os.path.join(root, "subdirectory"),
+            os.path.join(root, "subdirectory", "nested.txt"),
+        ]
+
+    def test_find_name_relative_path(
+        self,
+        make_temp_structure: Path,
+        capsys: CaptureFixture[str],
+        monkeypatch: MonkeyPatch,
+    ) -> None:
+        """
+        Проверяет поиск по имени с относительным стартовым путём
+        :param make_temp_structure: Фикстура с тестовой структурой
+        :param capsys: Фикстура для захвата stdout
+        :param monkeypatch: Фикстура для смены директории
+        """
+        monkeypatch.chdir(make_temp_structure)
+
+        assert run_find(["-name", "n*.txt"], capsys) == [
+            "./subdirectory/nested.txt"
+        ]
+
+    def test_find_prune(
+        self, make_temp_structure: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет, что -prune не даёт спуститься в директорию
+        :param make_temp_structure: Фикстура с тестовой структурой
+        :param capsys: Фикстура для захвата stdout
+        """
+        root = str(make_temp_structure)
+        arguments = [root, "-name", "subdirectory", "-prune", "-o"]
+        arguments += ["-type", "f"]
+
+        assert run_find(arguments, capsys) == [
+            os.path.join(root, "file1.txt"),
+            os.path.join(root, "file2.txt"),
+            os.path.join(root, "subdirectory"),
+        ]
+
+    def test_find_size_and_type(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет сочетание проверок размера и типа
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        root = make_temp_directory / "data"
+        root.mkdir()
+        (root / "big.bin").write_bytes(b"x" * 5000)
+        (root / "small.bin").write_bytes(b"x")
+        (root / "link").symlink_to(root / "big.bin")
+
+        result = run_find([str(root), "-type", "f", "-size", "+4k"], capsys)
+
+        assert result == [str(root / "big.bin")]
+
+    def test_find_does_not_follow_symlinks(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет, что ссылки на директории не раскрываются
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        root = make_temp_directory / "data"
+        (root / "inner").mkdir(parents=True)
+        (root / "inner" / "loop").symlink_to(root)
+
+        result = run_find([str(root), "-name", "loop"], capsys)
+
+        assert result == [str(root / "inner" / "loop")]
+
+    def test_find_invalid_expression_raises_error(self) -> None:
+        """
+        Проверяет ошибку для некорректного выражения
+        :raises ExpressionSyntaxError: Если выражение некорректно
+        """
+        with pytest.raises(ExpressionSyntaxError):
+            Find().execute(argparse.Namespace(arguments=[".", "-bogus"]))
+
+    def test_find_missing_path_raises_error(self) -> None:
+        """
+        Проверяет ошибку для несуществующего стартового пути
+        :raises PathNotFoundError: Если путь не существует
+        """
+        with pytest.raises(PathNotFoundError):
+            Find().execute(argparse.Namespace(arguments=["missing"]))
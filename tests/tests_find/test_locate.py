@@ -0,0 +1,110 @@
+import argparse
+import os
+from pathlib import Path
+
+import pytest
+from _pytest.capture import CaptureFixture
+
+from src.find.locate import Locate
+from src.find.updatedb import Updatedb
+from src.utils.errors import PathNotFoundError, SearchIndexError
+
+
+def locate_tokens(pattern: str, **options: object) -> argparse.Namespace:
+    """
+    Создаёт аргументы для команды locate
+    :param pattern: Подстрока или шаблон
+    :param options: Дополнительные опции
+    :return: Аргументы команды
+    """
+    return argparse.Namespace(
+        pattern=pattern,
+        ignore_case=options.get("ignore_case", False),
+        limit=options.get("limit"),
+        count=options.get("count", False),
+    )
+
+
+class TestsLocate:
+    """Тесты для команд updatedb и locate"""
+
+    def test_updatedb_and_locate(
+        self, make_temp_structure: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет построение индекса и поиск по нему
+        :param make_temp_structure: Фикстура с тестовой структурой
+        :param capsys: Фикстура для захвата stdout
+        """
+        root = str(make_temp_structure)
+        Updatedb().execute(argparse.Namespace(paths=[root]))
+        assert "записей 4" in capsys.readouterr().out
+
+        Locate().execute(locate_tokens("file"))
+
+        assert capsys.readouterr().out.splitlines() == [
+            os.path.join(root, "file1.txt"),
+            os.path.join(root, "file2.txt"),
+        ]
+
+    def test_updatedb_reuses_roots(
+        self, make_temp_structure: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет обновление ранее проиндексированных корней без путей
+        :param make_temp_structure: Фикстура с тестовой структурой
+        :param capsys: Фикстура для захвата stdout
+        """
+        root = str(make_temp_structure)
+        Updatedb().execute(argparse.Namespace(paths=[root]))
+        (make_temp_structure / "new.txt").write_text("new")
+        capsys.readouterr()
+
+        Updatedb().execute(argparse.Namespace(paths=[]))
+        capsys.readouterr()
+        Locate().execute(locate_tokens("new.txt"))
+
+        assert capsys.readouterr().out == os.path.join(root, "new.txt") + "\n"
+
+    def test_updatedb_without_roots(self) -> None:
+        """
+        Проверяет ошибку при обновлении пустого индекса без путей
+        """
+        with pytest.raises(SearchIndexError):
+            Updatedb().execute(argparse.Namespace(paths=[]))
+
+    def test_updatedb_missing_path(self, make_temp_directory: Path) -> None:
+        """
+        Проверяет ошибку для несуществующего пути
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        missing = str(make_temp_directory / "missing")
+
+        with pytest.raises(PathNotFoundError):
+            Updatedb().execute(argparse.Namespace(paths=[missing]))
+
+    def test_locate_without_index(self) -> None:
+        """
+        Проверяет ошибку поиска без построенного индекса
+        """
+        with pytest.raises(SearchIndexError):
+            Locate().execute(locate_tokens("file"))
+
+    def test_locate_limit_and_count(
+        self, make_temp_structure: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет ограничение количества и вывод только количества
+        :param make_temp_structure: Фикстура с тестовой структурой
+        :param capsys: Фикстура для захвата stdout
+        """
+        Updatedb().execute(
+            argparse.Namespace(paths=[str(make_temp_structure)])
+        )
+        capsys.readouterr()
+
+        Locate().execute(locate_tokens("*.txt", limit=2))
+        assert len(capsys.readouterr().out.splitlines()) == 2
+
+        Locate().execute(locate_tokens("*.txt", count=True))
+        assert capsys.readouterr().out == "3\n"
@@ -0,0 +1,173 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from src.find.locate_index import LocateIndex
+
+OLD_TIME_NS = 10**18
+
+
+def age_tree(root: Path) -> None:
+    """
+    Сдвигает время изменения всех директорий дерева в прошлое,
+    чтобы индекс не считал их только что изменёнными
+    :param root: Корень дерева
+    """
+    for directory, _, _ in os.walk(root):
+        os.utime(directory, ns=(OLD_TIME_NS, OLD_TIME_NS))
+
+
+@pytest.fixture
+def make_tree(make_temp_directory: Path) -> Path:
+    """
+    Создаёт дерево для индексации
+    :param make_temp_directory: Фикстура для временных директорий
+    :return: Корень дерева
+    """
+    root = make_temp_directory / "data"
+    (root / "docs" / "api").mkdir(parents=True)
+    (root / "src").mkdir()
+    (root / "README.md").write_text("readme")
+    (root / "docs" / "guide.md").write_text("guide")
+    (root / "docs" / "api" / "Index.html").write_text("index")
+    (root / "src" / "main.py").write_text("main")
+    age_tree(root)
+    return root
+
+
+class TestsLocateIndex:
+    """Тесты для индекса имён locate"""
+
+    def test_update_counts_entries(self, make_tree: Path) -> None:
+        """
+        Проверяет подсчёт директорий и записей при первой индексации
+        :param make_tree: Фикстура с деревом
+        """
+        index = LocateIndex(str(make_tree.parent / "db"))
+
+        assert index.update(str(make_tree)) == (4, 4, 7)
+
+    def test_save_load_roundtrip(self, make_tree: Path) -> None:
+        """
+        Проверяет, что индекс читается с диска без изменений
+        :param make_tree: Фикстура с деревом
+        """
+        index = LocateIndex(str(make_tree.parent / "db"))
+        index.update(str(make_tree))
+        index.save()
+
+        loaded = LocateIndex(index.index_path)
+        loaded.load()
+
+        assert loaded.roots == [str(make_tree)]
+        assert loaded.directories == index.directories
+
+    def test_load_rejects_unknown_format(
+        self, make_temp_directory: Path
+    ) -> None:
+        """
+        Проверяет ошибку при чтении постороннего файла
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        path = make_temp_directory / "db"
+        path.write_bytes(b"garbage")
+
+        with pytest.raises(ValueError):
+            LocateIndex(str(path)).load()
+
+    def test_update_rescans_only_changed(self, make_tree: Path) -> None:
+        """
+        Проверяет, что повторно читаются только изменённые директории
+        :param make_tree: Фикстура с деревом
+        """
+        index = LocateIndex(str(make_tree.parent / "db"))
+        index.update(str(make_tree))
+
+        (make_tree / "src" / "util.py").write_text("util")
+        os.utime(make_tree / "src", ns=(OLD_TIME_NS + 1, OLD_TIME_NS + 1))
+
+        assert index.update(str(make_tree)) == (4, 1, 8)
+        assert str(make_tree / "src" / "util.py") in list(index.search("util"))
+
+    def test_update_forgets_removed_directories(self, make_tree: Path) -> None:
+        """
+        Проверяет удаление из индекса исчезнувших директорий
+        :param make_tree: Фикстура с деревом
+        """
+        index = LocateIndex(str(make_tree.parent / "db"))
+        index.update(str(make_tree))
+
+        (make_tree / "src" / "main.py").unlink()
+        (make_tree / "src").rmdir()
+        os.utime(make_tree, ns=(OLD_TIME_NS + 1, OLD_TIME_NS + 1))
+        index.update(str(make_tree))
+
+        assert os.fsencode(make_tree / "src") not in index.directories
+        assert list(index.search("main")) == []
+
+    def test_racy_directory_rescanned(self, make_temp_directory: Path) -> None:
+        """
+        Проверяет, что только что изменённая директория
+        перечитывается при следующем обновлении
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        root = make_temp_directory / "fresh"
+        root.mkdir()
+        (root / "file.txt").write_text("data")
+        index = LocateIndex(str(make_temp_directory / "db"))
+        index.update(str(root))
+
+        assert index.update(str(root)) == (1, 1, 1)
+
+    def test_search_substring_in_names(self, make_tree: Path) -> None:
+        """
+        Проверяет поиск подстроки в путях
+        :param make_tree: Фикстура с деревом
+        """
+        index = LocateIndex(str(make_tree.parent / "db"))
+        index.update(str(make_tree))
+
+        assert list(index.search(".md")) == [
+            str(make_tree / "README.md"),
+            str(make_tree / "docs" / "guide.md"),
+        ]
+
+    def test_search_substring_with_directory(self, make_tree: Path) -> None:
+        """
+        Проверяет, что подстрока с / ищется в полном пути
+        :param make_tree: Фикстура с деревом
+        """
+        index = LocateIndex(str(make_tree.parent / "db"))
+        index.update(str(make_tree))
+
+        assert list(index.search("docs/api")) == [
+            str(make_tree / "docs" / "api"),
+            str(make_tree / "docs" / "api" / "Index.html"),
+        ]
+
+    def test_search_glob_matches_whole_path(self, make_tree: Path) -> None:
+        """
+        Проверяет, что шаблон должен совпасть со всем путём
+        :param make_tree: Фикстура с деревом
+        """
+        index = LocateIndex(str(make_tree.parent / "db"))
+        index.update(str(make_tree))
+
+        assert list(index.search("*.py")) == [
+            str(make_tree / "src" / "main.py")
+        ]
+        assert list(index.search("main*")) == []
+
+    def test_search_ignore_case(self, make_tree: Path) -> None:
+        """
+        Проверяет поиск без учёта регистра
+        :param make_tree: Фикстура с деревом
+        """
+        index = LocateIndex(str(make_tree.parent / "db"))
+        index.update(str(make_tree))
+
+        assert list(index.search("index")) == []
+        assert list(index.search("index", ignore_case=True)) == [
+            str(make_tree / "docs" / "api" / "Index.html")
+        ]
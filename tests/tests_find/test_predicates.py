@@ -0,0 +1,182 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from src.find.predicates import FindExpression, PathEntry
+from src.utils.errors import ExpressionSyntaxError
+
+NOW = 1_700_000_000.0
+
+
+class FakeEntry:
+    """Запись директории с заданными полями и счётчиком stat"""
+
+    def __init__(
+        self, name: str, kind: str = "f", size: int = 0, age_days: float = 0
+    ) -> None:
+        """
+        :param name: Имя записи
+        :param kind: f, d или l
+        :param size: Размер в байтах
+        :param age_days: Возраст в сутках
+        """
+        self.name = name
+        self.path = name
+        self._kind = kind
+        self._stats = os.stat_result(
+            (0, 0, 0, 1, 0, 0, size, 0, NOW - age_days * 86400, 0)
+        )
+        self.stat_calls = 0
+
+    def is_dir(self, follow_symlinks: bool = True) -> bool:
+        """
+        :return: True, если запись — директория
+        """
+        return self._kind == "d"
+
+    def is_file(self, follow_symlinks: bool = True) -> bool:
+        """
+        :return: True, если запись — файл
+        """
+        return self._kind == "f"
+
+    def is_symlink(self) -> bool:
+        """
+        :return: True, если запись — ссылка
+        """
+        return self._kind == "l"
+
+    def stat(self, follow_symlinks: bool = True) -> os.stat_result:
+        """
+        :return: Заданный результат stat
+        """
+        self.stat_calls += 1
+        return self._stats
+
+
+def matches(tokens: list[str], entry: FakeEntry) -> bool:
+    """
+    Компилирует выражение и проверяет запись
+    :param tokens: Части выражения
+    :param entry: Запись для проверки
+    :return: Результат проверки
+    """
+    return FindExpression(tokens, now=NOW).match(entry)  # type: ignore[arg-type]
+
+
+class TestsFindExpression:
+    """Тесты для выражений find"""
+
+    def test_name_and_iname(self) -> None:
+        """
+        Проверяет шаблоны имени с учётом и без учёта регистра
+        """
+        entry = FakeEntry("Main.PY")
+
+        assert not matches(["-name", "*.py"], entry)
+        assert matches(["-iname", "*.py"], entry)
+        assert matches(["-name", "Main.??"], entry)
+
+    def test_type(self) -> None:
+        """
+        Проверяет типы записей
+        """
+        assert matches(["-type", "d"], FakeEntry("dir", kind="d"))
+        assert matches(["-type", "l"], FakeEntry("link", kind="l"))
+        assert not matches(["-type", "f"], FakeEntry("dir", kind="d"))
+
+    def test_size_units_and_signs(self) -> None:
+        """
+        Проверяет округление размера вверх до единиц и знаки сравнения
+        """
+        entry = FakeEntry("file", size=1500)
+
+        assert matches(["-size", "3"], entry)
+        assert matches(["-size", "2k"], entry)
+        assert matches(["-size", "+1k"], entry)
+        assert matches(["-size", "-1501c"], entry)
+        assert not matches(["-size", "-1k"], entry)
+
+    def test_mtime(self) -> None:
+        """
+        Проверяет возраст в полных сутках
+        """
+        entry = FakeEntry("file", age_days=2.5)
+
+        assert matches(["-mtime", "2"], entry)
+        assert matches(["-mtime", "+1"], entry)
+        assert matches(["-mtime", "-3"], entry)
+        assert not matches(["-mtime", "+2"], entry)
+
+    def test_boolean_operators_and_parentheses(self) -> None:
+        """
+        Проверяет приоритет -and над -or, отрицание и скобки
+        """
+        entry = FakeEntry("a.txt")
+        tokens = ["-name", "*.py", "-o", "-name", "*.txt", "-type", "f"]
+
+        assert matches(tokens, entry)
+        assert not matches(["!", "-name", "*.txt"], entry)
+        assert not matches(
+            ["(", "-name", "*.py", "-o", "-name", "*.txt", ")", "-not"]
+            + ["-type", "f"],
+            entry,
+        )
+
+    def test_stat_only_after_cheap_checks(self) -> None:
+        """
+        Проверяет, что stat не выполняется, если не прошла проверка имени
+        """
+        entry = FakeEntry("a.txt", size=10)
+
+        assert not matches(["-size", "+0", "-name", "*.py"], entry)
+        assert entry.stat_calls == 0
+
+        assert matches(["-name", "*.txt", "-type", "f"], entry)
+        assert entry.stat_calls == 0
+
+    def test_prune_sets_flag(self) -> None:
+        """
+        Проверяет, что -prune срабатывает только после предыдущих проверок
+        """
+        expression = FindExpression(["-name", "skip", "-prune"], now=NOW)
+
+        assert not expression.match(FakeEntry("keep", kind="d"))  # type: ignore[arg-type]
+        assert not expression.pruned
+        assert expression.match(FakeEntry("skip", kind="d"))  # type: ignore[arg-type]
+        assert expression.pruned
+
+    @pytest.mark.parametrize(
+        "tokens",
+        [
+            ["-name"],
+            ["-unknown"],
+            ["(", "-name", "a"],
+            ["-name", "a", ")"],
+            ["-size", "1x"],
+            ["-type", "q"],
+            ["-mtime", "abc"],
+        ],
+    )
+    def test_invalid_expression_raises_error(self, tokens: list[str]) -> None:
+        """
+        Проверяет ошибки разбора выражения
+        :param tokens: Некорректное выражение
+        :raises ExpressionSyntaxError: Если выражение некорректно
+        """
+        with pytest.raises(ExpressionSyntaxError):
+            FindExpression(tokens)
+
+    def test_path_entry(self, make_temp_directory: Path) -> None:
+        """
+        Проверяет стартовый путь с интерфейсом записи директории
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        link = make_temp_directory / "link"
+        link.symlink_to(make_temp_directory)
+        entry = PathEntry(str(link), "link")
+
+        assert entry.is_symlink()
+        assert entry.is_dir()
+        assert not entry.is_dir(follow_symlinks=False)
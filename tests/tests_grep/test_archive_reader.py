@@ -0,0 +1,95 @@
+import io
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from src.grep.archive_reader import ArchiveReader
+from src.utils.errors import ArchiveError
+
+
+class TestsArchiveReader:
+    """Тесты для потокового чтения архивов"""
+
+    def test_is_archive(self) -> None:
+        """
+        Проверяет определение архива по расширению
+        """
+        assert ArchiveReader.is_archive("release.zip")
+        assert ArchiveReader.is_archive("release.TAR.GZ")
+        assert ArchiveReader.is_archive("release.tgz")
+        assert not ArchiveReader.is_archive("release.txt")
+
+    def test_zip_members(self, make_temp_directory: Path) -> None:
+        """
+        Проверяет чтение файлов zip архива без каталогов
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        archive = make_temp_directory / "data.zip"
+        with zipfile.ZipFile(archive, "w") as zip_file:
+            zip_file.writestr("docs/", "")
+            zip_file.writestr("docs/a.txt", "alpha")
+            zip_file.writestr("b.txt", "beta")
+
+        members = [
+            (name, stream.read())
+            for name, stream in ArchiveReader(str(archive)).members()
+        ]
+
+        assert members == [("docs/a.txt", b"alpha"), ("b.txt", b"beta")]
+
+    def test_tar_gz_members(self, make_temp_directory: Path) -> None:
+        """
+        Проверяет чтение файлов сжатого tar архива
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        archive = make_temp_directory / "data.tar.gz"
+        with tarfile.open(archive, "w:gz") as tar:
+            info = tarfile.TarInfo("logs/app.log")
+            info.size = 5
+            tar.addfile(info, io.BytesIO(b"hello"))
+
+        members = [
+            (name, stream.read())
+            for name, stream in ArchiveReader(str(archive)).members()
+        ]
+
+        assert members == [("logs/app.log", b"hello")]
+
+    def test_broken_archive_raises_error(
+        self, make_temp_directory: Path
+    ) -> None:
+        """
+        Проверяет ошибку для повреждённого архива
+        :param make_temp_directory: Фикстура для временных директорий
+        :raises ArchiveError: Если архив повреждён
+        """
+        archive = make_temp_directory / "broken.zip"
+        archive.write_bytes(b"not a zip")
+
+        with pytest.raises(ArchiveError):
+            list(ArchiveReader(str(archive)).members())
+
+    def test_encrypted_member_is_skipped(
+        self, make_temp_directory: Path
+    ) -> None:
+        """
+        Проверяет, что зашифрованный файл zip архива пропускается
+        с причиной, а остальные файлы читаются
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        archive = make_temp_directory / "data.zip"
+        with zipfile.ZipFile(archive, "w") as zip_file:
+            zip_file.writestr("secret.txt", "hidden")
+            zip_file.writestr("open.txt", "visible")
+
+        data = bytearray(archive.read_bytes())
+        data[data.rindex(b"secret.txt") - 46 + 8] |= 0x1
+        archive.write_bytes(bytes(data))
+
+        reader = ArchiveReader(str(archive))
+        members = [(name, stream.read()) for name, stream in reader.members()]
+
+        assert members == [("open.txt", b"visible")]
+        assert [name for name, _ in reader.skipped_members] == ["secret.txt"]
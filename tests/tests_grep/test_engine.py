@@ -0,0 +1,460 @@
+import io
+import re
+from pathlib import Path
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from src.grep import engine as engine_module
+from src.grep.engine import SearchEngine
+from src.grep.matchers import (
+    AhoCorasickMatcher,
+    LiteralMatcher,
+    RegexMatcher,
+)
+from src.utils.errors import BinaryFileError, InvalidFileError
+
+
+class TestsSearchEngine:
+    """Тесты для движка поиска grep"""
+
+    def test_engine_literal_uses_substring_search(self) -> None:
+        """
+        Проверяет, что фиксированная строка ищется без регулярных выражений
+        """
+        engine = SearchEngine(re.compile("error-42"))
+
+        assert isinstance(engine.matcher, LiteralMatcher)
+
+    def test_engine_simple_regex_uses_byte_search(self) -> None:
+        """
+        Проверяет, что простое выражение ищется по байтам
+        """
+        for pattern in ["error-[0-9]+", "error-42"]:
+            engine = SearchEngine(re.compile(pattern, re.IGNORECASE))
+
+            assert isinstance(engine.matcher, RegexMatcher)
+
+    def test_engine_few_literals_use_byte_alternation(
+        self, make_temp_directory: Path
+    ) -> None:
+        """
+        Проверяет, что небольшой набор строк ищется альтернативой
+        в байтовом выражении, а спецсимволы строк экранируются
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        file = make_temp_directory / "test.txt"
+        file.write_text("axb\na.b\nC*D\n")
+
+        engine = SearchEngine(literals=["a.b", "c*d"], ignore_case=True)
+
+        assert isinstance(engine.matcher, RegexMatcher)
+        assert engine.search_file(str(file)) == [(2, "a.b"), (3, "C*D")]
+
+    @pytest.mark.parametrize("ignore_case", [False, True])
+    def test_engine_many_literals_use_aho_corasick(
+        self, ignore_case: bool
+    ) -> None:
+        """
+        Проверяет выбор автомата, начиная с порога количества строк
+        :param ignore_case: Поиск без учёта регистра
+        """
+        threshold = (
+            engine_module.LITERAL_AUTOMATON_THRESHOLD_IGNORE_CASE
+            if ignore_case
+            else engine_module.LITERAL_AUTOMATON_THRESHOLD
+        )
+        literals = [f"word{index}" for index in range(threshold)]
+
+        below = SearchEngine(literals=literals[:-1], ignore_case=ignore_case)
+        engine = SearchEngine(literals=literals, ignore_case=ignore_case)
+
+        assert isinstance(below.matcher, RegexMatcher)
+        assert isinstance(engine.matcher, AhoCorasickMatcher)
+
+    def test_engine_unicode_pattern_uses_text_search(self) -> None:
+        """
+        Проверяет, что паттерны с юникодной семантикой ищутся как текст
+        """
+        for pattern in ["пр[иы]", r"\w+", "a.b", "[^a]", "end$", "(?i)x"]:
+            engine = SearchEngine(re.compile(pattern, re.IGNORECASE))
+
+            assert engine.matcher is None
+
+    def test_engine_line_numbers(self, make_temp_directory: Path) -> None:
+        """
+        Проверяет номера строк вокруг совпадений
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        file = make_temp_directory / "test.txt"
+        file.write_text("one\nhello\nthree\nfour\nhello again\n")
+
+        result = SearchEngine(re.compile("hello")).search_file(str(file))
+
+        assert result == [(2, "hello"), (5, "hello again")]
+
+    def test_engine_match_does_not_cross_lines(
+        self, make_temp_directory: Path
+    ) -> None:
+        """
+        Проверяет, что совпадение не может захватывать соседние строки
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        file = make_temp_directory / "test.txt"
+        file.write_text("foo\nbar\nfoo\tbar\n")
+
+        result = SearchEngine(re.compile("o[\t-\r]b")).search_file(str(file))
+
+        assert result == [(3, "foo\tbar")]
+
+    def test_engine_ignore_case_bytes(self, make_temp_directory: Path) -> None:
+        """
+        Проверяет поиск без учёта регистра по байтам
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        file = make_temp_directory / "test.txt"
+        file.write_text("HELLO\nbye\nHeLLo\n")
+
+        regex = re.compile("hello", re.IGNORECASE)
+        result = SearchEngine(regex).search_file(str(file))
+
+        assert result == [(1, "HELLO"), (3, "HeLLo")]
+
+    def test_engine_ignore_case_cyrillic(
+        self, make_temp_directory: Path
+    ) -> None:
+        """
+        Проверяет поиск кириллицы без учёта регистра
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        file = make_temp_directory / "test.txt"
+        file.write_text("ПРИВЕТ мир\nпока\n", encoding="utf-8")
+
+        regex = re.compile("привет", re.IGNORECASE)
+        result = SearchEngine(regex).search_file(str(file))
+
+        assert result == [(1, "ПРИВЕТ мир")]
+
+    def test_engine_empty_file(self, make_temp_directory: Path) -> None:
+        """
+        Проверяет поиск в пустом файле
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        file = make_temp_directory / "empty.txt"
+        file.write_text("")
+
+        assert SearchEngine(re.compile("a")).search_file(str(file)) == []
+
+    @pytest.mark.parametrize("pattern", ["hello", "hel.o"])
+    def test_engine_undecodable_file_same_for_both_paths(
+        self, make_temp_directory: Path, pattern: str
+    ) -> None:
+        """
+        Проверяет, что файл с недекодируемыми байтами пропускается
+        одинаково при поиске по байтам и как текст, для вывода строк,
+        подсчёта и контекста
+        :param make_temp_directory: Фикстура для временных директорий
+        :param pattern: Паттерн для поиска по байтам или как текст
+        :raises InvalidFileError: Если файл не декодируется
+        """
+        file = make_temp_directory / "test.txt"
+        file.write_bytes(b"hello\n\xff\n")
+        engine = SearchEngine(re.compile(pattern))
+
+        with pytest.raises(InvalidFileError):
+            engine.search_file(str(file))
+        with pytest.raises(InvalidFileError):
+            engine.count_file(str(file))
+        with pytest.raises(InvalidFileError):
+            engine.context_file(str(file), 1, 1)
+        with open(file, "rb") as stream:
+            with pytest.raises(InvalidFileError):
+                engine.count_stream(stream, str(file))
+
+    @pytest.mark.parametrize("pattern", ["hello", "hel.o"])
+    def test_engine_bad_bytes_after_max_count(
+        self, make_temp_directory: Path, pattern: str
+    ) -> None:
+        """
+        Проверяет, что байты после последней нужной строки
+        не проверяются ни при поиске по байтам, ни как текст
+        :param make_temp_directory: Фикстура для временных директорий
+        :param pattern: Паттерн для поиска по байтам или как текст
+        """
+        file = make_temp_directory / "test.txt"
+        file.write_bytes(b"hello\n\xff\n")
+        engine = SearchEngine(re.compile(pattern))
+
+        assert engine.search_file(str(file), max_count=1) == [(1, "hello")]
+        assert engine.count_file(str(file), max_count=1) == 1
+
+    @pytest.mark.parametrize("pattern", ["caf", "ca."])
+    def test_engine_fallback_encoding_same_for_both_paths(
+        self, make_temp_directory: Path, pattern: str
+    ) -> None:
+        """
+        Проверяет, что файл в запасной кодировке читается одинаково
+        при поиске по байтам и как текст
+        :param make_temp_directory: Фикстура для временных директорий
+        :param pattern: Паттерн для поиска по байтам или как текст
+        """
+        file = make_temp_directory / "test.txt"
+        file.write_bytes("café\nnothing\n".encode("latin-1"))
+        engine = SearchEngine(
+            re.compile(pattern), encodings=["utf-8", "latin-1"]
+        )
+
+        assert engine.search_file(str(file)) == [(1, "café")]
+        assert engine.count_file(str(file)) == 1
+
+    @pytest.mark.parametrize(
+        ("data", "valid"),
+        [(b"abc\xc3\xa9\nhello\n", True), (b"abc\xc3\nhel\xa9lo\n", False)],
+    )
+    def test_engine_split_character_before_ascii_chunk(
+        self,
+        make_temp_directory: Path,
+        monkeypatch: MonkeyPatch,
+        data: bytes,
+        valid: bool,
+    ) -> None:
+        """
+        Проверяет, что символ, разрезанный границей блоков, проверяется
+        целиком, даже если следующий блок состоит только из ASCII
+        :param make_temp_directory: Фикстура для временных директорий
+        :param monkeypatch: Фикстура для подмены размера блока
+        :param data: Содержимое файла, символ начинается в конце блока
+        :param valid: Файл декодируется целиком
+        """
+        monkeypatch.setattr(engine_module, "COUNT_CHUNK_SIZE", 4)
+        file = make_temp_directory / "test.txt"
+        file.write_bytes(data)
+        engine = SearchEngine(re.compile("hello"))
+
+        if valid:
+            assert engine.count_file(str(file)) == 1
+        else:
+            with pytest.raises(InvalidFileError):
+                engine.count_file(str(file))
+
+    def test_engine_invalid_matched_line_raises_error(
+        self, make_temp_directory: Path
+    ) -> None:
+        """
+        Проверяет ошибку при невозможности декодировать найденную строку
+        :param make_temp_directory: Фикстура для временных директорий
+        :raises InvalidFileError: При ошибке декодирования
+        """
+        file = make_temp_directory / "test.bin"
+        file.write_bytes(b"hello \xff\xfe\n")
+
+        with pytest.raises(InvalidFileError):
+            SearchEngine(re.compile("hello")).search_file(str(file))
+
+    def test_engine_cyrillic_literal(self, make_temp_directory: Path) -> None:
+        """
+        Проверяет поиск фиксированной строки на кириллице по байтам
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        file = make_temp_directory / "test.txt"
+        file.write_text("первая\nпривет мир\n", encoding="utf-8")
+
+        result = SearchEngine(re.compile("привет")).search_file(str(file))
+
+        assert result == [(2, "привет мир")]
+
+    def test_engine_literals_search(self, make_temp_directory: Path) -> None:
+        """
+        Проверяет поиск списка фиксированных строк
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        file = make_temp_directory / "test.txt"
+        file.write_text("id 100\nnothing\nREQ-7 done\nid 200\n")
+
+        engine = SearchEngine(literals=["req-7", "200"], ignore_case=True)
+
+        assert engine.search_file(str(file)) == [
+            (3, "REQ-7 done"),
+            (4, "id 200"),
+        ]
+
+    def test_engine_literals_cyrillic_ignore_case(
+        self, make_temp_directory: Path
+    ) -> None:
+        """
+        Проверяет поиск кириллических строк без учёта регистра
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        file = make_temp_directory / "test.txt"
+        file.write_text("ОШИБКА 1\nok\n", encoding="utf-8")
+
+        engine = SearchEngine(literals=["ошибка"], ignore_case=True)
+
+        assert engine.matcher is None
+        assert engine.search_file(str(file)) == [(1, "ОШИБКА 1")]
+
+    def test_engine_binary_file_raises_error(
+        self, make_temp_directory: Path
+    ) -> None:
+        """
+        Проверяет ошибку для файла с нулевым байтом
+        :param make_temp_directory: Фикстура для временных директорий
+        :raises BinaryFileError: Если файл двоичный
+        """
+        file = make_temp_directory / "test.bin"
+        file.write_bytes(b"hello\0world\n")
+
+        with pytest.raises(BinaryFileError):
+            SearchEngine(re.compile("hello")).search_file(str(file))
+
+    def test_engine_decodes_with_fallback_encoding(
+        self, make_temp_directory: Path
+    ) -> None:
+        """
+        Проверяет декодирование найденной строки запасной кодировкой
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        file = make_temp_directory / "test.txt"
+        file.write_bytes("ошибка: disk\n".encode("cp1251"))
+
+        engine = SearchEngine(
+            re.compile("disk"), encodings=["utf-8", "cp1251"]
+        )
+
+        assert engine.search_file(str(file)) == [(1, "ошибка: disk")]
+
+    def test_engine_max_count(self, make_temp_directory: Path) -> None:
+        """
+        Проверяет ограничение количества совпавших строк
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        file = make_temp_directory / "test.txt"
+        file.write_text("a 1\nb\na 2\na 3\n")
+
+        engine = SearchEngine(re.compile("a"))
+
+        assert engine.search_file(str(file), max_count=2) == [
+            (1, "a 1"),
+            (3, "a 2"),
+        ]
+
+    def test_engine_count_checks_encoding(
+        self, make_temp_directory: Path
+    ) -> None:
+        """
+        Проверяет, что подсчёт проверяет кодировку прочитанной части
+        так же, как вывод строк
+        :param make_temp_directory: Фикстура для временных директорий
+        :raises InvalidFileError: Если прочитанная часть не декодируется
+        """
+        file = make_temp_directory / "test.bin"
+        file.write_bytes(b"hello\n hello \xfe\nbye\n")
+
+        engine = SearchEngine(re.compile("hello"))
+
+        assert engine.count_file(str(file), max_count=1) == 1
+        with pytest.raises(InvalidFileError):
+            engine.count_file(str(file))
+
+    def test_engine_text_search_max_count(
+        self, make_temp_directory: Path
+    ) -> None:
+        """
+        Проверяет ограничение количества строк при поиске по тексту
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        file = make_temp_directory / "test.txt"
+        file.write_text("ab\nac\nad\n")
+
+        engine = SearchEngine(re.compile("a."))
+
+        assert engine.count_file(str(file), max_count=2) == 2
+
+    def test_engine_stream_across_chunks(
+        self, monkeypatch: MonkeyPatch
+    ) -> None:
+        """
+        Проверяет, что совпадения на стыке блоков потока не теряются
+        :param monkeypatch: Фикстура для подмены констант
+        """
+        monkeypatch.setattr(engine_module, "BINARY_SNIFF_SIZE", 4)
+        monkeypatch.setattr(engine_module, "STREAM_CHUNK_SIZE", 5)
+        stream = io.BytesIO(b"first\nsecond match\nthird\nmatch")
+
+        engine = SearchEngine(re.compile("match"))
+
+        assert engine.search_stream(stream, "stream") == [
+            (2, "second match"),
+            (4, "match"),
+        ]
+
+    def test_engine_stream_text_fallback(self) -> None:
+        """
+        Проверяет поиск по тексту потока с запасной кодировкой
+        """
+        stream = io.BytesIO("раз\nдва три\n".encode("cp1251"))
+
+        engine = SearchEngine(re.compile("т.и"), encodings=["utf-8", "cp1251"])
+
+        assert engine.search_stream(stream, "stream") == [(2, "два три")]
+
+    def test_engine_binary_stream_raises_error(self) -> None:
+        """
+        Проверяет ошибку для двоичного потока
+        :raises BinaryFileError: Если поток двоичный
+        """
+        engine = SearchEngine(re.compile("a"))
+
+        with pytest.raises(BinaryFileError):
+            engine.count_stream(io.BytesIO(b"a\0b"), "stream")
+
+    def test_engine_context_lines(self, make_temp_directory: Path) -> None:
+        """
+        Проверяет строки контекста до и после совпадения
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        file = make_temp_directory / "test.txt"
+        file.write_text("1\n2\n3\nhit\n5\n6\n7\n8\nhit\n10\n")
+
+        engine = SearchEngine(re.compile("hit"))
+
+        assert engine.context_file(str(file), before=2, after=1) == [
+            (2, "2", False),
+            (3, "3", False),
+            (4, "hit", True),
+            (5, "5", False),
+            (7, "7", False),
+            (8, "8", False),
+            (9, "hit", True),
+            (10, "10", False),
+        ]
+
+    def test_engine_context_overlapping_groups(
+        self, make_temp_directory: Path
+    ) -> None:
+        """
+        Проверяет, что пересекающийся контекст не выводится дважды
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        file = make_temp_directory / "test.txt"
+        file.write_text("a\nhit\nb\nhit\nc\n")
+
+        engine = SearchEngine(re.compile("h.t"))
+
+        result = engine.context_file(str(file), before=1, after=1)
+
+        assert [number for number, _, _ in result] == [1, 2, 3, 4, 5]
+
+    def test_engine_context_max_count(self, make_temp_directory: Path) -> None:
+        """
+        Проверяет контекст после последнего разрешённого совпадения
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        file = make_temp_directory / "test.txt"
+        file.write_text("hit\nhit\nx\nhit\n")
+
+        engine = SearchEngine(re.compile("hit"))
+
+        assert engine.context_file(
+            str(file), before=0, after=1, max_count=1
+        ) == [(1, "hit", True), (2, "hit", False)]
@@ -1,18 +1,26 @@
 import argparse
+import io
+import os
+import tarfile
+import time
+import zipfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from _pytest.capture import CaptureFixture
 from _pytest.monkeypatch import MonkeyPatch
 
+from src.grep.engine import SearchEngine
 from src.grep.grep import Grep
 from src.utils.errors import (
-    InvalidFileError,
     NotAFileError,
     RegualarVerbError,
     ShellError,
 )
 
+OLD_TIME_NS = 10**18
+
 
 class TestsGrep:
     """Тесты для команды grep"""
@@ -138,15 +146,15 @@ class TestsGrep:
         assert ":2:" in captured.out
 
     def test_grep_unicode_decode_error(
-        self, make_temp_directory: Path
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
     ) -> None:
         """
-        Проверяет ошибку при невозможности прочитать файл
+        Проверяет пропуск файла, который невозможно прочитать
         :param make_temp_directory: Фикстура для временных директорий
-        :raises InvalidFileError: При ошибке декодирования
+        :param capsys: Фикстура для захвата stdout
         """
         file = make_temp_directory / "test.bin"
-        file.write_bytes(b"\xff\xfe\xfd\x80\x81\x82")
+        file.write_bytes(b"hello \xff\xfe\xfd\x80\x81\x82")
 
         tokens = argparse.Namespace(
             pattern=["hello"],
@@ -155,9 +163,11 @@ class TestsGrep:
             recursive=False,
             ri=False,
         )
-        with pytest.raises(InvalidFileError) as exc_info:
-            Grep().execute(tokens)
-        assert "невозможно прочитать" in str(exc_info.value)
+        Grep().execute(tokens)
+        captured = capsys.readouterr()
+
+        assert "hello" not in captured.out
+        assert "файлов в неизвестной кодировке: 1" in captured.out
 
     def test_grep_invalid_regex(self, make_temp_directory: Path) -> None:
         """
@@ -316,3 +326,783 @@ class TestsGrep:
         captured = capsys.readouterr()
 
         assert captured.out == ""
+
+    def test_grep_parallel_matches_serial(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет, что параллельный поиск выводит то же, что и обычный
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        for index in range(20):
+            subdir = make_temp_directory / f"dir{index % 3}"
+            subdir.mkdir(exist_ok=True)
+            (subdir / f"file{index}.txt").write_text(
+                f"hello {index}\nfoo\nhello again {index}"
+            )
+
+        tokens = argparse.Namespace(
+            pattern=["hello"],
+            paths=[str(make_temp_directory)],
+            ignore_case=False,
+            recursive=True,
+            ri=False,
+            jobs=1,
+        )
+        Grep().execute(tokens)
+        serial = capsys.readouterr().out
+
+        tokens.jobs = 4
+        Grep().execute(tokens)
+        parallel = capsys.readouterr().out
+
+        assert serial.count("hello") == 40
+        assert parallel == serial
+
+    def test_grep_parallel_file_block_is_contiguous(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет, что совпадения одного файла выводятся одним блоком
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        (make_temp_directory / "a.txt").write_text("hello\n" * 50)
+        (make_temp_directory / "b.txt").write_text("hello\n" * 50)
+
+        tokens = argparse.Namespace(
+            pattern=["hello"],
+            paths=[str(make_temp_directory)],
+            ignore_case=False,
+            recursive=True,
+            ri=False,
+            jobs=2,
+        )
+        Grep().execute(tokens)
+        lines = capsys.readouterr().out.splitlines()
+
+        assert all("a.txt" in line for line in lines[:50])
+        assert all("b.txt" in line for line in lines[50:])
+
+    def test_grep_patterns_file(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет поиск фиксированных строк из файла
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        patterns = make_temp_directory / "patterns.txt"
+        patterns.write_text("REQ-1\nREQ-3\n\n")
+        file = make_temp_directory / "log.txt"
+        file.write_text("REQ-1 ok\nREQ-2 ok\nREQ-3 failed\n")
+
+        tokens = argparse.Namespace(
+            pattern=[str(file)],
+            paths=[],
+            ignore_case=False,
+            recursive=False,
+            ri=False,
+            patterns_file=str(patterns),
+        )
+        Grep().execute(tokens)
+        captured = capsys.readouterr()
+
+        assert "REQ-1 ok" in captured.out
+        assert "REQ-2" not in captured.out
+        assert "REQ-3 failed" in captured.out
+
+    def test_grep_patterns_file_defaults_to_cwd(
+        self,
+        make_temp_directory: Path,
+        capsys: CaptureFixture[str],
+        monkeypatch: MonkeyPatch,
+    ) -> None:
+        """
+        Проверяет, что без путей строки из файла ищутся в текущей
+        директории, как и паттерн
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        :param monkeypatch: Фикстура для смены текущей директории
+        """
+        patterns = make_temp_directory / "patterns.txt"
+        patterns.write_text("REQ-1\n")
+        directory = make_temp_directory / "logs"
+        directory.mkdir()
+        file = directory / "log.txt"
+        file.write_text("REQ-1 ok\nREQ-2 ok\n")
+        monkeypatch.chdir(directory)
+
+        tokens = argparse.Namespace(
+            pattern=[],
+            paths=[],
+            ignore_case=False,
+            recursive=True,
+            ri=False,
+            patterns_file=str(patterns),
+        )
+        Grep().execute(tokens)
+
+        assert capsys.readouterr().out == f"{file}:1:REQ-1 ok\n"
+
+    def test_grep_without_pattern_raises_error(self) -> None:
+        """
+        Проверяет ошибку, если не указаны ни паттерн, ни файл строк
+        :raises RegualarVerbError: Если паттерн не указан
+        """
+        tokens = argparse.Namespace(
+            pattern=[],
+            paths=[],
+            ignore_case=False,
+            recursive=True,
+            ri=False,
+        )
+        with pytest.raises(RegualarVerbError):
+            Grep().execute(tokens)
+
+    def test_grep_missing_patterns_file_raises_error(
+        self, make_temp_directory: Path
+    ) -> None:
+        """
+        Проверяет ошибку при отсутствии файла со строками
+        :param make_temp_directory: Фикстура для временных директорий
+        :raises ShellError: Если файл со строками не найден
+        """
+        tokens = argparse.Namespace(
+            pattern=[str(make_temp_directory)],
+            paths=[],
+            ignore_case=False,
+            recursive=True,
+            ri=False,
+            patterns_file=str(make_temp_directory / "missing.txt"),
+        )
+        with pytest.raises(ShellError):
+            Grep().execute(tokens)
+
+    def test_grep_skips_binary_files(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет пропуск двоичных файлов при рекурсивном поиске
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        (make_temp_directory / "image.bin").write_bytes(b"match\0\x01\x02")
+        (make_temp_directory / "text.txt").write_text("match here\n")
+
+        tokens = argparse.Namespace(
+            pattern=["match"],
+            paths=[str(make_temp_directory)],
+            ignore_case=False,
+            recursive=True,
+            ri=False,
+        )
+        Grep().execute(tokens)
+        captured = capsys.readouterr()
+
+        assert "text.txt:1:match here" in captured.out
+        assert "image.bin" not in captured.out
+        assert "Пропущено двоичных файлов: 1" in captured.out
+
+    @pytest.mark.parametrize("pattern", ["hello", "hel.o"])
+    @pytest.mark.parametrize(
+        "flag", [None, "count", "files_with_matches", "files_without_match"]
+    )
+    def test_grep_undecodable_file_same_policy(
+        self,
+        make_temp_directory: Path,
+        capsys: CaptureFixture[str],
+        pattern: str,
+        flag: str | None,
+    ) -> None:
+        """
+        Проверяет, что файл с недекодируемыми байтами пропускается
+        при любом паттерне и формате вывода
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        :param pattern: Паттерн для поиска по байтам или как текст
+        :param flag: Флаг формата вывода
+        """
+        file = make_temp_directory / "e.txt"
+        file.write_bytes(b"hello\n\xff\n")
+
+        tokens = argparse.Namespace(
+            pattern=[pattern],
+            paths=[str(file)],
+            ignore_case=False,
+            recursive=False,
+            ri=False,
+        )
+        if flag is not None:
+            setattr(tokens, flag, True)
+        Grep().execute(tokens)
+
+        assert capsys.readouterr().out.splitlines() == [
+            "Пропущено файлов в неизвестной кодировке: 1"
+        ]
+
+    def test_grep_continues_after_undecodable_file(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет, что нечитаемый файл не прерывает обход директории
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        (make_temp_directory / "a.txt").write_bytes(b"match \xff\xfe\n")
+        (make_temp_directory / "b.txt").write_text("match ok\n")
+
+        tokens = argparse.Namespace(
+            pattern=["match"],
+            paths=[str(make_temp_directory)],
+            ignore_case=False,
+            recursive=True,
+            ri=False,
+            jobs=2,
+        )
+        Grep().execute(tokens)
+        captured = capsys.readouterr()
+
+        assert "b.txt:1:match ok" in captured.out
+        assert "файлов в неизвестной кодировке: 1" in captured.out
+
+    def test_grep_encoding_fallback(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет чтение файла во второй кодировке из списка
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        file = make_temp_directory / "legacy.txt"
+        file.write_bytes("привет мир\n".encode("cp1251"))
+
+        tokens = argparse.Namespace(
+            pattern=["мир"],
+            paths=[str(file)],
+            ignore_case=False,
+            recursive=False,
+            ri=False,
+            encodings=["utf-8", "cp1251"],
+        )
+        Grep().execute(tokens)
+        captured = capsys.readouterr()
+
+        assert "legacy.txt:1:привет мир" in captured.out
+        assert "Пропущено" not in captured.out
+
+    def test_grep_files_with_matches(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет вывод только имён файлов с совпадениями
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        (make_temp_directory / "a.txt").write_text("x\nmatch\nmatch\n")
+        (make_temp_directory / "b.txt").write_text("nothing\n")
+
+        tokens = argparse.Namespace(
+            pattern=["match"],
+            paths=[str(make_temp_directory)],
+            ignore_case=False,
+            recursive=True,
+            ri=False,
+            files_with_matches=True,
+        )
+        Grep().execute(tokens)
+        captured = capsys.readouterr()
+
+        assert captured.out.splitlines() == [
+            str(make_temp_directory / "a.txt")
+        ]
+
+    def test_grep_files_without_match(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет вывод только имён файлов без совпадений
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        directory = make_temp_directory / "logs"
+        directory.mkdir()
+        (directory / "a.txt").write_text("match\n")
+        (directory / "b.txt").write_text("nothing\n")
+
+        tokens = argparse.Namespace(
+            pattern=["match"],
+            paths=[str(directory)],
+            ignore_case=False,
+            recursive=True,
+            ri=False,
+            files_without_match=True,
+        )
+        Grep().execute(tokens)
+        captured = capsys.readouterr()
+
+        assert captured.out.splitlines() == [str(directory / "b.txt")]
+
+    def test_grep_count(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет подсчёт совпавших строк в каждом файле
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        file = make_temp_directory / "test.txt"
+        file.write_text("match match\nnone\nmatch\n")
+        empty = make_temp_directory / "empty.txt"
+        empty.write_text("none\n")
+
+        tokens = argparse.Namespace(
+            pattern=["match"],
+            paths=[str(file), str(empty)],
+            ignore_case=False,
+            recursive=False,
+            ri=False,
+            count=True,
+        )
+        Grep().execute(tokens)
+        captured = capsys.readouterr()
+
+        assert captured.out.splitlines() == [f"{file}:2", f"{empty}:0"]
+
+    def test_grep_max_count(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет остановку поиска после N совпавших строк
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        file = make_temp_directory / "test.txt"
+        file.write_text("match 1\nmatch 2\nmatch 3\n")
+
+        tokens = argparse.Namespace(
+            pattern=["match"],
+            paths=[str(file)],
+            ignore_case=False,
+            recursive=False,
+            ri=False,
+            max_count=2,
+        )
+        Grep().execute(tokens)
+        captured = capsys.readouterr()
+
+        assert captured.out.splitlines() == [
+            f"{file}:1:match 1",
+            f"{file}:2:match 2",
+        ]
+
+    def test_grep_include_exclude_dir(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет фильтры --include и --exclude-dir при обходе
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        (make_temp_directory / "node_modules").mkdir()
+        (make_temp_directory / "node_modules" / "lib.py").write_text("match\n")
+        (make_temp_directory / "main.py").write_text("match\n")
+        (make_temp_directory / "notes.txt").write_text("match\n")
+
+        tokens = argparse.Namespace(
+            pattern=["match"],
+            paths=[str(make_temp_directory)],
+            ignore_case=False,
+            recursive=True,
+            ri=False,
+            include=["*.py"],
+            exclude_dir=["node_modules"],
+        )
+        Grep().execute(tokens)
+        captured = capsys.readouterr()
+
+        assert captured.out.splitlines() == [
+            f"{make_temp_directory / 'main.py'}:1:match"
+        ]
+
+    def test_grep_ignore_file(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет пропуск путей по файлу игнорирования
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        ignore_file = make_temp_directory / ".gitignore"
+        ignore_file.write_text("build/\n*.log\n")
+        (make_temp_directory / "build").mkdir()
+        (make_temp_directory / "build" / "out.txt").write_text("match\n")
+        (make_temp_directory / "app.log").write_text("match\n")
+        (make_temp_directory / "app.txt").write_text("match\n")
+
+        tokens = argparse.Namespace(
+            pattern=["match"],
+            paths=[str(make_temp_directory)],
+            ignore_case=False,
+            recursive=True,
+            ri=False,
+            exclude_dir=["src"],
+            ignore_files=[str(ignore_file)],
+        )
+        Grep().execute(tokens)
+        captured = capsys.readouterr()
+
+        assert captured.out.splitlines() == [
+            f"{make_temp_directory / 'app.txt'}:1:match"
+        ]
+
+    def test_grep_inside_archives(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет поиск внутри zip и tar.gz архивов без распаковки
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        directory = make_temp_directory / "releases"
+        directory.mkdir()
+        zip_path = directory / "a.zip"
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as file:
+            file.writestr("src/main.py", "import os\nerror here\n")
+        tar_path = directory / "b.tar.gz"
+        with tarfile.open(tar_path, "w:gz") as tar:
+            data = b"ok\nok\nerror again\n"
+            info = tarfile.TarInfo("logs/app.log")
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+        tokens = argparse.Namespace(
+            pattern=["error"],
+            paths=[str(directory)],
+            ignore_case=False,
+            recursive=True,
+            ri=False,
+            archives=True,
+        )
+        Grep().execute(tokens)
+        captured = capsys.readouterr()
+
+        assert captured.out.splitlines() == [
+            f"{zip_path}!src/main.py:2:error here",
+            f"{tar_path}!logs/app.log:3:error again",
+        ]
+        assert not (directory / "src").exists()
+
+    def test_grep_archives_without_flag_are_binary(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет, что без флага -z архив ищется как обычный файл
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        zip_path = make_temp_directory / "a.zip"
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as file:
+            file.writestr("main.py", "error here\n" * 10)
+
+        tokens = argparse.Namespace(
+            pattern=["error"],
+            paths=[str(zip_path)],
+            ignore_case=False,
+            recursive=False,
+            ri=False,
+        )
+        Grep().execute(tokens)
+        captured = capsys.readouterr()
+
+        assert "main.py:" not in captured.out
+
+    def test_grep_archive_files_with_matches(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет вывод имён файлов архива с совпадениями
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        zip_path = make_temp_directory / "a.zip"
+        with zipfile.ZipFile(zip_path, "w") as file:
+            file.writestr("one.txt", "error\n")
+            file.writestr("two.txt", "fine\n")
+
+        tokens = argparse.Namespace(
+            pattern=["error"],
+            paths=[str(zip_path)],
+            ignore_case=False,
+            recursive=False,
+            ri=False,
+            archives=True,
+            files_with_matches=True,
+        )
+        Grep().execute(tokens)
+        captured = capsys.readouterr()
+
+        assert captured.out.splitlines() == [f"{zip_path}!one.txt"]
+
+    def test_grep_broken_archive_is_skipped(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет пропуск повреждённого архива со сводкой
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        zip_path = make_temp_directory / "broken.zip"
+        zip_path.write_text("error")
+
+        tokens = argparse.Namespace(
+            pattern=["error"],
+            paths=[str(zip_path)],
+            ignore_case=False,
+            recursive=False,
+            ri=False,
+            archives=True,
+        )
+        Grep().execute(tokens)
+        captured = capsys.readouterr()
+
+        assert "повреждённых архивов: 1" in captured.out
+
+    def test_grep_corrupt_archive_members_are_skipped(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет, что файл архива с неверной контрольной суммой
+        и зашифрованный файл пропускаются со сводкой,
+        а поиск продолжается по остальным файлам архива
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        zip_path = make_temp_directory / "mixed.zip"
+        with zipfile.ZipFile(zip_path, "w") as file:
+            file.writestr("a.txt", "error first\n")
+            file.writestr("bad.txt", "error damaged\n")
+            file.writestr("secret.txt", "error hidden\n")
+            file.writestr("c.txt", "error last\n")
+
+        data = bytearray(zip_path.read_bytes())
+        damaged = data.index(b"error damaged")
+        data[damaged : damaged + 5] = b"ERROR"
+        central = data.rindex(b"secret.txt") - 46
+        data[central + 8] |= 0x1
+        zip_path.write_bytes(bytes(data))
+
+        tokens = argparse.Namespace(
+            pattern=["error"],
+            paths=[str(zip_path)],
+            ignore_case=False,
+            recursive=False,
+            ri=False,
+            archives=True,
+        )
+        Grep().execute(tokens)
+        captured = capsys.readouterr()
+
+        assert captured.out.splitlines()[:2] == [
+            f"{zip_path}!a.txt:1:error first",
+            f"{zip_path}!c.txt:1:error last",
+        ]
+        assert "повреждённых файлов в архивах: 2" in captured.out
+
+    def test_grep_cache_skips_unchanged_files(
+        self,
+        make_temp_directory: Path,
+        capsys: CaptureFixture[str],
+        monkeypatch: MonkeyPatch,
+    ) -> None:
+        """
+        Проверяет, что неизменённый файл не открывается при повторе поиска,
+        а изменённый ищется заново
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        :param monkeypatch: Фикстура для подмены функций
+        """
+        directory = make_temp_directory / "logs"
+        directory.mkdir()
+        stable = directory / "a.txt"
+        stable.write_text("error one\n")
+        changed = directory / "b.txt"
+        changed.write_text("nothing\n")
+        for file in (stable, changed):
+            os.utime(file, ns=(OLD_TIME_NS, OLD_TIME_NS))
+
+        tokens = argparse.Namespace(
+            pattern=["error"],
+            paths=[str(directory)],
+            ignore_case=False,
+            recursive=True,
+            ri=False,
+            cache=True,
+        )
+        with patch("src.utils.logger.logging.info") as mock_info:
+            Grep().execute(tokens)
+        first = capsys.readouterr().out
+        first_cache = mock_info.call_args[0][0]
+
+        changed.write_text("error two\n")
+        searched = []
+        search_file = SearchEngine.search_file
+
+        def tracking_search(self, file_path, max_count=None):
+            searched.append(file_path)
+            return search_file(self, file_path, max_count)
+
+        monkeypatch.setattr(SearchEngine, "search_file", tracking_search)
+        with patch("src.utils.logger.logging.info") as mock_info:
+            Grep().execute(tokens)
+        second = capsys.readouterr().out
+
+        assert "Кэш" not in first
+        assert first_cache == "CACHE: grep: попаданий 0, промахов 2"
+        assert second.splitlines() == [
+            f"{stable}:1:error one",
+            f"{changed}:1:error two",
+        ]
+        assert mock_info.call_args[0][0] == (
+            "CACHE: grep: попаданий 1, промахов 1"
+        )
+        assert searched == [str(changed)]
+
+    def test_grep_cache_ignores_recently_modified_files(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет, что результат только что изменённого файла
+        не кэшируется: перезапись с тем же размером в пределах точности
+        времени файловой системы не меняет ключ кэша
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        file = make_temp_directory / "test.txt"
+        file.write_text("error one\n")
+        mtime_ns = time.time_ns()
+        os.utime(file, ns=(mtime_ns, mtime_ns))
+
+        tokens = argparse.Namespace(
+            pattern=["error"],
+            paths=[str(file)],
+            ignore_case=False,
+            recursive=False,
+            ri=False,
+            cache=True,
+        )
+        Grep().execute(tokens)
+        capsys.readouterr()
+
+        file.write_text("error two\n")
+        os.utime(file, ns=(mtime_ns, mtime_ns))
+        Grep().execute(tokens)
+
+        assert capsys.readouterr().out == f"{file}:1:error two\n"
+
+    def test_grep_parallel_uses_cache(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет, что при поиске в пуле процессов кэш пополняется
+        в основном процессе и при повторе вывод берётся из него
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        directory = make_temp_directory / "logs"
+        directory.mkdir()
+        for index in range(6):
+            file = directory / f"file{index}.txt"
+            file.write_text(f"error {index}\n")
+            os.utime(file, ns=(OLD_TIME_NS, OLD_TIME_NS))
+
+        tokens = argparse.Namespace(
+            pattern=["error"],
+            paths=[str(directory)],
+            ignore_case=False,
+            recursive=True,
+            ri=False,
+            jobs=2,
+            cache=True,
+        )
+        with patch("src.utils.logger.logging.info") as mock_info:
+            Grep().execute(tokens)
+            first = capsys.readouterr().out
+            first_cache = mock_info.call_args[0][0]
+
+            Grep().execute(tokens)
+            second = capsys.readouterr().out
+
+        assert first == second
+        assert first.count("error") == 6
+        assert first_cache == "CACHE: grep: попаданий 0, промахов 6"
+        assert mock_info.call_args[0][0] == (
+            "CACHE: grep: попаданий 6, промахов 0"
+        )
+
+    def test_grep_context_output(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет формат вывода строк контекста и разделителей групп
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        file = make_temp_directory / "test.txt"
+        file.write_text("a\nerror 1\nb\nc\nd\nerror 2\n")
+
+        tokens = argparse.Namespace(
+            pattern=["error"],
+            paths=[str(file)],
+            ignore_case=False,
+            recursive=False,
+            ri=False,
+            context=1,
+            before_context=None,
+            after_context=None,
+        )
+        Grep().execute(tokens)
+        captured = capsys.readouterr()
+
+        assert captured.out.splitlines() == [
+            f"{file}-1-a",
+            f"{file}:2:error 1",
+            f"{file}-3-b",
+            "--",
+            f"{file}-5-d",
+            f"{file}:6:error 2",
+        ]
+
+    def test_grep_context_between_files(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет разделитель групп между файлами и приоритет -A над -C
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        first = make_temp_directory / "a.txt"
+        first.write_text("error\nafter\n")
+        second = make_temp_directory / "b.txt"
+        second.write_text("before\nerror\n")
+
+        tokens = argparse.Namespace(
+            pattern=["error"],
+            paths=[str(first), str(second)],
+            ignore_case=False,
+            recursive=False,
+            ri=False,
+            context=1,
+            before_context=None,
+            after_context=0,
+        )
+        Grep().execute(tokens)
+        captured = capsys.readouterr()
+
+        assert captured.out.splitlines() == [
+            f"{first}:1:error",
+            "--",
+            f"{second}-1-before",
+            f"{second}:2:error",
+        ]
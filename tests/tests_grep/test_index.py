@@ -0,0 +1,239 @@
+import argparse
+import re
+from pathlib import Path
+
+import pytest
+from _pytest.capture import CaptureFixture
+
+from src.grep.engine import SearchEngine
+from src.grep.grep import Grep
+from src.grep.index import Index
+from src.grep.trigram_index import TrigramIndex
+from src.utils.errors import SearchIndexError, ShellError
+
+
+class TestsIndex:
+    """Тесты для команды index"""
+
+    def test_index_build_creates_file(self, make_temp_structure: Path) -> None:
+        """
+        Проверяет построение индекса для директории
+        :param make_temp_structure: Фикстура с тестовой структурой
+        """
+        command = Index()
+        tokens = argparse.Namespace(
+            action="build", paths=[str(make_temp_structure)]
+        )
+        command.execute(tokens)
+
+        index = TrigramIndex(command._index_path)
+        index.load()
+
+        assert str(make_temp_structure) in index.roots
+        assert len(index.files) == 3
+
+    def test_index_update_without_build_raises_error(self) -> None:
+        """
+        Проверяет ошибку при обновлении непостроенного индекса
+        :raises SearchIndexError: Если индекс не построен
+        """
+        tokens = argparse.Namespace(action="update", paths=[])
+        with pytest.raises(SearchIndexError):
+            Index().execute(tokens)
+
+    def test_index_update_reports_changes(
+        self, make_temp_structure: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет, что обновление перечитывает только изменённые файлы
+        :param make_temp_structure: Фикстура с тестовой структурой
+        :param capsys: Фикстура для захвата stdout
+        """
+        Index().execute(
+            argparse.Namespace(
+                action="build", paths=[str(make_temp_structure)]
+            )
+        )
+        (make_temp_structure / "file1.txt").write_text("changed content")
+        capsys.readouterr()
+
+        Index().execute(argparse.Namespace(action="update", paths=[]))
+        captured = capsys.readouterr()
+
+        assert "проиндексировано 1, удалено 0" in captured.out
+
+    def test_index_build_file_raises_error(
+        self, make_temp_structure: Path
+    ) -> None:
+        """
+        Проверяет ошибку при индексации файла вместо директории
+        :param make_temp_structure: Фикстура с тестовой структурой
+        :raises ShellError: Если путь не является директорией
+        """
+        tokens = argparse.Namespace(
+            action="build", paths=[str(make_temp_structure / "file1.txt")]
+        )
+        with pytest.raises(ShellError):
+            Index().execute(tokens)
+
+    def test_grep_uses_index_and_sees_changes(
+        self, make_temp_structure: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет, что grep с индексом находит и изменённые после
+        индексации файлы
+        :param make_temp_structure: Фикстура с тестовой структурой
+        :param capsys: Фикстура для захвата stdout
+        """
+        Index().execute(
+            argparse.Namespace(
+                action="build", paths=[str(make_temp_structure)]
+            )
+        )
+        (make_temp_structure / "file2.txt").write_text("needle added later")
+        capsys.readouterr()
+
+        tokens = argparse.Namespace(
+            pattern=["needle"],
+            paths=[str(make_temp_structure)],
+            ignore_case=False,
+            recursive=True,
+            ri=False,
+        )
+        Grep().execute(tokens)
+        captured = capsys.readouterr()
+
+        assert "needle added later" in captured.out
+        assert "file1.txt" not in captured.out
+
+    @pytest.mark.parametrize(
+        "pattern", ["(?:abc)def", "[ab]{0,2}xyz", "a[bc]{2}de"]
+    )
+    def test_grep_with_index_groups_and_repeats(
+        self,
+        make_temp_directory: Path,
+        capsys: CaptureFixture[str],
+        pattern: str,
+    ) -> None:
+        """
+        Проверяет, что индекс не отбрасывает файлы с совпадениями
+        для групп (?:...) и повторений классов {m,n}
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        :param pattern: Регулярное выражение
+        """
+        root = make_temp_directory / "data"
+        root.mkdir()
+        (root / "match.txt").write_text("abcdef abxyz abbde\n")
+        Index().execute(argparse.Namespace(action="build", paths=[str(root)]))
+        capsys.readouterr()
+
+        tokens = argparse.Namespace(
+            pattern=[pattern],
+            paths=[str(root)],
+            ignore_case=False,
+            recursive=True,
+            ri=False,
+        )
+        Grep().execute(tokens)
+
+        assert "match.txt" in capsys.readouterr().out
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            r"\x41BCD",
+            r"\101BCD",
+            r"A\u0042CD",
+            r"\U00000041BCD",
+            r"\N{LATIN CAPITAL LETTER A}BCD",
+        ],
+    )
+    def test_grep_with_index_escapes(
+        self,
+        make_temp_directory: Path,
+        capsys: CaptureFixture[str],
+        pattern: str,
+    ) -> None:
+        """
+        Проверяет, что аргументы экранированных последовательностей
+        не попадают в обязательные подстроки и вывод с индексом
+        совпадает с выводом без индекса
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        :param pattern: Регулярное выражение
+        """
+        root = make_temp_directory / "data"
+        root.mkdir()
+        (root / "hex.txt").write_text("ABCDEF\n")
+        (root / "other.txt").write_text("nothing here\n")
+
+        tokens = argparse.Namespace(
+            pattern=[pattern],
+            paths=[str(root)],
+            ignore_case=False,
+            recursive=True,
+            ri=False,
+        )
+        Grep().execute(tokens)
+        unindexed = capsys.readouterr().out
+
+        Index().execute(argparse.Namespace(action="build", paths=[str(root)]))
+        capsys.readouterr()
+        Grep().execute(tokens)
+        indexed = capsys.readouterr().out
+
+        assert "hex.txt:" in unindexed
+        assert indexed == unindexed
+
+    def test_grep_with_index_other_encoding(
+        self, make_temp_directory: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """
+        Проверяет, что индекс не отбрасывает файлы в кодировке,
+        где паттерн записан иначе, чем в UTF-8
+        :param make_temp_directory: Фикстура для временных директорий
+        :param capsys: Фикстура для захвата stdout
+        """
+        encoding = "latin-1"
+        root = make_temp_directory / "data"
+        root.mkdir()
+        (root / "menu.txt").write_bytes("un café noir\n".encode(encoding))
+        Index().execute(argparse.Namespace(action="build", paths=[str(root)]))
+        capsys.readouterr()
+
+        for pattern in ("café", "noir"):
+            tokens = argparse.Namespace(
+                pattern=[pattern],
+                paths=[str(root)],
+                ignore_case=False,
+                recursive=True,
+                ri=False,
+                encodings=[encoding],
+            )
+            Grep().execute(tokens)
+
+            assert "un café noir" in capsys.readouterr().out
+
+    @pytest.mark.parametrize(
+        ("encodings", "pattern", "usable"),
+        [
+            (["utf-8"], "café", True),
+            (["utf-8", "cp1251"], "noir", True),
+            (["latin-1"], "café", False),
+            (["utf-16"], "noir", False),
+            (["utf-32"], "noir", False),
+        ],
+    )
+    def test_index_encoding_matches(
+        self, encodings: list[str], pattern: str, usable: bool
+    ) -> None:
+        """
+        Проверяет, когда индекс в UTF-8 подходит для выбранных кодировок
+        :param encodings: Кодировки файлов
+        :param pattern: Паттерн поиска
+        :param usable: Ожидаемый результат
+        """
+        engine = SearchEngine(re.compile(pattern), encodings=encodings)
+
+        assert Grep()._index_encoding_matches(engine) is usable
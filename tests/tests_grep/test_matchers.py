@@ -0,0 +1,66 @@
+import re
+
+from src.grep.matchers import (
+    AhoCorasickMatcher,
+    LiteralMatcher,
+    RegexMatcher,
+)
+
+
+class TestsMatchers:
+    """Тесты для способов поиска по байтам"""
+
+    def test_regex_matcher(self) -> None:
+        """
+        Проверяет поиск байтового выражения в части буфера
+        """
+        matcher = RegexMatcher(re.compile(rb"[0-9]+"))
+
+        assert matcher.search(b"ab 123 cd 45", 0, 12) == (3, 6)
+        assert matcher.search(b"ab 123 cd 45", 7, 12) == (10, 12)
+        assert matcher.search(b"ab 123 cd 45", 0, 3) is None
+
+    def test_literal_matcher(self) -> None:
+        """
+        Проверяет поиск фиксированной строки
+        """
+        matcher = LiteralMatcher(b"needle")
+
+        assert matcher.search(b"hay needle hay", 0, 14) == (4, 10)
+        assert matcher.search(b"hay needle hay", 5, 14) is None
+
+    def test_aho_corasick_overlapping_patterns(self) -> None:
+        """
+        Проверяет классический пример с пересекающимися строками
+        """
+        matcher = AhoCorasickMatcher([b"he", b"she", b"his", b"hers"], False)
+
+        assert matcher.search(b"ushers", 0, 6) == (1, 4)
+        assert matcher.search(b"ahishe", 0, 6) == (1, 4)
+        assert matcher.search(b"ahxs", 0, 4) is None
+
+    def test_aho_corasick_suffix_match(self) -> None:
+        """
+        Проверяет совпадение по суффиксной ссылке
+        """
+        matcher = AhoCorasickMatcher([b"abcd", b"bc"], False)
+
+        assert matcher.search(b"abcx", 0, 4) == (1, 3)
+
+    def test_aho_corasick_ignore_case(self) -> None:
+        """
+        Проверяет поиск без учёта регистра ASCII
+        """
+        matcher = AhoCorasickMatcher([b"Error"], True)
+
+        assert matcher.search(b"an ERROR here", 0, 13) == (3, 8)
+
+    def test_aho_corasick_many_patterns(self) -> None:
+        """
+        Проверяет поиск среди большого количества строк
+        """
+        literals = [f"ID{number:05d}".encode() for number in range(3000)]
+        matcher = AhoCorasickMatcher(literals, False)
+
+        assert matcher.search(b"x ID02999 y", 0, 11) == (2, 9)
+        assert matcher.search(b"x ID3000 y", 0, 10) is None
@@ -0,0 +1,106 @@
+import os
+from pathlib import Path
+
+from src.grep.result_cache import ResultCache
+
+OLD_TIME_NS = 10**18
+
+
+class TestsResultCache:
+    """Тесты для кэша результатов grep"""
+
+    def test_hits_and_misses(self, make_temp_directory: Path) -> None:
+        """
+        Проверяет счётчики попаданий и промахов
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        cache = ResultCache(str(make_temp_directory / "cache"))
+
+        assert cache.get("key") is None
+        cache.put("key", OLD_TIME_NS, [":1:line"])
+
+        assert cache.get("key") == [":1:line"]
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_recently_modified_file_not_stored(
+        self, make_temp_directory: Path
+    ) -> None:
+        """
+        Проверяет, что результат недавно изменённого файла не сохраняется
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        file = make_temp_directory / "test.txt"
+        file.write_text("line")
+        cache = ResultCache(str(make_temp_directory / "cache"))
+
+        cache.put("key", os.stat(file).st_mtime_ns, [":1:line"])
+
+        assert cache.get("key") is None
+
+    def test_persistence(self, make_temp_directory: Path) -> None:
+        """
+        Проверяет сохранение кэша на диск и загрузку
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        cache_path = str(make_temp_directory / "cache")
+        cache = ResultCache(cache_path)
+        cache.put("key", OLD_TIME_NS, [":2:text"])
+        cache.save()
+
+        loaded = ResultCache(cache_path)
+        loaded.load()
+
+        assert loaded.get("key") == [":2:text"]
+
+    def test_size_bound_evicts_least_recent(
+        self, make_temp_directory: Path
+    ) -> None:
+        """
+        Проверяет вытеснение давно не использованных записей
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        cache_path = make_temp_directory / "cache"
+        cache = ResultCache(str(cache_path), max_bytes=60)
+        cache.put("first", OLD_TIME_NS, ["x" * 10])
+        cache.put("second", OLD_TIME_NS, ["y" * 10])
+        cache.put("third", OLD_TIME_NS, ["z" * 10])
+        cache.get("first")
+        cache.save()
+
+        assert cache_path.stat().st_size <= 80
+        assert cache.get("second") is None
+        assert cache.get("first") == ["x" * 10]
+        assert cache.get("third") == ["z" * 10]
+
+    def test_file_key_changes_with_file(
+        self, make_temp_directory: Path
+    ) -> None:
+        """
+        Проверяет, что ключ меняется при изменении файла
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        file = make_temp_directory / "test.txt"
+        file.write_text("one")
+        search_key = ResultCache.search_key(["one", False])
+
+        before = ResultCache.file_key(search_key, os.stat(file))
+        file.write_text("one two")
+        after = ResultCache.file_key(search_key, os.stat(file))
+
+        assert before != after
+        assert search_key != ResultCache.search_key(["one", True])
+
+    def test_corrupted_cache_is_ignored(
+        self, make_temp_directory: Path
+    ) -> None:
+        """
+        Проверяет, что повреждённый файл кэша не мешает работе
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        cache_path = make_temp_directory / "cache"
+        cache_path.write_text("{broken")
+
+        cache = ResultCache(str(cache_path))
+        cache.load()
+
+        assert cache.get("key") is None
@@ -0,0 +1,177 @@
+import os
+import re
+from pathlib import Path
+
+from src.grep.index import Index
+from src.grep.trigram_index import TrigramIndex
+
+
+class TestsTrigramIndex:
+    """Тесты для триграммного индекса"""
+
+    def _build(self, root: Path) -> TrigramIndex:
+        """
+        Строит индекс для директории
+        :param root: Директория для индексации
+        :return: Построенный индекс
+        """
+        index = TrigramIndex(str(root / "index.json"))
+        entries = Index()._walk_tree(str(root))
+        index.update(str(root), entries, force=True)
+        return index
+
+    def test_required_literals_plain(self) -> None:
+        """
+        Проверяет выделение обязательных подстрок из паттерна
+        """
+        index = TrigramIndex("unused")
+
+        assert index._required_literals("error-42") == ["error-42"]
+        assert index._required_literals(r"foo\d+barbaz") == ["foo", "barbaz"]
+        assert index._required_literals("abcd?ef") == ["abc"]
+        assert index._required_literals("(xyz)?hello") == ["hello"]
+        assert index._required_literals("[^abc]def") == ["def"]
+        assert index._required_literals("ab{2}cdef") == ["cdef"]
+
+    def test_required_literals_groups_and_repeats(self) -> None:
+        """
+        Проверяет, что из незахватывающих и именованных групп
+        и повторений классов не попадают лишние символы
+        """
+        index = TrigramIndex("unused")
+
+        assert index._required_literals("(?:abc)def") == ["abc", "def"]
+        assert index._required_literals("(?P<name>abc)def") == ["abc", "def"]
+        assert index._required_literals("[ab]{0,2}xyz") == ["xyz"]
+        assert index._required_literals("a[bc]{2}de") == []
+        assert index._required_literals("(?=abc)def") is None
+
+    def test_required_literals_escapes(self) -> None:
+        """
+        Проверяет, что аргументы экранированных последовательностей
+        пропускаются целиком и не попадают в подстроки
+        """
+        index = TrigramIndex("unused")
+
+        assert index._required_literals(r"\x41BCD") == ["BCD"]
+        assert index._required_literals(r"\101BCD") == ["BCD"]
+        assert index._required_literals(r"A\u0042CDE") == ["CDE"]
+        assert index._required_literals(r"\U00000041BCD") == ["BCD"]
+        assert index._required_literals(r"\N{DIGIT ONE}BCD") == ["BCD"]
+        assert index._required_literals(r"(ab)\12BCD") == ["BCD"]
+        assert index._required_literals(r"a\.bcd") == ["a.bcd"]
+
+    def test_required_literals_alternation(self) -> None:
+        """
+        Проверяет отказ от триграмм для альтернатив
+        """
+        assert TrigramIndex("unused")._required_literals("foo|bar") is None
+
+    def test_candidates_narrow_files(self, make_temp_directory: Path) -> None:
+        """
+        Проверяет, что индекс отсеивает файлы без нужных триграмм
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        (make_temp_directory / "a.txt").write_text("request 12345 failed")
+        (make_temp_directory / "b.txt").write_text("nothing here")
+        index = self._build(make_temp_directory)
+
+        file_ids = index.candidates(re.compile("12345"))
+        a_id = index.files[str(make_temp_directory / "a.txt")][2]
+
+        assert file_ids == {a_id}
+
+    def test_candidates_any_literal(self, make_temp_directory: Path) -> None:
+        """
+        Проверяет объединение кандидатов для списка фиксированных строк
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        (make_temp_directory / "a.txt").write_text("alpha")
+        (make_temp_directory / "b.txt").write_text("bravo")
+        (make_temp_directory / "c.txt").write_text("charlie")
+        index = self._build(make_temp_directory)
+
+        file_ids = index.candidates_any(["alpha", "bravo"], False)
+
+        assert file_ids is not None
+        assert len(file_ids) == 2
+        assert index.candidates_any(["alpha", "b"], False) is None
+
+    def test_candidates_ignore_case(self, make_temp_directory: Path) -> None:
+        """
+        Проверяет поиск по индексу без учёта регистра
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        (make_temp_directory / "a.txt").write_text("Hello World")
+        index = self._build(make_temp_directory)
+
+        file_ids = index.candidates(re.compile("HELLO", re.IGNORECASE))
+
+        assert file_ids is not None
+        assert len(file_ids) == 1
+
+    def test_candidates_fallback_for_short_pattern(
+        self, make_temp_directory: Path
+    ) -> None:
+        """
+        Проверяет полный перебор для паттернов без триграмм
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        (make_temp_directory / "a.txt").write_text("ab")
+        index = self._build(make_temp_directory)
+
+        assert index.candidates(re.compile("ab")) is None
+        assert index.candidates(re.compile(r"\d+")) is None
+
+    def test_may_match_stale_file(self, make_temp_directory: Path) -> None:
+        """
+        Проверяет, что изменённый после индексации файл просматривается
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        file = make_temp_directory / "a.txt"
+        file.write_text("old content")
+        index = self._build(make_temp_directory)
+
+        file.write_text("new content with needle")
+        file_ids = index.candidates(re.compile("needle"))
+
+        assert file_ids == set()
+        assert index.may_match(str(file), os.stat(file), set())
+
+    def test_update_only_changed_files(
+        self, make_temp_directory: Path
+    ) -> None:
+        """
+        Проверяет, что обновление перечитывает только изменённые файлы
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        (make_temp_directory / "a.txt").write_text("first")
+        second = make_temp_directory / "b.txt"
+        second.write_text("second")
+        index = self._build(make_temp_directory)
+
+        second.write_text("second changed")
+        (make_temp_directory / "a.txt").unlink()
+        entries = Index()._walk_tree(str(make_temp_directory))
+        indexed, removed = index.update(
+            str(make_temp_directory), entries, force=False
+        )
+
+        assert (indexed, removed) == (1, 1)
+        assert index.candidates(re.compile("first")) == set()
+        assert index.candidates(re.compile("changed"))
+
+    def test_save_and_load(self, make_temp_directory: Path) -> None:
+        """
+        Проверяет сохранение индекса на диск и загрузку
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        (make_temp_directory / "a.txt").write_text("persistent")
+        index = self._build(make_temp_directory)
+        index.save()
+
+        loaded = TrigramIndex(index.index_path)
+        loaded.load()
+
+        assert loaded.files == index.files
+        assert loaded.candidates(re.compile("persist"))
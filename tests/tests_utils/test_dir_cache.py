@@ -0,0 +1,172 @@
+import os
+from pathlib import Path
+
+from _pytest.monkeypatch import MonkeyPatch
+
+from src.utils.dir_cache import CachedEntry, DirectoryCache
+
+OLD_TIME_NS = 1_000_000_000_000_000_000
+
+
+def age_directory(path: Path, shift_ns: int = 0) -> None:
+    """
+    Сдвигает время изменения директории в прошлое
+    :param path: Путь к директории
+    :param shift_ns: Смещение времени в наносекундах
+    """
+    stamp = OLD_TIME_NS + shift_ns
+    os.utime(path, ns=(stamp, stamp))
+
+
+class TestsDirectoryCache:
+    """Тесты для кэша директорий"""
+
+    def test_second_scan_is_hit(
+        self, make_temp_structure: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        """
+        Проверяет, что повторное чтение не вызывает os.scandir
+        :param make_temp_structure: Фикстура для временной структуры
+        :param monkeypatch: Фикстура для подмены функций
+        """
+        age_directory(make_temp_structure)
+        cache = DirectoryCache()
+        first = cache.scandir(str(make_temp_structure))
+
+        def fail_scandir(path: str) -> None:
+            raise AssertionError("scandir вызван при попадании")
+
+        monkeypatch.setattr(os, "scandir", fail_scandir)
+        second = cache.scandir(str(make_temp_structure))
+
+        assert sorted(entry.name for entry in first) == sorted(
+            entry.name for entry in second
+        )
+        assert all(isinstance(entry, CachedEntry) for entry in second)
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_cached_entry_types(self, make_temp_directory: Path) -> None:
+        """
+        Проверяет типы записей и ссылок из кэша
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        (make_temp_directory / "dir").mkdir()
+        (make_temp_directory / "file.txt").write_text("text")
+        (make_temp_directory / "link").symlink_to(make_temp_directory / "dir")
+        age_directory(make_temp_directory)
+
+        cache = DirectoryCache()
+        cache.scandir(str(make_temp_directory))
+        entries = {
+            entry.name: entry
+            for entry in cache.scandir(str(make_temp_directory))
+        }
+
+        assert entries["dir"].is_dir()
+        assert entries["file.txt"].is_file()
+        assert entries["file.txt"].stat().st_size == 4
+        assert entries["link"].is_symlink()
+        assert entries["link"].is_dir()
+        assert not entries["link"].is_dir(follow_symlinks=False)
+
+    def test_changed_directory_is_rescanned(
+        self, make_temp_directory: Path
+    ) -> None:
+        """
+        Проверяет, что изменение директории делает запись недействительной
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        directory = make_temp_directory / "data"
+        directory.mkdir()
+        (directory / "a.txt").write_text("a")
+        age_directory(directory)
+        cache = DirectoryCache()
+        cache.scandir(str(directory))
+
+        (directory / "b.txt").write_text("b")
+        age_directory(directory, shift_ns=1)
+        names = {entry.name for entry in cache.scandir(str(directory))}
+
+        assert names == {"a.txt", "b.txt"}
+        assert cache.stats()["misses"] == 2
+
+    def test_recent_directory_is_not_cached(
+        self, make_temp_directory: Path
+    ) -> None:
+        """
+        Проверяет, что только что изменённая директория не кэшируется
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        (make_temp_directory / "a.txt").write_text("a")
+        cache = DirectoryCache()
+        cache.scandir(str(make_temp_directory))
+
+        assert cache.stats()["directories"] == 0
+
+    def test_eviction_by_entry_count(self, make_temp_directory: Path) -> None:
+        """
+        Проверяет вытеснение давно не использованных директорий
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        directories = []
+        for name in ("first", "second", "third"):
+            directory = make_temp_directory / name
+            directory.mkdir()
+            for index in range(2):
+                (directory / f"{index}.txt").write_text("x")
+            age_directory(directory)
+            directories.append(directory)
+
+        cache = DirectoryCache(max_entries=4)
+        for directory in directories:
+            cache.scandir(str(directory))
+
+        stats = cache.stats()
+        assert stats["directories"] == 2
+        assert stats["entries"] == 4
+        assert cache.lookup(str(directories[0] / "0.txt")) == (False, None)
+
+    def test_lookup(self, make_temp_directory: Path) -> None:
+        """
+        Проверяет ответы о путях из кэша родительской директории
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        (make_temp_directory / "file.txt").write_text("text")
+        age_directory(make_temp_directory)
+        cache = DirectoryCache()
+
+        assert cache.lookup(str(make_temp_directory / "file.txt")) == (
+            False,
+            None,
+        )
+
+        cache.scandir(str(make_temp_directory))
+        known, entry = cache.lookup(str(make_temp_directory / "file.txt"))
+
+        assert known
+        assert entry is not None and entry.is_file()
+        assert cache.lookup(str(make_temp_directory / "missing")) == (
+            True,
+            None,
+        )
+
+    def test_clear(self, make_temp_directory: Path) -> None:
+        """
+        Проверяет очистку кэша и счётчиков
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        (make_temp_directory / "file.txt").write_text("text")
+        age_directory(make_temp_directory)
+        cache = DirectoryCache()
+        cache.scandir(str(make_temp_directory))
+
+        cache.clear()
+
+        assert cache.stats() == {
+            "directories": 0,
+            "entries": 0,
+            "max_entries": cache.max_entries,
+            "hits": 0,
+            "misses": 0,
+        }
@@ -188,3 +188,25 @@ class TestsLogger:
 
             call_kwargs = mock_basic_config.call_args[1]
             assert call_kwargs["level"] == logging.INFO
+
+    def test_operation_summary_logs_rate(self) -> None:
+        """
+        Проверяет логирование объёма и скорости операции
+        """
+        with patch("logging.info") as mock_info:
+            Logger.operation_summary("cp", 5_000_000, 2, 2.0)
+
+            mock_info.assert_called_once_with(
+                "METRICS: cp DONE: 5000000 байт, 2 файлов, 2.000 с, 2.50 МБ/с"
+            )
+
+    def test_cache_summary_logs_hits_and_misses(self) -> None:
+        """
+        Проверяет логирование попаданий и промахов кэша
+        """
+        with patch("logging.info") as mock_info:
+            Logger.cache_summary("grep", 3, 1)
+
+            mock_info.assert_called_once_with(
+                "CACHE: grep: попаданий 3, промахов 1"
+            )
@@ -267,6 +267,197 @@ class TestsParser:
         assert result.command == "grep"
         assert result.ri is True
 
+    def test_parse_grep_with_jobs(self) -> None:
+        """
+        Проверяет парсинг grep с флагом -j
+        """
+        parser = Parser()
+        result = parser.parse(["grep", "-r", "-j", "4", "pattern", "dir"])
+
+        assert result is not None
+        assert result.jobs == 4
+
+    def test_parse_grep_with_invalid_jobs_raises_error(self) -> None:
+        """
+        Проверяет ошибку при неположительном количестве потоков
+        :raises ParserError: При неверном значении -j
+        """
+        parser = Parser()
+
+        with pytest.raises(ParserError):
+            parser.parse(["grep", "-j", "0", "pattern", "file.txt"])
+
+    def test_parse_grep_with_patterns_file(self) -> None:
+        """
+        Проверяет парсинг grep с файлом фиксированных строк
+        """
+        parser = Parser()
+        result = parser.parse(["grep", "-f", "patterns.txt", "file.txt"])
+
+        assert result is not None
+        assert result.patterns_file == "patterns.txt"
+        assert result.pattern == ["file.txt"]
+
+    def test_parse_grep_patterns_file_without_paths(self) -> None:
+        """
+        Проверяет парсинг grep с файлом строк без путей для поиска
+        """
+        parser = Parser()
+        result = parser.parse(["grep", "-r", "-f", "patterns.txt"])
+
+        assert result is not None
+        assert result.pattern == []
+        assert result.paths == []
+
+    def test_parse_grep_with_encodings(self) -> None:
+        """
+        Проверяет парсинг списка кодировок grep
+        """
+        parser = Parser()
+        result = parser.parse(
+            ["grep", "--encoding", "utf-8,cp1251", "pattern", "file.txt"]
+        )
+
+        assert result is not None
+        assert result.encodings == ["utf-8", "cp1251"]
+
+    def test_parse_grep_with_unknown_encoding_raises_error(self) -> None:
+        """
+        Проверяет ошибку при неизвестной кодировке
+        :raises ParserError: При неверном значении --encoding
+        """
+        parser = Parser()
+
+        with pytest.raises(ParserError):
+            parser.parse(["grep", "--encoding", "nope-8", "a", "file.txt"])
+
+    def test_parse_grep_output_modes(self) -> None:
+        """
+        Проверяет парсинг флагов -c и -m у grep
+        """
+        parser = Parser()
+        result = parser.parse(["grep", "-c", "-m", "5", "pattern", "f.txt"])
+
+        assert result is not None
+        assert result.count is True
+        assert result.files_with_matches is False
+        assert result.max_count == 5
+
+    def test_parse_grep_conflicting_output_modes_raises_error(self) -> None:
+        """
+        Проверяет ошибку при одновременных флагах -l и -L
+        :raises ParserError: При несовместимых флагах вывода
+        """
+        parser = Parser()
+
+        with pytest.raises(ParserError):
+            parser.parse(["grep", "-l", "-L", "pattern", "file.txt"])
+
+    def test_parse_grep_path_filters(self) -> None:
+        """
+        Проверяет парсинг повторяемых фильтров обхода grep
+        """
+        parser = Parser()
+        result = parser.parse(
+            [
+                "grep",
+                "-r",
+                "--include",
+                "*.py",
+                "--include",
+                "*.md",
+                "--exclude-dir",
+                ".git",
+                "--ignore-file",
+                ".gitignore",
+                "pattern",
+            ]
+        )
+
+        assert result is not None
+        assert result.include == ["*.py", "*.md"]
+        assert result.exclude is None
+        assert result.exclude_dir == [".git"]
+        assert result.ignore_files == [".gitignore"]
+
+    def test_parse_grep_search_archives(self) -> None:
+        """
+        Проверяет парсинг флага -z у grep
+        """
+        parser = Parser()
+        result = parser.parse(["grep", "-r", "-z", "pattern", "releases"])
+
+        assert result is not None
+        assert result.archives is True
+        assert result.cache is False
+
+    def test_parse_grep_context(self) -> None:
+        """
+        Проверяет парсинг флагов контекста grep
+        """
+        parser = Parser()
+        result = parser.parse(["grep", "-A", "2", "-C", "0", "error", "f"])
+
+        assert result is not None
+        assert result.after_context == 2
+        assert result.before_context is None
+        assert result.context == 0
+
+    def test_parse_grep_negative_context_raises_error(self) -> None:
+        """
+        Проверяет ошибку при отрицательном количестве строк контекста
+        :raises ParserError: При неверном значении -B
+        """
+        parser = Parser()
+
+        with pytest.raises(ParserError):
+            parser.parse(["grep", "-B", "-1", "error", "file.txt"])
+
+    def test_parse_ls_recursive(self) -> None:
+        """
+        Проверяет парсинг рекурсивного ls с количеством потоков
+        """
+        parser = Parser()
+        result = parser.parse(["ls", "-R", "-j", "8", "directory"])
+
+        assert result is not None
+        assert result.recursive is True
+        assert result.jobs == 8
+
+    def test_parse_ls_sort_with_head(self) -> None:
+        """
+        Проверяет парсинг сортировки ls с ограничением вывода
+        """
+        parser = Parser()
+        result = parser.parse(["ls", "-S", "--head", "10"])
+
+        assert result is not None
+        assert result.sort_size is True
+        assert result.unsorted is False
+        assert result.head == 10
+
+    def test_parse_ls_conflicting_order_raises_error(self) -> None:
+        """
+        Проверяет ошибку при одновременных флагах -U и -t
+        :raises ParserError: При несовместимых флагах порядка
+        """
+        parser = Parser()
+
+        with pytest.raises(ParserError):
+            parser.parse(["ls", "-U", "-t"])
+
+    def test_parse_index_command(self) -> None:
+        """
+        Проверяет парсинг команды index
+        """
+        parser = Parser()
+        result = parser.parse(["index", "build", "directory"])
+
+        assert result is not None
+        assert result.command == "index"
+        assert result.action == "build"
+        assert result.paths == ["directory"]
+
     def test_parse_mkdir_command(self) -> None:
         """
         Проверяет парсинг команды mkdir
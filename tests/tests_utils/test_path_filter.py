@@ -0,0 +1,87 @@
+from pathlib import Path
+
+import pytest
+
+from src.utils.errors import InvalidFileError
+from src.utils.path_filter import IgnoreRule, PathFilter
+
+
+class TestsPathFilter:
+    """Тесты для фильтра путей"""
+
+    def test_include_and_exclude(self) -> None:
+        """
+        Проверяет шаблоны имён файлов
+        """
+        path_filter = PathFilter(include=["*.py", "*.md"], exclude=["test_*"])
+
+        assert path_filter.accepts_file("main.py", "src/main.py")
+        assert path_filter.accepts_file("README.md", "README.md")
+        assert not path_filter.accepts_file("notes.txt", "notes.txt")
+        assert not path_filter.accepts_file("test_main.py", "test_main.py")
+
+    def test_exclude_dir(self) -> None:
+        """
+        Проверяет шаблоны имён директорий
+        """
+        path_filter = PathFilter(exclude_dir=[".git", "node_*"])
+
+        assert not path_filter.accepts_directory(".git", ".git")
+        assert not path_filter.accepts_directory("node_modules", "a/node_x")
+        assert path_filter.accepts_directory("src", "src")
+
+    def test_ignore_rule_unanchored(self) -> None:
+        """
+        Проверяет правило без косой черты на любой глубине
+        """
+        rule = IgnoreRule("*.log")
+
+        assert rule.matches("app.log", False)
+        assert rule.matches("logs/deep/app.log", False)
+        assert not rule.matches("app.log.txt", False)
+
+    def test_ignore_rule_anchored_and_directory_only(self) -> None:
+        """
+        Проверяет правила, привязанные к корню и к директориям
+        """
+        anchored = IgnoreRule("/build")
+        directory = IgnoreRule("cache/")
+
+        assert anchored.matches("build", True)
+        assert not anchored.matches("src/build", True)
+        assert directory.matches("src/cache", True)
+        assert not directory.matches("src/cache", False)
+
+    def test_ignore_rule_double_star(self) -> None:
+        """
+        Проверяет двойную звёздочку в правиле
+        """
+        rule = IgnoreRule("docs/**/*.tmp")
+
+        assert rule.matches("docs/a.tmp", False)
+        assert rule.matches("docs/x/y/a.tmp", False)
+        assert not rule.matches("src/docs/a.tmp", False)
+
+    def test_ignore_file_negation(self, make_temp_directory: Path) -> None:
+        """
+        Проверяет отмену игнорирования последним правилом
+        :param make_temp_directory: Фикстура для временных директорий
+        """
+        ignore_file = make_temp_directory / ".gitignore"
+        ignore_file.write_text("# comment\n\n*.log\n!keep.log\n")
+
+        path_filter = PathFilter(ignore_files=[str(ignore_file)])
+
+        assert not path_filter.accepts_file("app.log", "app.log")
+        assert path_filter.accepts_file("keep.log", "keep.log")
+
+    def test_missing_ignore_file_raises_error(
+        self, make_temp_directory: Path
+    ) -> None:
+        """
+        Проверяет ошибку при отсутствии файла игнорирования
+        :param make_temp_directory: Фикстура для временных директорий
+        :raises InvalidFileError: Если файл невозможно прочитать
+        """
+        with pytest.raises(InvalidFileError):
+            PathFilter(ignore_files=[str(make_temp_directory / "missing")])
@@ -0,0 +1,152 @@
+import io
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.progress import Progress, tree_totals
+
+
+class TerminalStream(io.StringIO):
+    """Поток, который выдаёт себя за терминал"""
+
+    def isatty(self) -> bool:
+        """
+        :return: Всегда True
+        """
+        return True
+
+
+class TestsProgress:
+    """Тесты для счётчика прогресса"""
+
+    def test_progress_counts_bytes_and_files(self) -> None:
+        """
+        Проверяет подсчёт байт и файлов
+        """
+        progress = Progress("cp", stream=io.StringIO())
+
+        progress.advance(100, 1)
+        progress.advance(50)
+        progress.advance(files=2)
+
+        assert progress.bytes == 150
+        assert progress.files == 3
+
+    def test_progress_silent_without_terminal(self) -> None:
+        """
+        Проверяет, что строка состояния не выводится не в терминал
+        """
+        stream = io.StringIO()
+        progress = Progress("cp", stream=stream, interval=0)
+
+        with patch("src.utils.logger.logging.info"):
+            with progress:
+                progress.advance(100, 1)
+
+        assert stream.getvalue() == ""
+
+    def test_progress_status_line(self) -> None:
+        """
+        Проверяет строку состояния с оставшимся временем
+        и её стирание по завершении
+        """
+        stream = TerminalStream()
+        progress = Progress(
+            "cp", total_bytes=4_000_000, stream=stream, interval=0
+        )
+
+        with patch("src.utils.logger.logging.info"):
+            with progress:
+                progress.advance(1_000_000, 1)
+                status = stream.getvalue()
+
+        assert status.startswith("\rcp: файлов 1, 1.0 МБ, ")
+        assert "МБ/с, осталось ~" in status
+        assert stream.getvalue().endswith("\r")
+
+    def test_progress_status_rate_limited(self) -> None:
+        """
+        Проверяет, что строка состояния обновляется не чаще интервала
+        """
+        stream = TerminalStream()
+        progress = Progress("cp", stream=stream, interval=3600)
+
+        progress.advance(100, 1)
+        progress.advance(100, 1)
+
+        assert stream.getvalue() == ""
+
+    def test_progress_logs_summary(self) -> None:
+        """
+        Проверяет запись итога в лог
+        """
+        with patch("src.utils.logger.logging.info") as mock_info:
+            with Progress("zip", stream=io.StringIO()) as progress:
+                progress.advance(2_000_000, 4)
+
+        message = mock_info.call_args[0][0]
+        assert message.startswith("METRICS: zip DONE: 2000000 байт, 4 файлов")
+        assert message.endswith("МБ/с")
+
+    def test_progress_logs_failure(self) -> None:
+        """
+        Проверяет, что итог записывается и при ошибке
+        :raises OSError: Из тела операции
+        """
+        with patch("src.utils.logger.logging.info") as mock_info:
+            with pytest.raises(OSError):
+                with Progress("tar", stream=io.StringIO()):
+                    raise OSError("disk full")
+
+        assert "METRICS: tar FAILED" in mock_info.call_args[0][0]
+
+    def test_tree_totals(self, make_temp_structure: Path) -> None:
+        """
+        Проверяет подсчёт размера и количества файлов дерева
+        :param make_temp_structure: Фикстура с тестовой структурой
+        """
+        assert tree_totals(str(make_temp_structure)) == (24, 3)
+
+    def test_tree_totals_stops(self, make_temp_structure: Path) -> None:
+        """
+        Проверяет, что подсчёт прекращается по событию
+        :param make_temp_structure: Фикстура с тестовой структурой
+        """
+        stop = threading.Event()
+        stop.set()
+
+        assert tree_totals(str(make_temp_structure), stop) == (0, 0)
+
+    def test_estimate_tree_skipped_without_terminal(
+        self, make_temp_structure: Path
+    ) -> None:
+        """
+        Проверяет, что без строки состояния дерево не обходится
+        :param make_temp_structure: Фикстура с тестовой структурой
+        """
+        progress = Progress("zip", stream=io.StringIO())
+
+        with patch("src.utils.progress.os.walk") as mock_walk:
+            progress.estimate_tree(str(make_temp_structure))
+
+        mock_walk.assert_not_called()
+        assert progress.total_bytes is None
+
+    def test_estimate_tree_in_background(
+        self, make_temp_structure: Path
+    ) -> None:
+        """
+        Проверяет, что в терминале объём дерева считается в фоне
+        :param make_temp_structure: Фикстура с тестовой структурой
+        """
+        progress = Progress("zip", stream=TerminalStream())
+
+        with patch("src.utils.progress.threading.Thread") as mock_thread:
+            progress.estimate_tree(str(make_temp_structure))
+        target = mock_thread.call_args.kwargs["target"]
+        target(*mock_thread.call_args.kwargs["args"])
+
+        mock_thread.return_value.start.assert_called_once_with()
+        assert (progress.total_bytes, progress.total_files) == (24, 3)
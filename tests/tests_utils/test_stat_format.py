@@ -0,0 +1,56 @@
+import stat
+from datetime import datetime
+
+from src.utils.stat_format import StatFormatter
+
+
+class TestsStatFormatter:
+    """Тесты для форматирования полей stat"""
+
+    def test_format_time_matches_strftime(self) -> None:
+        """
+        Проверяет совпадение с прямым форматированием времени
+        """
+        formatter = StatFormatter()
+        seconds = 1_700_000_123
+
+        expected = datetime.fromtimestamp(seconds).strftime("%Y-%m-%d %H:%M")
+
+        assert formatter.format_time(seconds * 1_000_000_000) == expected
+
+    def test_format_time_cached_per_minute(self) -> None:
+        """
+        Проверяет, что моменты одной минуты используют одну строку
+        """
+        formatter = StatFormatter()
+        minute_start = 1_700_000_040 * 1_000_000_000
+
+        first = formatter.format_time(minute_start)
+        second = formatter.format_time(minute_start + 59_999_999_999)
+        next_minute = formatter.format_time(minute_start + 60_000_000_000)
+
+        assert first is second
+        assert first != next_minute
+        assert len(formatter._minutes) == 2
+
+    def test_format_mode(self) -> None:
+        """
+        Проверяет строки прав доступа и их кэш
+        """
+        formatter = StatFormatter()
+        mode = stat.S_IFREG | 0o644
+
+        assert formatter.format_mode(mode) == "-rw-r--r--"
+        assert formatter.format_mode(stat.S_IFDIR | 0o755) == "drwxr-xr-x"
+        assert formatter.format_mode(mode) is formatter.format_mode(mode)
+
+    def test_cache_is_bounded(self) -> None:
+        """
+        Проверяет очистку кэша при переполнении
+        """
+        formatter = StatFormatter(max_cached=2)
+
+        for minute in range(5):
+            formatter.format_time(minute * 60_000_000_000)
+
+        assert len(formatter._minutes) <= 2